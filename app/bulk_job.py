@@ -0,0 +1,198 @@
+"""This module provides a bulk job runner that evaluates the operation rows of a CSV file in chunks"""
+import logging as log
+import sys
+import time
+
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from app.calculator_config import CalculatorConfig
+from app.decimal_math import working_precision
+from app.exceptions import SerializationError, ValidationError
+from app.input_validators import InputValidator
+from app.lazy_import import lazy_import
+from app.operations import OperationFactory
+
+pd = lazy_import('pandas')
+
+INPUT_COLUMNS = ('operation', 'operandx', 'operandy')
+
+@dataclass
+class BulkJobReport:
+    """
+    Progress of a bulk job
+
+    Attributes
+    ----------
+    rows: int
+        Number of rows evaluated so far
+    failures: int
+        Number of rows whose evaluation failed
+    seconds: float
+        Time elapsed since the job started
+    """
+    rows: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Get the evaluation rate
+
+        Returns
+        -------
+        float
+            Rows evaluated per second, or 0 before any time has elapsed
+        """
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Summarizes the job's progress for display"""
+        return f"{self.rows} rows, {self.failures} failed, {self.seconds:.1f} s, {self.throughput:.0f} rows/s"
+
+def run_bulk_job(
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        config: Optional[CalculatorConfig] = None,
+        progress: Optional[Callable[[BulkJobReport], None]] = None
+) -> BulkJobReport:
+    """
+    Evaluates the operation in each row of a CSV file, writing the results to another CSV file
+
+    The input needs 'operation', 'operandx' and 'operandy' columns, and operation
+    may be any name or alias registered to the OperationFactory. Rows are read,
+    evaluated and written config.bulk_chunk_size at a time, so memory use does not
+    grow with the file. Evaluation follows config.numeric_backend and config.precision
+    but is not recorded in a Calculator's history.
+
+    The output repeats the input columns, adding 'result' and 'error'. A row that
+    fails to evaluate has an empty result and its error message, and the job continues.
+
+    Parameters
+    ----------
+    input_path: Union[str, Path]
+        The CSV file to evaluate
+    output_path: Union[str, Path]
+        The CSV file to write. Replaced if it exists
+    config: Optional[CalculatorConfig], optional
+        Configuration settings for the job. Loaded from .env if not passed
+    progress: Optional[Callable[[BulkJobReport], None]], optional
+        Called after each chunk is written, with the progress so far
+
+    Raises
+    ------
+    SerializationError
+        If the input file lacks a required column
+    OSError
+        If either file cannot be opened
+
+    Returns
+    -------
+    BulkJobReport
+        The totals for the job
+    """
+    config = config if config is not None else CalculatorConfig()
+    config.validate()
+    report = BulkJobReport()
+    started = time.perf_counter()
+    executors: Dict[str, Callable[[Any, Any], Union[Decimal, float]]] = {}
+    encoding = config.default_encoding
+
+    with pd.read_csv(input_path, dtype=str, keep_default_na=False,
+            chunksize=config.bulk_chunk_size, encoding=encoding) as reader, \
+        open(output_path, 'w', newline='', encoding=encoding) as output:
+        header = True
+        for chunk in reader:
+            missing = [column for column in INPUT_COLUMNS if column not in chunk]
+            if missing:
+                raise SerializationError(f"Bulk job input is missing columns: {', '.join(missing)}")
+            results, errors = _evaluate_chunk(chunk, config, executors)
+            chunk['result'] = results
+            chunk['error'] = errors
+            chunk.to_csv(output, header=header, index=False)
+            header = False
+
+            report.rows += len(results)
+            report.failures += sum(1 for error in errors if error)
+            report.seconds = time.perf_counter() - started
+            log.info(f"Bulk job progress: {report}")
+            if progress is not None:
+                progress(report)
+
+    report.seconds = time.perf_counter() - started
+    log.info(f"Bulk job completed: {report}")
+    return report
+
+def _evaluate_chunk(
+        chunk: 'pd.DataFrame',
+        config: CalculatorConfig,
+        executors: Dict[str, Callable[[Any, Any], Union[Decimal, float]]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Evaluates the operation rows of one chunk
+
+    Parameters
+    ----------
+    chunk: pd.DataFrame
+        The rows to evaluate, with string columns
+    config: CalculatorConfig
+        Configuration settings for the job
+    executors: Dict[str, Callable[[Any, Any], Union[Decimal, float]]]
+        Executors resolved by earlier chunks, keyed by the operation names in the file
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        The result text and the error text of each row, in row order
+    """
+    is_float = config.numeric_backend == 'float'
+    validate = InputValidator.validate_float if is_float else InputValidator.validate_number
+    results: List[str] = []
+    errors: List[str] = []
+    with working_precision(config.precision):
+        for name, x, y in zip(chunk['operation'].tolist(), chunk['operandx'].tolist(), chunk['operandy'].tolist()):
+            try:
+                execute = executors.get(name)
+                if execute is None:
+                    if is_float:
+                        execute = OperationFactory.create_operation(name).execute_float
+                    else:
+                        execute = OperationFactory.get_executor(name)
+                    executors[name] = execute
+                results.append(str(execute(validate(x, config), validate(y, config))))
+                errors.append('')
+            except (ValidationError, ValueError, ArithmeticError) as e:
+                results.append('')
+                errors.append(str(e))
+    return results, errors
+
+def bulk_job_command(input_path: str, output_path: str) -> int:
+    """
+    Runs a bulk job from the command line, reporting progress on standard error
+
+    Parameters
+    ----------
+    input_path: str
+        The CSV file to evaluate
+    output_path: str
+        The CSV file to write
+
+    Returns
+    -------
+    int
+        The exit status: 0 on success, or 1 if any row failed or the job could not run
+    """
+    def show(report: BulkJobReport) -> None:
+        print(f"\rProcessed {report}", end='', file=sys.stderr, flush=True)
+
+    try:
+        report = run_bulk_job(input_path, output_path, progress=show)
+    except Exception as e:
+        print(f"Error: Bulk job failed: {e}", file=sys.stderr)
+        log.error(f"Bulk job failed: {e}")
+        return 1
+    print(f"\rCompleted {report}", file=sys.stderr)
+    return 1 if report.failures else 0
@@ -9,24 +9,63 @@ import logging as log
 
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
-from typing import Any, ClassVar, Dict
+from itertools import repeat
+from typing import Any, Callable, ClassVar, Dict, List, Sequence, Union
 
+from app.decimal_math import round_to, working_precision
 from app.exceptions import SerializationError, ValidationError
-from app.operations import OperationFactory
+from app.operations import Operation, OperationFactory
+
+NUMERIC_BACKENDS = ('decimal', 'float')
 
 @dataclass
 class Calculation:
-    """Record Object detailing the execution of an Operation"""
+    """
+    Record Object detailing the execution of an Operation
+
+    backend names the numeric backend that produced the record: 'decimal' records
+    hold Decimal operands and result, and 'float' records hold floats
+    """
     _default_precision: ClassVar[int] = 10
+    _parsers: ClassVar[Dict[str, Callable[[Any], Union[Decimal, float]]]] = {
+        'decimal': Decimal,
+        'float': float,
+    }
 
     # Dataclass will construct __init__ with these arguments
     operation: str
-    operandx: Decimal
-    operandy: Decimal
-    result: Decimal
+    operandx: Union[Decimal, float]
+    operandy: Union[Decimal, float]
+    result: Union[Decimal, float]
     
     precision: int = field(default=_default_precision)
     timestamp: dt.datetime = field(default_factory=dt.datetime.now)
+    backend: str = field(default='decimal')
+
+    @staticmethod
+    def parser(backend: str) -> Callable[[Any], Union[Decimal, float]]:
+        """
+        Get the value constructor for a numeric backend
+
+        Parameters
+        ----------
+        backend: str
+            One of NUMERIC_BACKENDS
+
+        Raises
+        ------
+        SerializationError
+            If the backend tag is not recognized
+
+        Returns
+        -------
+        Callable[[Any], Union[Decimal, float]]
+            Decimal or float
+        """
+        try:
+            return Calculation._parsers[backend]
+        except KeyError:
+            raise SerializationError(f"Data record contains an invalid backend tag: {backend}")
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Calculation':
@@ -51,12 +90,15 @@ class Calculation:
             A Calculation instance based on the input record
         """
         try:
+            backend = data.get('backend', 'decimal')
+            parse = Calculation.parser(backend)
             calc = Calculation(
                 operation = data['operation'],
-                operandx = Decimal(data['operandx']),
-                operandy = Decimal(data['operandy']),
-                result = Decimal(data['result']),
+                operandx = parse(data['operandx']),
+                operandy = parse(data['operandy']),
+                result = parse(data['result']),
                 precision = data['precision'],
+                backend = backend,
             )
 
             calc.timestamp = dt.datetime.fromisoformat(data['timestamp'])
@@ -64,8 +106,100 @@ class Calculation:
             return calc
         except InvalidOperation:
             raise SerializationError("Error in field deserialization: Invalid data passed to Decimal()")
-        except (AttributeError, KeyError) as e:
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise SerializationError(f"Error in field deserialization: {str(e)}")
+
+    @staticmethod
+    def from_columns(columns: Dict[str, Sequence[Any]], verify: bool = True) -> List['Calculation']:
+        """
+        Deserializes a list of Calculations from column form.
+
+        Converts each column in a single pass rather than building per-record
+        dictionaries. Operand and result columns should hold exact string or Decimal
+        values, and the timestamp column ISO-format strings or datetimes. The
+        optional backend column defaults every row to 'decimal'.
+        Includes field verification, and validation unless verify is disabled.
+
+        Parameters
+        ----------
+        columns: Dict[str, Sequence[Any]]
+            Equal-length columns keyed by Calculation field name
+        verify: bool, optional
+            Recomputes each record through validate_fields. Disable only for data
+            whose integrity has been established otherwise
+
+        Raises
+        ------
+        SerializationError
+            If columns are missing or contain invalid values
+
+        Returns
+        -------
+        List[Calculation]
+            Calculation instances based on the input rows, in row order
+        """
+        try:
+            timestamps = columns['timestamp']
+            backends = columns.get('backend')
+            if backends is None or set(backends) <= {'decimal'}:
+                backends = repeat('decimal', len(timestamps))
+                values = [map(Decimal, columns[name]) for name in ('operandx', 'operandy', 'result')]
+            else:
+                backends = list(backends)
+                parsers = list(map(Calculation.parser, backends))
+                values = [
+                    map(lambda parse, value: parse(value), parsers, columns[name])
+                    for name in ('operandx', 'operandy', 'result')
+                ]
+            if len(timestamps) and isinstance(timestamps[0], str):
+                timestamps = map(dt.datetime.fromisoformat, timestamps)
+            calcs = [
+                Calculation(operation, operandx, operandy, result, precision, timestamp, backend)
+                for operation, operandx, operandy, result, precision, timestamp, backend in zip(
+                    columns['operation'],
+                    *values,
+                    map(int, columns['precision']),
+                    timestamps,
+                    backends,
+                    strict=True,
+                )
+            ]
+        except InvalidOperation:
+            raise SerializationError("Error in field deserialization: Invalid data passed to Decimal()")
+        except (KeyError, TypeError, ValueError) as e:
             raise SerializationError(f"Error in field deserialization: {str(e)}")
+        if verify:
+            Calculation.validate_many(calcs)
+        return calcs
+
+    @staticmethod
+    def validate_many(calcs: Sequence['Calculation']) -> None:
+        """
+        Validates a sequence of Calculations as validate_fields does, in bulk
+
+        Each distinct operation is created, and each distinct precision's quantizer
+        built, once for the whole sequence rather than once per record
+
+        Parameters
+        ----------
+        calcs: Sequence[Calculation]
+            The Calculations to validate
+
+        Raises
+        ------
+        SerializationError
+            If any Calculation's fields produce an invalid Operation
+        """
+        operations: Dict[str, Operation] = {}
+        quantizers: Dict[int, Decimal] = {}
+        for calc in calcs:
+            operation = operations.get(calc.operation)
+            if operation is None:
+                operation = operations[calc.operation] = calc._create_operation()
+            quantizer = quantizers.get(calc.precision)
+            if quantizer is None:
+                quantizer = quantizers[calc.precision] = Decimal('0.' + '0' * int(calc.precision))
+            calc._check_result(operation, quantizer)
 
     def validate_fields(self) -> None:
         """
@@ -78,12 +212,51 @@ class Calculation:
         SerializationError
             If this Calculation's fields produce an invalid Operation
         """
+        self._check_result(self._create_operation(), Decimal('0.' + '0' * int(self.precision)))
+
+    def _create_operation(self) -> Operation:
+        """
+        Creates the Operation named by this Calculation
+
+        Raises
+        ------
+        SerializationError
+            If the operation tag is not registered
+
+        Returns
+        -------
+        Operation
+            The Operation to recompute this Calculation with
+        """
         try:
-            mock_op = OperationFactory.create_operation(self.operation)
-            mock_result = mock_op.execute(self.operandx, self.operandy)\
-                .quantize(Decimal('0.' + '0' * int(self.precision))).normalize()
+            return OperationFactory.create_operation(self.operation)
         except ValueError:
             raise SerializationError("Data record contains an invalid operation tag")
+
+    def _check_result(self, operation: Operation, quantizer: Decimal) -> None:
+        """
+        Recomputes the result and logs a mismatch with the stored one
+
+        Float records are recomputed with execute_float and compared exactly, without quantization
+
+        Parameters
+        ----------
+        operation: Operation
+            The Operation named by this Calculation
+        quantizer: Decimal
+            The exponent matching this Calculation's precision
+
+        Raises
+        ------
+        SerializationError
+            If the operands are invalid for the Operation
+        """
+        try:
+            if self.backend == 'float':
+                mock_result = operation.execute_float(self.operandx, self.operandy)
+            else:
+                with working_precision(self.precision):
+                    mock_result = round_to(operation.execute(self.operandx, self.operandy), quantizer)
         except ValidationError as e:
             raise SerializationError(f"Data record contains invalid operands: {str(e)}")
         if mock_result != self.result:
@@ -107,7 +280,8 @@ class Calculation:
                 'operandy': self.operandy,
                 'result': self.result,
                 'precision': self.precision,
-                'timestamp': self.timestamp.isoformat()
+                'timestamp': self.timestamp.isoformat(),
+                'backend': self.backend,
         }
 
     def __str__(self) -> str:
@@ -136,7 +310,8 @@ class Calculation:
             f"operandy = {self.operandy}, "
             f"result = {self.result}, "
             f"precision = {self.precision}, "
-            f"timestamp = '{self.timestamp.isoformat()}')"
+            f"timestamp = '{self.timestamp.isoformat()}', "
+            f"backend = '{self.backend}')"
         )
 
     def __eq__(self, other: object) -> bool:
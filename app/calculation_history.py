@@ -0,0 +1,268 @@
+"""This module provides a ring-buffer container for the Calculator's Calculation history"""
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Optional, Union
+
+from app.calculation import Calculation
+
+class CalculationHistory(Sequence):
+    """
+    Ring buffer of Calculation records with constant-time operations at both ends.
+
+    Entries live in a circular slot list addressed from a moving head index, so
+    appending, evicting from the front and restoring evicted entries never shift the
+    remaining records. Capacity grows geometrically on demand and is retained once
+    reached, so a history held at its configured maximum size performs no allocation.
+    """
+
+    _min_capacity = 8
+
+    def __init__(self, calcs: Optional[Iterable[Calculation]] = None) -> None:
+        """
+        Initializes the container
+
+        Parameters
+        ----------
+        calcs: Optional[Iterable[Calculation]], optional
+            Initial records, oldest first
+        """
+        self._slots: List[Optional[Calculation]] = []
+        self._head = 0
+        self._size = 0
+        if calcs is not None:
+            self.extend(calcs)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of records the container holds before reallocating
+
+        Returns
+        -------
+        int
+            The current slot count
+        """
+        return len(self._slots)
+
+    def _reserve(self, size: int) -> None:
+        """
+        Ensures capacity for at least size records, compacting slots to head 0 on growth
+
+        Parameters
+        ----------
+        size: int
+            The required number of records
+        """
+        if size <= len(self._slots):
+            return
+        new_capacity = max(size, 2 * len(self._slots), self._min_capacity)
+        ordered = self._ordered()
+        self._slots = ordered + [None] * (new_capacity - len(ordered))
+        self._head = 0
+
+    def _ordered(self) -> List[Calculation]:
+        """
+        Copies the stored records into a list, oldest first
+
+        Returns
+        -------
+        List[Calculation]
+            The stored records
+        """
+        end = self._head + self._size
+        if end <= len(self._slots):
+            return self._slots[self._head:end]
+        return self._slots[self._head:] + self._slots[:end - len(self._slots)]
+
+    def append(self, calc: Calculation) -> None:
+        """
+        Adds a record at the newest end
+
+        Parameters
+        ----------
+        calc: Calculation
+            The record to add
+        """
+        self._reserve(self._size + 1)
+        self._slots[(self._head + self._size) % len(self._slots)] = calc
+        self._size += 1
+
+    def extend(self, calcs: Iterable[Calculation]) -> None:
+        """
+        Adds records at the newest end, preserving their order
+
+        Parameters
+        ----------
+        calcs: Iterable[Calculation]
+            The records to add, oldest first
+        """
+        calcs = list(calcs)
+        self._reserve(self._size + len(calcs))
+        capacity = len(self._slots)
+        for calc in calcs:
+            self._slots[(self._head + self._size) % capacity] = calc
+            self._size += 1
+
+    def prepend(self, calcs: Iterable[Calculation]) -> None:
+        """
+        Adds records at the oldest end, preserving their order
+
+        Parameters
+        ----------
+        calcs: Iterable[Calculation]
+            The records to add, oldest first
+        """
+        calcs = list(calcs)
+        self._reserve(self._size + len(calcs))
+        capacity = len(self._slots)
+        for calc in reversed(calcs):
+            self._head = (self._head - 1) % capacity
+            self._slots[self._head] = calc
+            self._size += 1
+
+    def drop_left(self, count: int) -> List[Calculation]:
+        """
+        Removes up to count records from the oldest end
+
+        Parameters
+        ----------
+        count: int
+            The number of records to remove
+
+        Returns
+        -------
+        List[Calculation]
+            The removed records, oldest first
+        """
+        count = max(0, min(count, self._size))
+        capacity = len(self._slots)
+        dropped = []
+        for _ in range(count):
+            dropped.append(self._slots[self._head])
+            self._slots[self._head] = None
+            self._head = (self._head + 1) % capacity
+            self._size -= 1
+        return dropped
+
+    def drop_right(self, count: int) -> List[Calculation]:
+        """
+        Removes up to count records from the newest end
+
+        Parameters
+        ----------
+        count: int
+            The number of records to remove
+
+        Returns
+        -------
+        List[Calculation]
+            The removed records, oldest first
+        """
+        count = max(0, min(count, self._size))
+        capacity = len(self._slots)
+        dropped = []
+        for _ in range(count):
+            self._size -= 1
+            index = (self._head + self._size) % capacity
+            dropped.append(self._slots[index])
+            self._slots[index] = None
+        dropped.reverse()
+        return dropped
+
+    def clear(self) -> None:
+        """Removes all records and releases their slots"""
+        self._slots = []
+        self._head = 0
+        self._size = 0
+
+    def copy(self) -> List[Calculation]:
+        """
+        Copies the stored records into a list
+
+        Returns
+        -------
+        List[Calculation]
+            The stored records, oldest first
+        """
+        return self._ordered()
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored records
+
+        Returns
+        -------
+        int
+            The record count
+        """
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Calculation, List[Calculation]]:
+        """
+        Retrieves a record by position, or a list of records by slice
+
+        Parameters
+        ----------
+        index: Union[int, slice]
+            A position counted from the oldest record, or a slice of positions
+
+        Raises
+        ------
+        IndexError
+            If an integer index is out of range
+
+        Returns
+        -------
+        Union[Calculation, List[Calculation]]
+            The record at index, or the records selected by the slice
+        """
+        capacity = len(self._slots)
+        if isinstance(index, slice):
+            return [
+                self._slots[(self._head + i) % capacity]
+                for i in range(*index.indices(self._size))
+            ]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("CalculationHistory index out of range")
+        return self._slots[(self._head + index) % capacity]
+
+    def __iter__(self) -> Iterator[Calculation]:
+        """
+        Iterates over a snapshot of the stored records, oldest first
+
+        Returns
+        -------
+        Iterator[Calculation]
+            An iterator over the stored records
+        """
+        return iter(self._ordered())
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares stored records against another history or a list or tuple of records
+
+        Parameters
+        ----------
+        other: object
+            An object to compare against this history
+
+        Returns
+        -------
+        bool
+            True if other holds equal records in the same order. False otherwise.
+        """
+        if not isinstance(other, (CalculationHistory, list, tuple)):
+            return False
+        return len(self) == len(other) and self._ordered() == list(other)
+
+    def __repr__(self) -> str:
+        """
+        Generate a string representation of this history
+
+        Returns
+        -------
+        str
+            The stored records in list format
+        """
+        return f"CalculationHistory({self._ordered()!r})"
@@ -1,72 +1,197 @@
 """This module organizes and delivers the project's major features to an implementing interface"""
 
+import datetime as dt
+import hashlib
 import logging as log
 import os
-import pandas as pd
+import threading
+import time
 
+from collections import deque
+from contextlib import nullcontext
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
 from app.calculator_config import CalculatorConfig
 from app.calculator_memento import CalculatorMemento
-from app.exceptions import OperationError, ValidationError
+from app.decimal_math import working_precision
+from app.exceptions import BatchValidationError, OperationError, ValidationError
 from app.history import HistoryObserver
+from app.expression import compile_expression
+from app.history_journal import HistoryJournal
+from app.history_store import (
+    HISTORY_STORES, HistoryStore, RandomAccessHistoryStore, SQLiteHistoryStore, create_history_store)
 from app.input_validators import InputValidator
-from app.operations import Operation
+from app.lazy_import import lazy_import
+from app.logging_pipeline import LoggingPipeline, build_file_handler
+from app.observer_bus import QueuedObserver
+from app.operations import Operation, OperationFactory
+from app.parallel_executor import ParallelExecutor
+from app.result_cache import ResultCache
+
+# Imported on first use: only get_history_dataframe needs pandas
+pd = lazy_import('pandas')
 
 # Aliases
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
 class Calculator:
-    """Central business layer class for delivering features"""
+    """
+    Central business layer class for delivering features
+
+    A Calculator can be shared between threads. History and the undo and redo
+    stacks are guarded by a lock that is held only while they change or are copied,
+    and observers are notified outside it, in the order the changes were made.
+    perform() executes a named Operation without the shared operation_strategy
+    """
     def __init__(self, config: Optional[CalculatorConfig] = None) -> None:
         """
         Initializes and configures the calculator
 
+        The saved history is not read here, but on first access to history. The
+        duration of each startup phase is kept in startup_timings
+
         Parameters
         ----------
         config: Optional[CalculatorConfig], optional
             Configuration settings for the application. Loaded from .env if not paased
         """
+        clock = time.perf_counter()
+        self.startup_timings: Dict[str, float] = {}
 
         self.config = config if config is not None else CalculatorConfig()
         self.config.validate()
-        
+        clock = self._time_startup_phase('config', clock)
+
         os.makedirs(self.config.log_dir, exist_ok=True)
+        self.log_pipeline: Optional[LoggingPipeline] = None
         self._setup_logging()
+        clock = self._time_startup_phase('logging', clock)
 
-        self.history: List[Calculation] = []
+        self._history = CalculationHistory()
+        self._history_loaded = False
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._store: Optional[HistoryStore] = None
         self.operation_strategy: Optional[Operation] = None
 
+        self.result_cache: Optional[ResultCache] = None
+        if self.config.result_cache:
+            self.result_cache = ResultCache(self.config.result_cache_size, self.config.result_cache_policy)
+
+        self.parallel: Optional[ParallelExecutor] = None
+        if self.config.parallel_workers:
+            self.parallel = ParallelExecutor(self.config.parallel_workers, self.config.parallel_chunk_size)
+
         self.observers: List[HistoryObserver] = []
+        self.observer_errors: List[Exception] = []
+        self._notifications: 'deque[Callable[[HistoryObserver], None]]' = deque()
+        self._delivering = threading.Lock()
 
         self.undo_stack: List[CalculatorMemento] = []
         self.redo_stack: List[CalculatorMemento] = []
 
-        self._setup_directories()
+        self.journal: Optional[HistoryJournal] = None
+        if self.config.auto_save_mode == 'journal':
+            self.journal = HistoryJournal(self.config.journal_file, self.config.default_encoding)
 
-        try:
-            self.load_history()
-        except Exception as e: # pragma: no cover
-            log.warning(f"History Load failed: {e}")
+        self._setup_directories()
+        self._time_startup_phase('setup', clock)
 
         log.info("Calculator configured successfully")
 
+    def _time_startup_phase(self, phase: str, started: float) -> float:
+        """
+        Records the duration of a startup phase in startup_timings
+
+        Parameters
+        ----------
+        phase: str
+            The name of the phase
+        started: float
+            The time.perf_counter() reading at the start of the phase
+
+        Returns
+        -------
+        float
+            The current time.perf_counter() reading, which starts the next phase
+        """
+        now = time.perf_counter()
+        self.startup_timings[phase] = now - started
+        return now
+
+    def startup_report(self, started: Optional[float] = None) -> str:
+        """
+        Summarizes the startup phase durations
+
+        Parameters
+        ----------
+        started: Optional[float], optional
+            A time.perf_counter() reading from before the Calculator was created.
+            When passed, the time elapsed since is reported as the time to first prompt
+
+        Returns
+        -------
+        str
+            Each phase and its duration in milliseconds, in the order they ran
+        """
+        timings = dict(self.startup_timings)
+        if started is not None:
+            timings['first prompt'] = time.perf_counter() - started
+        phases = ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in timings.items())
+        return f"Startup: {phases}"
+
+    @property
+    def history(self) -> CalculationHistory:
+        """
+        Get the Calculation history, loading the saved history on first access
+
+        A failed initial load is logged, and leaves the history empty
+
+        Returns
+        -------
+        CalculationHistory
+            The current Calculation history
+        """
+        if not self._history_loaded:
+            with self._lock:
+                if not self._history_loaded:
+                    started = time.perf_counter()
+                    try:
+                        self.load_history()
+                    except Exception as e:
+                        log.warning(f"History Load failed: {e}")
+                    self._time_startup_phase('history_load', started)
+        return self._history
+
     def _setup_logging(self) -> None:
-        """Creates a file association for the locker"""
+        """
+        Creates a file association for the locker
+
+        With log_pipeline enabled, records are written in batches by a background
+        LoggingPipeline; otherwise they are written synchronously
+        """
         try:
             os.makedirs(self.config.log_dir, exist_ok=True)
             log_file = self.config.log_file.resolve()
 
-            log.basicConfig(
-                filename=str(log_file),
-                level=log.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                force=True
+            handler = build_file_handler(
+                log_file,
+                self.config.default_encoding,
+                self.config.log_rotation,
+                self.config.log_max_bytes,
+                self.config.log_backup_count
             )
+            if self.config.log_pipeline:
+                self.log_pipeline = LoggingPipeline(
+                    handler, self.config.log_batch_size, self.config.log_flush_interval)
+                self.log_pipeline.start()
+            else:
+                log.basicConfig(handlers=[handler], level=log.INFO, force=True)
             log.info(f"Logging initialized at: {log_file}")
         except Exception as e:
             print(f"Error setting up logging: {e}")
@@ -79,11 +204,17 @@ class Calculator:
         """
         Register a new observer on the Calculator.
 
+        With 'async' observer dispatch, the observer is wrapped in a QueuedObserver
+        so that it is notified from its own worker thread
+
         Parameters
         ----------
         observer: HistoryObserver
             The Observer to register
         """
+        if self.config.observer_dispatch == 'async':
+            observer = QueuedObserver(
+                observer, self.config.observer_queue_size, self.config.observer_queue_policy)
         self.observers.append(observer)
         log.info(f"Added Observer: {observer.__class__.__name__}")
 
@@ -91,14 +222,40 @@ class Calculator:
         """
         Removes and deactivates an Observer.
 
+        A queued observer delivers its pending notifications and stops its worker first
+
         Parameters
         ----------
         observer: HistoryObserver
             The Observer to reactivate
         """
+        for registered in self.observers:
+            if isinstance(registered, QueuedObserver) and registered.observer is observer:
+                registered.stop()
+                observer = registered
+                break
         self.observers.remove(observer)
         log.info(f"Removed observer: {observer.__class__.__name__}")
 
+    def observer_lag(self) -> Dict[str, Dict[str, int]]:
+        """
+        Reports the delivery backlog of each queued observer
+
+        Returns
+        -------
+        Dict[str, Dict[str, int]]
+            Pending, delivered and dropped notification counts, keyed by observer class name.
+            Empty with inline dispatch
+        """
+        return {
+            observer.observer.__class__.__name__: {
+                'pending': observer.lag,
+                'delivered': observer.delivered,
+                'dropped': observer.dropped,
+            }
+            for observer in self.observers if isinstance(observer, QueuedObserver)
+        }
+
     def notify_observers(self, calc: Calculation) -> None:
         """
         Notifies active observers of a new Calculation object
@@ -108,7 +265,112 @@ class Calculator:
         calc: Calculation
             A newly performed Calculation
         """
-        [observer.update(calc) for observer in self.observers]
+        self._dispatch(lambda observer: observer.update(calc))
+
+    def notify_observers_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Notifies active observers of a batch of new Calculation objects
+
+        Each observer receives a single notification for the whole batch
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations performed in a single batch, in execution order
+        """
+        self._dispatch(lambda observer: observer.update_batch(calcs))
+
+    def close(self) -> None:
+        """
+        Shuts down observers, parallel workers, the history store and the logging
+        pipeline, completing any deferred work such as background saves and buffered
+        log writes
+
+        Raises
+        ------
+        OperationError
+            If any observer fails to shut down cleanly. All observers are still closed
+        """
+        errors = []
+        for observer in self.observers:
+            try:
+                observer.close()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            log.error(f"Observer shutdown failed: {errors[0]}")
+        if self.parallel is not None:
+            self.parallel.close()
+        if self._store is not None:
+            self._store.close()
+        if self.log_pipeline is not None:
+            self.log_pipeline.stop()
+        if errors:
+            raise OperationError(f"Observer shutdown failed: {errors[0]}")
+
+    def notify_observers_event(self, event: str, memento: Optional[CalculatorMemento] = None) -> None:
+        """
+        Notifies active observers of a history change that adds no Calculation
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento], optional
+            The history delta applied by an undo or redo
+        """
+        self._dispatch(lambda observer: observer.update_event(event, memento))
+
+    def _dispatch(self, notify: Callable[[HistoryObserver], None]) -> None:
+        """
+        Queues a notification for every observer, then delivers the queue
+
+        Parameters
+        ----------
+        notify: Callable[[HistoryObserver], None]
+            Passes the notification to one observer
+        """
+        self._notifications.append(notify)
+        self._deliver_notifications()
+
+    def _deliver_notifications(self) -> None:
+        """
+        Delivers queued notifications to every observer, in the order they were queued
+
+        History changes queue their notification while holding the history lock, and
+        deliver it after releasing the lock, so an observer can read or save history.
+        One thread delivers at a time. A thread that finds delivery in progress leaves
+        its notifications to the delivering thread
+
+        An observer failure does not undo the history change or stop the remaining
+        observers. It is logged and kept in observer_errors for the caller to report
+        """
+        while self._notifications:
+            if not self._delivering.acquire(blocking=False):
+                return
+            try:
+                while self._notifications:
+                    notify = self._notifications.popleft()
+                    for observer in self.observers:
+                        try:
+                            notify(observer)
+                        except Exception as e:
+                            log.error(f"Observer {observer.__class__.__name__} failed: {e}")
+                            self.observer_errors.append(e)
+            finally:
+                self._delivering.release()
+
+    def pop_observer_errors(self) -> List[Exception]:
+        """
+        Retrieves and clears the observer failures collected since the last call
+
+        Returns
+        -------
+        List[Exception]
+            The failures, oldest first
+        """
+        errors, self.observer_errors = self.observer_errors, []
+        return errors
 
     def set_operation(self, operation: Operation) -> None:
         """
@@ -130,7 +392,8 @@ class Calculator:
         """
         Performs a Calculation using the current Operation strategy.
 
-        Wraps input validation and history management
+        Wraps input validation and history management. Threads sharing a Calculator
+        should use perform() instead, since the strategy is shared between them
 
         Parameters
         ----------
@@ -146,33 +409,293 @@ class Calculator:
         ValidationError
             If either operand input fails to validate
         """
-        if not self.operation_strategy:
+        operation = self.operation_strategy
+        if not operation:
             raise OperationError("No strategy set in perform_operation()")
+        return self._perform(operation, x, y)
 
+    def perform(
+            self,
+            operation_name: str,
+            x: Union[str, Number],
+            y: Union[str, Number]
+    ) -> CalculationResult:
+        """
+        Performs a Calculation using an Operation named by the caller.
+
+        The operation_strategy is neither read nor changed, so threads sharing a
+        Calculator can each perform their own Operations. Validation and execution
+        run without holding the history lock
+
+        Parameters
+        ----------
+        operation_name: str
+            Any name or alias registered to the OperationFactory
+        x: Union[str, Number]
+            Raw input for the first operand
+        y: Union[str, Number]
+            Raw input for the second operand
+
+        Raises
+        ------
+        OperationError
+            If the Operation is unknown, or if its execution fails
+        ValidationError
+            If either operand input fails to validate
+        """
+        try:
+            operation = OperationFactory.create_operation(operation_name)
+        except ValueError as e:
+            log.error(f"Operation Failed: {str(e)}")
+            raise OperationError(f"Operation Failed: {str(e)}")
+        return self._perform(operation, x, y)
+
+    def _perform(
+            self,
+            operation: Operation,
+            x: Union[str, Number],
+            y: Union[str, Number]
+    ) -> CalculationResult:
+        """
+        Validates, executes and records a single Calculation
+
+        Parameters
+        ----------
+        operation: Operation
+            The Operation to execute
+        x: Union[str, Number]
+            Raw input for the first operand
+        y: Union[str, Number]
+            Raw input for the second operand
+
+        Raises
+        ------
+        OperationError
+            If the execution strategy fails
+        ValidationError
+            If either operand input fails to validate
+        """
         try:
             # Validate
-            valid_x = InputValidator.validate_number(x, self.config)
-            valid_y = InputValidator.validate_number(y, self.config)
+            validate = self._validator()
+            valid_x = validate(x, self.config)
+            valid_y = validate(y, self.config)
 
             # Execute
-            result = self.operation_strategy.execute(valid_x, valid_y)
+            with working_precision(self.config.precision):
+                result = self._executor(operation)(valid_x, valid_y)
 
             # Record
             calc = Calculation(
-                operation=str(self.operation_strategy),
+                operation=str(operation),
                 operandx=valid_x,
                 operandy=valid_y,
-                result=result
+                result=result,
+                backend=self.config.numeric_backend
             )
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
-            self.redo_stack.clear()
-            self.history.append(calc)
-            self.notify_observers(calc)
-            
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+            self._record([calc], lambda observer: observer.update(calc))
+
+            return result
+        except ValidationError as e:
+            log.error(f"Validation Error: {str(e)}")
+            raise
+        except Exception as e: # pragma: no cover
+            log.error(f"Operation Failed: {str(e)}")
+            raise OperationError(f"Operation Failed: {str(e)}")
+
+    def evaluate(self, expression: str, **bindings: Union[str, Number]) -> Decimal:
+        """
+        Evaluates an infix expression over the registered Operations.
+
+        The expression is compiled once per distinct source text and reused. Variable
+        values and numeric literals are validated as operands are. Expressions always
+        evaluate on the Decimal backend, and the evaluation is not recorded in history
+
+        Parameters
+        ----------
+        expression: str
+            The expression text, such as '(x + 1) * root(y, 2)'
+        bindings: Union[str, Number]
+            Raw input for each variable in the expression
 
+        Raises
+        ------
+        ValidationError
+            If the expression is malformed, a variable is unbound, or any value fails to validate
+        OperationError
+            If the evaluation fails
+
+        Returns
+        -------
+        Decimal
+            The expression's value
+        """
+        try:
+            compiled = compile_expression(expression, self.config.precision)
+            [InputValidator.validate_number(literal, self.config) for literal in compiled.literals]
+            values = {
+                name: InputValidator.validate_number(value, self.config)
+                for name, value in bindings.items()
+            }
+            with working_precision(self.config.precision):
+                return compiled.evaluate(values)
+        except ValidationError as e:
+            log.error(f"Validation Error: {str(e)}")
+            raise
+        except Exception as e:
+            log.error(f"Evaluation Failed: {str(e)}")
+            raise OperationError(f"Evaluation Failed: {str(e)}")
+
+    def _executor(self, operation: Operation) -> Callable[[Any, Any], Union[Decimal, float]]:
+        """
+        Resolves how to execute an Operation on the configured numeric backend
+
+        Returns the Operation's execute method, or execute_float for the float backend,
+        wrapped to go through the result cache when it is enabled. Only successful
+        results are cached, so a failing Calculation fails every time
+
+        Parameters
+        ----------
+        operation: Operation
+            The Operation to execute
+
+        Returns
+        -------
+        Callable[[Any, Any], Union[Decimal, float]]
+            A function taking the validated operands and returning the result
+        """
+        backend = self.config.numeric_backend
+        execute = operation.execute_float if backend == 'float' else operation.execute
+        cache = self.result_cache
+        if cache is None:
+            return execute
+        name, precision = str(operation), self.config.precision
+
+        def cached(x: Any, y: Any) -> Union[Decimal, float]:
+            key = ResultCache.make_key(name, x, y, precision, backend)
+            result = cache.get(key)
+            if result is None:
+                result = execute(x, y)
+                cache.put(key, result)
             return result
+        return cached
+
+    def _validator(self) -> Callable[[Any, CalculatorConfig], Union[Decimal, float]]:
+        """
+        Get the operand validator for the configured numeric backend
+
+        Returns
+        -------
+        Callable[[Any, CalculatorConfig], Union[Decimal, float]]
+            InputValidator.validate_float for the float backend, otherwise validate_number
+        """
+        if self.config.numeric_backend == 'float':
+            return InputValidator.validate_float
+        return InputValidator.validate_number
+
+    def _record(self, calcs: List[Calculation], notify: Callable[[HistoryObserver], None]) -> None:
+        """
+        Appends new Calculations to history, logs the change for undo, and notifies observers
+
+        Evicts the oldest entries once history exceeds config.max_history_size
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The new Calculations, in execution order
+        notify: Callable[[HistoryObserver], None]
+            Passes the change to one observer
+        """
+        with self._lock:
+            self.history.extend(calcs)
+            evicted = self.history.drop_left(len(self.history) - self.config.max_history_size)
+            self.undo_stack.append(CalculatorMemento(appended=calcs, evicted=evicted))
+            self.redo_stack.clear()
+            self._notifications.append(notify)
+        self._deliver_notifications()
+
+    def perform_many(
+            self,
+            operands: Iterable[Union[Tuple[Union[str, Number], Union[str, Number]], str, Number]],
+            y_operands: Optional[Iterable[Union[str, Number]]] = None
+    ) -> List[CalculationResult]:
+        """
+        Performs a batch of Calculations using the current Operation strategy.
+
+        Operands are validated and executed in bulk before any are recorded, so a
+        failure anywhere in the batch leaves history untouched. A successful batch
+        produces a single undo step and a single observer notification.
+
+        With config.parallel_workers set, batches larger than config.parallel_chunk_size
+        are executed by the ParallelExecutor worker processes, bypassing the result cache.
+        Results and Calculations keep input order.
+
+        Parameters
+        ----------
+        operands: Iterable
+            Either an iterable of (x, y) operand pairs, or the column of x operands
+            when y_operands is passed
+        y_operands: Optional[Iterable[Union[str, Number]]], optional
+            The column of y operands, paired positionally with operands
+
+        Raises
+        ------
+        OperationError
+            If no operation strategy is set, if the operand columns differ in length,
+            or if the execution strategy fails
+        BatchValidationError
+            If any operand input fails to validate, reporting every invalid pair
+        ValidationError
+            If operands holds an item that is not an (x, y) pair
+
+        Returns
+        -------
+        List[CalculationResult]
+            The results of each Calculation, in input order
+        """
+        operation = self.operation_strategy
+        if not operation:
+            raise OperationError("No strategy set in perform_many()")
+
+        if y_operands is not None:
+            xs, ys = list(operands), list(y_operands)
+            if len(xs) != len(ys):
+                raise OperationError(
+                    f"Operand columns differ in length: {len(xs)} and {len(ys)}")
+
+        try:
+            # Unpack
+            if y_operands is None:
+                pairs: Sequence = list(operands)
+                try:
+                    xs, ys = [x for x, _ in pairs], [y for _, y in pairs]
+                except (TypeError, ValueError) as e:
+                    raise ValidationError(f"Operands must be (x, y) pairs: {e}")
+            if not xs:
+                return []
+
+            # Validate
+            backend = self.config.numeric_backend
+            valid_xs, valid_ys = self._validate_columns(xs, ys, backend)
+
+            # Execute
+            if self.parallel is not None and len(valid_xs) > self.config.parallel_chunk_size:
+                results = self.parallel.map(
+                    OperationFactory.name_of(operation), valid_xs, valid_ys, self.config.precision, backend)
+            else:
+                execute = self._executor(operation)
+                with working_precision(self.config.precision):
+                    results = [execute(x, y) for x, y in zip(valid_xs, valid_ys)]
+
+            # Record
+            name = str(operation)
+            calcs = [
+                Calculation(operation=name, operandx=x, operandy=y, result=result, backend=backend)
+                for x, y, result in zip(valid_xs, valid_ys, results)
+            ]
+            self._record(calcs, lambda observer: observer.update_batch(calcs))
+
+            return results
         except ValidationError as e:
             log.error(f"Validation Error: {str(e)}")
             raise
@@ -180,12 +703,79 @@ class Calculator:
             log.error(f"Operation Failed: {str(e)}")
             raise OperationError(f"Operation Failed: {str(e)}")
 
+    def _validate_columns(
+            self,
+            xs: Sequence[Union[str, Number]],
+            ys: Sequence[Union[str, Number]],
+            backend: str
+    ) -> Tuple[List[Union[Decimal, float]], List[Union[Decimal, float]]]:
+        """
+        Validates both operand columns of a batch, reporting every invalid operand pair
+
+        Parameters
+        ----------
+        xs: Sequence[Union[str, Number]]
+            Raw input for the first operands
+        ys: Sequence[Union[str, Number]]
+            Raw input for the second operands, of the same length
+        backend: str
+            The numeric backend to validate for
+
+        Raises
+        ------
+        BatchValidationError
+            If any operand fails to validate, with the first failing operand's error
+            for each pair, keyed by pair index
+
+        Returns
+        -------
+        Tuple[List[Union[Decimal, float]], List[Union[Decimal, float]]]
+            The validated columns
+        """
+        columns = []
+        errors: Dict[int, str] = {}
+        for column in (xs, ys):
+            try:
+                columns.append(InputValidator.validate_many(column, self.config, backend))
+            except BatchValidationError as e:
+                for index, message in e.errors.items():
+                    errors.setdefault(index, message)
+        if errors:
+            raise BatchValidationError(dict(sorted(errors.items())))
+        return columns[0], columns[1]
+
+    @property
+    def history_store(self) -> HistoryStore:
+        """
+        Get the store for the history file
+
+        A new store is created whenever config.history_format or config.history_file
+        changes, closing the previous one
+
+        Returns
+        -------
+        HistoryStore
+            The store for config.history_format at config.history_file
+        """
+        history_format, path = self.config.history_format, self.config.history_file
+        with self._lock:
+            store = self._store
+            if store is None or store.path != path or type(store) is not HISTORY_STORES.get(history_format):
+                if store is not None:
+                    store.close()
+                store = self._store = create_history_store(history_format, path)
+            return store
+
     def save_history(self) -> None:
         """
         Writes the current Calculation history to file.
 
-        Writes to CSV at the file path established in config.history_file
-        
+        Writes through the history_store for config.history_format, to the file path
+        established in config.history_file, records the file's integrity digest
+        alongside it where the store keeps one, then discards the history journal,
+        whose changes the file now contains. The 'sqlite' store writes only the
+        records changed since its last write
+
         Raises
         ------
         OperationError
@@ -194,58 +784,258 @@ class Calculator:
         try:
             self._setup_directories()
 
-            history_data = []
-            [history_data.append(calc.to_dict()) for calc in self.history]
-
-            if history_data:
-                df = pd.DataFrame(history_data)
-                df.to_csv(self.config.history_file, index=False)
+            # Saves run one at a time. Writers only wait while history is copied, unless
+            # the journal is reset afterwards, which would discard their changes
+            with self._save_lock, self._lock if self.journal is not None else nullcontext():
+                store = self.history_store
+                store.write(self._snapshot())
                 log.info(f"History saved to {self.config.history_file}")
-            else:
-                pd.DataFrame(columns=['operation', 'operandx',\
-                        'operandy', 'result', 'precision', 'timestamp']
-                    ).to_csv(self.config.history_file, index=False)
-                log.info("Calculation History Empty: Headers file recorded")
+                if store.digest:
+                    self._write_history_digest()
+                if self.journal is not None:
+                    self.journal.reset()
         except Exception as e: # pragma: no cover
-            log.error(f"CSV Save Failed: {e}")
-            raise OperationError(f"CSV Save Failed: {e}")
+            log.error(f"History Save Failed: {e}")
+            raise OperationError(f"History Save Failed: {e}")
 
     def load_history(self) -> None:
         """
         Loads a saved Calculation history from file.
 
-        Reads from a CSV at the path established in config.history_file
+        Reads through the history_store for config.history_format from the path
+        established in config.history_file, then replays any changes recorded in the
+        history journal. Only the newest config.max_history_size records are
+        materialized and verified.
+
+        CSV columns are read as strings so Decimal fields round-trip exactly. With
+        config.trusted_load set, CSV records are not recomputed when the file matches
+        its saved integrity digest. Files without a digest, or with a mismatched one,
+        are fully verified.
+
+        Columnar, record log and SQLite history files are read by position, without
+        reading the older records.
+
+        The first load, whether explicit or on first access to history, is not
+        recorded as an undo step.
 
         Raises
         ------
         OperationError
             If loading is cancelled or fails
         """
-        try:
-            if self.config.history_file.exists():
-                df = pd.read_csv(self.config.history_file)
-                if not df.empty:
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'operandx': row['operandx'],
-                            'operandy': row['operandy'],
-                            'result': row['result'],
-                            'precision': row['precision'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
-                    log.info(f"Loaded {len(self.history)} calculations from history")
+        with self._lock:
+            initial, self._history_loaded = not self._history_loaded, True
+            try:
+                loaded: List[Calculation] = []
+                store = self.history_store
+                if not store.exists():
+                    log.info(f"No history file found")
                 else:
-                    log.info(f"No history loaded: file empty")
-            else:
-                log.info(f"No history file found")
-        except Exception as e:
-            log.error(f"CSV Load Failed: {e}")
-            raise OperationError(f"CSV Load Failed: {e}")
+                    trusted = store.trusted_load and self._history_digest_matches()
+                    loaded = store.load(self.config.max_history_size, verify=not trusted)
+                    log.info(f"Loaded {len(loaded)} calculations from history")
+                if self.journal is not None:
+                    journaled = CalculationHistory(loaded)
+                    self.journal.replay(journaled, self.config.max_history_size)
+                    loaded = journaled.copy()
+                    log.info(f"Replayed {self.journal.record_count} history journal records")
+                if loaded or self._history:
+                    self._replace_history(loaded, record=not initial)
+            except Exception as e:
+                log.error(f"History Load Failed: {e}")
+                raise OperationError(f"History Load Failed: {e}")
 
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def _read_history_range(self, start: int, stop: Optional[int]) -> List[Calculation]:
+        """
+        Reads a range of saved records from a random-access history file
+
+        Parameters
+        ----------
+        start: int
+            First record position. Negative values count from the end
+        stop: Optional[int]
+            Record position to stop before, or None to read to the end
+
+        Raises
+        ------
+        OperationError
+            If config.history_format does not support random access
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        store = self.history_store
+        if not isinstance(store, RandomAccessHistoryStore):
+            raise OperationError(
+                f"History format '{self.config.history_format}' does not support random access")
+        return store.read(start, stop)
+
+    def get_history_entry(self, index: int) -> Calculation:
+        """
+        Reads a single saved record by position, without loading the rest of the file
+
+        Parameters
+        ----------
+        index: int
+            The record position. Negative values count from the end
+
+        Raises
+        ------
+        OperationError
+            If config.history_format does not support random access
+        IndexError
+            If the position is out of range
+
+        Returns
+        -------
+        Calculation
+            The saved record
+        """
+        entry = self._read_history_range(index, index + 1 if index != -1 else None)
+        if not entry:
+            raise IndexError(f"History entry {index} out of range")
+        return entry[0]
+
+    def get_history_range(self, start: int, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a range of saved records, without loading the rest of the file
+
+        Parameters
+        ----------
+        start: int
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Raises
+        ------
+        OperationError
+            If config.history_format does not support random access
+
+        Returns
+        -------
+        List[Calculation]
+            The saved records in the range, oldest first
+        """
+        return self._read_history_range(start, stop)
+
+    def get_history_tail(self, count: int) -> List[Calculation]:
+        """
+        Reads the newest saved records, without loading the rest of the file
+
+        Parameters
+        ----------
+        count: int
+            The maximum number of records to read
+
+        Raises
+        ------
+        OperationError
+            If config.history_format does not support random access
+
+        Returns
+        -------
+        List[Calculation]
+            Up to count saved records, oldest first
+        """
+        return self._read_history_range(-count, None) if count > 0 else []
+
+    def find_history(
+            self,
+            operation: Optional[str] = None,
+            since: Optional[dt.datetime] = None,
+            until: Optional[dt.datetime] = None,
+            limit: Optional[int] = None
+    ) -> List[Calculation]:
+        """
+        Queries saved records by operation and time, without loading the rest of the file
+
+        Parameters
+        ----------
+        operation: Optional[str], optional
+            Only records of this Operation, by any name or alias registered to the OperationFactory
+        since: Optional[dt.datetime], optional
+            Only records timestamped at or after this time
+        until: Optional[dt.datetime], optional
+            Only records timestamped before this time
+        limit: Optional[int], optional
+            Only the newest matching records, up to this many
+
+        Raises
+        ------
+        OperationError
+            If config.history_format does not support queries, or the Operation is unknown
+
+        Returns
+        -------
+        List[Calculation]
+            The matching saved records, oldest first
+        """
+        store = self.history_store
+        if not isinstance(store, SQLiteHistoryStore):
+            raise OperationError(
+                f"History format '{self.config.history_format}' does not support queries")
+        if operation is not None:
+            try:
+                operation = str(OperationFactory.create_operation(operation))
+            except ValueError as e:
+                raise OperationError(str(e))
+        return store.find(operation, since, until, limit)
+
+    @property
+    def _history_digest_file(self) -> Path:
+        """
+        Get the path of the integrity digest for the history file
+
+        Returns
+        -------
+        Path
+            The history file path with a '.sha256' suffix appended
+        """
+        history_file = self.config.history_file
+        return history_file.with_name(history_file.name + '.sha256')
+
+    def _hash_history_file(self) -> str:
+        """
+        Computes the SHA-256 digest of the history file
+
+        Returns
+        -------
+        str
+            The hex digest of the file contents
+        """
+        with open(self.config.history_file, 'rb') as history:
+            return hashlib.file_digest(history, 'sha256').hexdigest()
+
+    def _write_history_digest(self) -> None:
+        """Records the history file's digest in sha256sum format"""
+        self._history_digest_file.write_text(
+            f"{self._hash_history_file()}  {self.config.history_file.name}\n")
+
+    def _history_digest_matches(self) -> bool:
+        """
+        Checks the history file against its recorded digest, when trusted loading is enabled
+
+        Returns
+        -------
+        bool
+            True if trusted loading is enabled and the digests match. False otherwise.
+        """
+        if not self.config.trusted_load:
+            return False
+        try:
+            recorded = self._history_digest_file.read_text().split()[0]
+        except (OSError, IndexError):
+            log.info("No history digest found: verifying all records")
+            return False
+        if recorded != self._hash_history_file():
+            log.warning("History digest mismatch: verifying all records")
+            return False
+        return True
+
+    def get_history_dataframe(self) -> 'pd.DataFrame':
         """
         Generates a pandas DataFrame based on the current history state
 
@@ -254,7 +1044,7 @@ class Calculator:
         pd.DataFrame
             A DataFrame based on the current history state
         """
-        history_data = [calc.to_dict() for calc in self.history]
+        history_data = [calc.to_dict() for calc in self._snapshot()]
         return pd.DataFrame(history_data)
 
     def show_history(self) -> List[str]:
@@ -266,13 +1056,45 @@ class Calculator:
         List[str]
             A list of Calculation records in string format
         """
-        return [str(calc) for calc in self.history]
+        return [str(calc) for calc in self._snapshot()]
+
+    def _snapshot(self) -> List[Calculation]:
+        """
+        Copies the history, holding the lock only for the copy
+
+        Returns
+        -------
+        List[Calculation]
+            The current history, oldest first
+        """
+        with self._lock:
+            return self.history.copy()
+
+    def _replace_history(self, calcs: List[Calculation], record: bool = True) -> None:
+        """
+        Replaces the whole history and logs the change for undo
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The new history state
+        record: bool, optional
+            Records the change as an undo step
+        """
+        memento = CalculatorMemento(appended=calcs, cleared=self._history.copy())
+        memento.apply(self._history)
+        if record:
+            self.undo_stack.append(memento)
+            self.redo_stack.clear()
 
     def clear_history(self) -> None:
         """Clears the calculation history and memento stacks"""
-        self.history.clear()
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        with self._lock:
+            self.history.clear()
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self._notifications.append(lambda observer: observer.update_event('clear', None))
+        self._deliver_notifications()
         log.info("History Cleared")
 
     def undo(self) -> bool:
@@ -284,11 +1106,14 @@ class Calculator:
         bool
             True if undo was successful. False if prior state was unavailable
         """
-        if not self.undo_stack:
-            return False
-        memento = self.undo_stack.pop()
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        self.history = memento.history.copy()
+        with self._lock:
+            if not self.undo_stack:
+                return False
+            memento = self.undo_stack.pop()
+            memento.revert(self.history)
+            self.redo_stack.append(memento)
+            self._notifications.append(lambda observer: observer.update_event('undo', memento))
+        self._deliver_notifications()
         return True
 
     def redo(self) -> bool:
@@ -300,11 +1125,14 @@ class Calculator:
         bool
             True if redo was successful. False if undone state was unavailable
         """
-        if not self.redo_stack:
-            return False
-        memento = self.redo_stack.pop()
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        self.history = memento.history.copy()
+        with self._lock:
+            if not self.redo_stack:
+                return False
+            memento = self.redo_stack.pop()
+            memento.apply(self.history)
+            self.undo_stack.append(memento)
+            self._notifications.append(lambda observer: observer.update_event('redo', memento))
+        self._deliver_notifications()
         return True
 
 
@@ -3,17 +3,87 @@ import os
 
 from dataclasses import dataclass
 from decimal import Decimal
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 from numbers import Number
 from pathlib import Path
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 from app.exceptions import ConfigurationError
 
-load_dotenv()
+ENV_FILE = find_dotenv()
+
+# Values this module has written to os.environ from ENV_FILE, by variable name
+_env_file_values: Dict[str, str] = {}
+
+def load_env_file() -> None:
+    """
+    Applies the variables in the .env file to the environment
+
+    Variables set in the environment by other means take precedence. On a reload,
+    variables from a previous load are updated, or removed if no longer in the file
+    """
+    values = {key: value for key, value in dotenv_values(ENV_FILE).items() if value is not None}
+    for key in set(_env_file_values) - set(values):
+        if os.environ.get(key) == _env_file_values.pop(key):
+            del os.environ[key]
+    for key, value in values.items():
+        if key not in os.environ or os.environ[key] == _env_file_values.get(key):
+            os.environ[key] = value
+            _env_file_values[key] = value
+
+def _env_file_mtime() -> Optional[int]:
+    """
+    Get the modification time of the .env file
+
+    Returns
+    -------
+    Optional[int]
+        The modification time in nanoseconds, or None if there is no .env file
+    """
+    try:
+        return os.stat(ENV_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+load_env_file()
+
+@dataclass(frozen=True)
+class ConfigPaths:
+    """
+    Snapshot of the resolved file system locations of a CalculatorConfig
+
+    Attributes
+    ----------
+    history_format: str
+        The history_format the history file name was resolved for
+    log_dir: Path
+        The log directory path
+    log_file: Path
+        The log file path
+    history_dir: Path
+        The history directory path
+    history_file: Path
+        The history file path
+    journal_file: Path
+        The history journal file path
+    """
+    history_format: str
+    log_dir: Path
+    log_file: Path
+    history_dir: Path
+    history_file: Path
+    journal_file: Path
 
 @dataclass
 class CalculatorConfig:
+    history_suffixes: ClassVar[Dict[str, str]] = {
+        'csv': '.csv', 'columnar': '.col', 'records': '.rlog', 'sqlite': '.db'}
+    # Settings read only when a Calculator or the REPL starts, to build components that last the session
+    startup_settings: ClassVar[Tuple[str, ...]] = (
+        'auto_save_mode', 'auto_save_async', 'observer_dispatch', 'observer_queue_size',
+        'observer_queue_policy', 'log_pipeline', 'log_batch_size', 'log_flush_interval',
+        'log_rotation', 'log_max_bytes', 'log_backup_count', 'result_cache', 'result_cache_size',
+        'result_cache_policy', 'parallel_workers', 'parallel_chunk_size')
 
     def __init__(
         self,
@@ -22,10 +92,38 @@ class CalculatorConfig:
         auto_save: Optional[bool] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
-        default_encoding: Optional[str] = None
+        default_encoding: Optional[str] = None,
+        auto_save_mode: Optional[str] = None,
+        journal_compact_interval: Optional[int] = None,
+        trusted_load: Optional[bool] = None,
+        history_format: Optional[str] = None,
+        auto_save_async: Optional[bool] = None,
+        auto_save_debounce: Optional[float] = None,
+        auto_save_max_latency: Optional[float] = None,
+        observer_dispatch: Optional[str] = None,
+        observer_queue_size: Optional[int] = None,
+        observer_queue_policy: Optional[str] = None,
+        log_pipeline: Optional[bool] = None,
+        log_batch_size: Optional[int] = None,
+        log_flush_interval: Optional[float] = None,
+        log_rotation: Optional[str] = None,
+        log_max_bytes: Optional[int] = None,
+        log_backup_count: Optional[int] = None,
+        result_cache: Optional[bool] = None,
+        result_cache_size: Optional[int] = None,
+        result_cache_policy: Optional[str] = None,
+        numeric_backend: Optional[str] = None,
+        startup_report: Optional[bool] = None,
+        watch_env: Optional[bool] = None,
+        bulk_chunk_size: Optional[int] = None,
+        parallel_workers: Optional[int] = None,
+        parallel_chunk_size: Optional[int] = None
     ) -> None:
         """
         Initializes configuration variables from .env
+
+        File system paths are resolved once, on first use, into a ConfigPaths
+        snapshot. reload() reads .env and the environment again
         
         Parameters
         ----------
@@ -41,7 +139,75 @@ class CalculatorConfig:
             Value for maximum numerical input.
         default_encoding: str
             Default encoding for file/IO Operations.
+        auto_save_mode: str
+            'full' to rewrite the history file on each auto save, or 'journal' to append
+            each change to the history journal and compact it periodically.
+        journal_compact_interval: int
+            Number of journal records written before the journal is compacted into
+            the history file.
+        trusted_load: bool
+            Skips per-record result verification when loading a history file whose
+            integrity digest matches the one recorded at save time.
+        history_format: str
+            File format for saved history: 'csv', 'columnar' for the memory-mapped
+            binary format in app.columnar_history, 'records' for the indexed
+            record log in app.record_log, or 'sqlite' for an SQLite database
+            saved incrementally. See app.history_store.
+        auto_save_async: bool
+            Runs auto saves on a background thread that coalesces bursts of changes.
+        auto_save_debounce: float
+            Seconds without a new change before a background auto save starts.
+        auto_save_max_latency: float
+            Maximum seconds a change waits for a background auto save.
+        observer_dispatch: str
+            'inline' to notify observers on the calling thread, or 'async' to give
+            each observer a bounded queue and a worker thread.
+        observer_queue_size: int
+            Maximum pending notifications per observer in 'async' dispatch.
+        observer_queue_policy: str
+            Action when an observer queue is full: 'block', 'drop_oldest' or 'coalesce'.
+        log_pipeline: bool
+            Writes log records from a background thread, in batches, instead of on
+            the logging thread.
+        log_batch_size: int
+            Number of log records buffered before a write when log_pipeline is enabled.
+        log_flush_interval: float
+            Seconds of logging inactivity before buffered records are written.
+        log_rotation: str
+            'none', 'size' to roll the log file over at log_max_bytes, or 'time' to
+            roll it over at midnight.
+        log_max_bytes: int
+            Log file size that triggers a roll over with 'size' rotation.
+        log_backup_count: int
+            Number of rolled over log files kept.
+        result_cache: bool
+            Memoizes Operation results, so repeated Calculations skip execution.
+        result_cache_size: int
+            Maximum number of results kept in the result cache.
+        result_cache_policy: str
+            Result cache eviction policy: 'lru' or 'lfu'.
+        numeric_backend: str
+            'decimal' for exact Decimal arithmetic, or 'float' for binary floating
+            point arithmetic without Decimal conversion.
+        startup_report: bool
+            Prints the duration of each startup phase, and the time to the first
+            prompt, when the REPL starts.
+        watch_env: bool
+            Reloads the configuration in the REPL when the .env file changes.
+        bulk_chunk_size: int
+            Number of rows read, evaluated and written at a time by a bulk job.
+        parallel_workers: int
+            Number of worker processes that execute large batches in perform_many.
+            0 executes every batch in the calling process.
+        parallel_chunk_size: int
+            Number of operand pairs sent to a parallel worker at a time. Batches
+            of at most this size are executed in the calling process.
         """
+        self._arguments: Dict[str, Any] = {
+            name: value for name, value in locals().items() if name != 'self'}
+        self._paths: Optional[ConfigPaths] = None
+        self._env_mtime = _env_file_mtime()
+
         project_root = Path(__file__).parent.parent
         self.base_dir = base_dir or Path(os.getenv(
             'CALCULATOR_BASE_DIR', str(project_root)
@@ -63,6 +229,141 @@ class CalculatorConfig:
         self.default_encoding = default_encoding or os.getenv(
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8').lower()
 
+        self.auto_save_mode = auto_save_mode or os.getenv(
+            'CALCULATOR_AUTO_SAVE_MODE', 'full').lower()
+
+        self.journal_compact_interval = journal_compact_interval or int(
+            os.getenv('CALCULATOR_JOURNAL_COMPACT_INTERVAL', '1000'))
+
+        trusted_load_env = os.getenv('CALCULATOR_TRUSTED_LOAD', 'false').lower()
+        self.trusted_load = trusted_load if trusted_load else \
+            trusted_load_env == '1' or trusted_load_env == 'true'
+
+        self.history_format = history_format or os.getenv(
+            'CALCULATOR_HISTORY_FORMAT', 'csv').lower()
+
+        auto_save_async_env = os.getenv('CALCULATOR_AUTO_SAVE_ASYNC', 'false').lower()
+        self.auto_save_async = auto_save_async if auto_save_async else \
+            auto_save_async_env == '1' or auto_save_async_env == 'true'
+
+        self.auto_save_debounce = auto_save_debounce or float(
+            os.getenv('CALCULATOR_AUTO_SAVE_DEBOUNCE', '0.5'))
+
+        self.auto_save_max_latency = auto_save_max_latency or float(
+            os.getenv('CALCULATOR_AUTO_SAVE_MAX_LATENCY', '5.0'))
+
+        self.observer_dispatch = observer_dispatch or os.getenv(
+            'CALCULATOR_OBSERVER_DISPATCH', 'inline').lower()
+
+        self.observer_queue_size = observer_queue_size or int(
+            os.getenv('CALCULATOR_OBSERVER_QUEUE_SIZE', '1000'))
+
+        self.observer_queue_policy = observer_queue_policy or os.getenv(
+            'CALCULATOR_OBSERVER_QUEUE_POLICY', 'block').lower()
+
+        log_pipeline_env = os.getenv('CALCULATOR_LOG_PIPELINE', 'false').lower()
+        self.log_pipeline = log_pipeline if log_pipeline else \
+            log_pipeline_env == '1' or log_pipeline_env == 'true'
+
+        self.log_batch_size = log_batch_size or int(
+            os.getenv('CALCULATOR_LOG_BATCH_SIZE', '100'))
+
+        self.log_flush_interval = log_flush_interval or float(
+            os.getenv('CALCULATOR_LOG_FLUSH_INTERVAL', '1.0'))
+
+        self.log_rotation = log_rotation or os.getenv(
+            'CALCULATOR_LOG_ROTATION', 'none').lower()
+
+        self.log_max_bytes = log_max_bytes or int(
+            os.getenv('CALCULATOR_LOG_MAX_BYTES', '10485760'))
+
+        self.log_backup_count = log_backup_count or int(
+            os.getenv('CALCULATOR_LOG_BACKUP_COUNT', '5'))
+
+        result_cache_env = os.getenv('CALCULATOR_RESULT_CACHE', 'false').lower()
+        self.result_cache = result_cache if result_cache else \
+            result_cache_env == '1' or result_cache_env == 'true'
+
+        self.result_cache_size = result_cache_size or int(
+            os.getenv('CALCULATOR_RESULT_CACHE_SIZE', '1024'))
+
+        self.result_cache_policy = result_cache_policy or os.getenv(
+            'CALCULATOR_RESULT_CACHE_POLICY', 'lru').lower()
+
+        self.numeric_backend = numeric_backend or os.getenv(
+            'CALCULATOR_NUMERIC_BACKEND', 'decimal').lower()
+
+        startup_report_env = os.getenv('CALCULATOR_STARTUP_REPORT', 'false').lower()
+        self.startup_report = startup_report if startup_report else \
+            startup_report_env == '1' or startup_report_env == 'true'
+
+        watch_env_env = os.getenv('CALCULATOR_WATCH_ENV', 'false').lower()
+        self.watch_env = watch_env if watch_env else \
+            watch_env_env == '1' or watch_env_env == 'true'
+
+        self.bulk_chunk_size = bulk_chunk_size or int(
+            os.getenv('CALCULATOR_BULK_CHUNK_SIZE', '10000'))
+
+        self.parallel_workers = parallel_workers if parallel_workers is not None else int(
+            os.getenv('CALCULATOR_PARALLEL_WORKERS', '0'))
+
+        self.parallel_chunk_size = parallel_chunk_size or int(
+            os.getenv('CALCULATOR_PARALLEL_CHUNK_SIZE', '1000'))
+
+    @property
+    def paths(self) -> ConfigPaths:
+        """
+        Get the resolved file system paths
+
+        Paths are resolved on first use, and again only after history_format
+        changes or the configuration is reloaded
+
+        Returns
+        -------
+        ConfigPaths
+            The path snapshot
+        """
+        paths = self._paths
+        if paths is None or paths.history_format != self.history_format:
+            paths = self._paths = self._resolve_paths()
+        return paths
+
+    def _resolve_paths(self) -> ConfigPaths:
+        """
+        Resolves the file system paths from the environment
+
+        The default history file name's suffix follows history_format
+
+        Returns
+        -------
+        ConfigPaths
+            A new path snapshot
+        """
+        log_dir = Path(os.getenv(
+            'CALCULATOR_LOG_DIR', str(self.base_dir / "logs"))).resolve()
+        history_dir = Path(os.getenv(
+            'CALCULATOR_HISTORY_DIR',
+            str(self.base_dir / "history")
+        )).resolve()
+        suffix = self.history_suffixes.get(self.history_format, '.csv')
+        return ConfigPaths(
+            history_format=self.history_format,
+            log_dir=log_dir,
+            log_file=Path(os.getenv(
+                'CALCULATOR_LOG_FILE',
+                str(log_dir / "calculator.log")
+            )).resolve(),
+            history_dir=history_dir,
+            history_file=Path(os.getenv(
+                'CALCULATOR_HISTORY_FILE',
+                str(history_dir / f"calculator_history{suffix}")
+            )).resolve(),
+            journal_file=Path(os.getenv(
+                'CALCULATOR_JOURNAL_FILE',
+                str(history_dir / "calculator_history.journal")
+            )).resolve(),
+        )
+
     @property
     def log_dir(self) -> Path:
         """
@@ -73,8 +374,7 @@ class CalculatorConfig:
         Path
             The log directory path.
         """
-        return Path(os.getenv(
-            'CALCULATOR_LOG_DIR', str(self.base_dir / "logs"))).resolve()
+        return self.paths.log_dir
 
     @property
     def history_dir(self) -> Path:
@@ -86,25 +386,33 @@ class CalculatorConfig:
         Path
             The history directory path
         """
-        return Path(os.getenv(
-            'CALCULATOR_HISTORY_DIR',
-            str(self.base_dir / "history")
-        )).resolve()
+        return self.paths.history_dir
 
     @property
     def history_file(self) -> Path:
         """
-        Get history CSV file path
+        Get history file path
+
+        The default file name's suffix follows history_format
 
         Returns
         -------
         Path
             The history file path
         """
-        return Path(os.getenv(
-            'CALCULATOR_HISTORY_FILE',
-            str(self.history_dir / "calculator_history.csv")
-        )).resolve()
+        return self.paths.history_file
+
+    @property
+    def journal_file(self) -> Path:
+        """
+        Get history journal file path
+
+        Returns
+        -------
+        Path
+            The history journal file path
+        """
+        return self.paths.journal_file
 
     @property
     def log_file(self) -> Path:
@@ -116,10 +424,50 @@ class CalculatorConfig:
         Path
             The log file path
         """
-        return Path(os.getenv(
-            'CALCULATOR_LOG_FILE', 
-            str(self.log_dir / "calculator.log")
-        )).resolve()
+        return self.paths.log_file
+
+    def reload(self) -> None:
+        """
+        Reads the .env file and the environment again, and resolves the paths again
+
+        Settings passed to the constructor keep their values. Components that
+        already opened a file, such as the log handler, keep their paths. The
+        startup_settings cannot change, since the components built from them are
+        not rebuilt
+
+        Raises
+        ------
+        ConfigurationError
+            If the new configuration is invalid, or changes any startup_settings.
+            The current settings are kept
+        """
+        load_env_file()
+        reloaded = CalculatorConfig(**self._arguments)
+        reloaded.validate()
+        changed = [name for name in self.startup_settings if getattr(reloaded, name) != getattr(self, name)]
+        if changed:
+            raise ConfigurationError(
+                f"{', '.join(changed)} setting must not change on reload, restart the calculator to apply it")
+        vars(self).update(vars(reloaded))
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reloads the configuration if the .env file changed since it was last read
+
+        Raises
+        ------
+        ConfigurationError
+            If the new configuration is invalid. The current settings are kept
+
+        Returns
+        -------
+        bool
+            True if the configuration was reloaded
+        """
+        if _env_file_mtime() == self._env_mtime:
+            return False
+        self.reload()
+        return True
 
     def validate(self) -> None:
         """
@@ -136,5 +484,45 @@ class CalculatorConfig:
             raise ConfigurationError("precision setting must be positive")
         if self.max_input_value <= 0:
             raise ConfigurationError("max_input_value setting must be positive")
+        if self.auto_save_mode not in ('full', 'journal'):
+            raise ConfigurationError("auto_save_mode setting must be 'full' or 'journal'")
+        if self.journal_compact_interval <= 0:
+            raise ConfigurationError("journal_compact_interval setting must be positive")
+        if self.auto_save_debounce <= 0:
+            raise ConfigurationError("auto_save_debounce setting must be positive")
+        if self.auto_save_max_latency < self.auto_save_debounce:
+            raise ConfigurationError("auto_save_max_latency setting must not be less than auto_save_debounce")
+        if self.history_format not in self.history_suffixes:
+            raise ConfigurationError(
+                f"history_format setting must be one of: {', '.join(self.history_suffixes)}")
+        if self.observer_dispatch not in ('inline', 'async'):
+            raise ConfigurationError("observer_dispatch setting must be 'inline' or 'async'")
+        if self.observer_queue_size <= 0:
+            raise ConfigurationError("observer_queue_size setting must be positive")
+        if self.observer_queue_policy not in ('block', 'drop_oldest', 'coalesce'):
+            raise ConfigurationError(
+                "observer_queue_policy setting must be one of: block, drop_oldest, coalesce")
+        if self.log_batch_size <= 0:
+            raise ConfigurationError("log_batch_size setting must be positive")
+        if self.log_flush_interval <= 0:
+            raise ConfigurationError("log_flush_interval setting must be positive")
+        if self.log_rotation not in ('none', 'size', 'time'):
+            raise ConfigurationError("log_rotation setting must be one of: none, size, time")
+        if self.log_max_bytes <= 0:
+            raise ConfigurationError("log_max_bytes setting must be positive")
+        if self.log_backup_count < 0:
+            raise ConfigurationError("log_backup_count setting must not be negative")
+        if self.result_cache_size <= 0:
+            raise ConfigurationError("result_cache_size setting must be positive")
+        if self.result_cache_policy not in ('lru', 'lfu'):
+            raise ConfigurationError("result_cache_policy setting must be 'lru' or 'lfu'")
+        if self.numeric_backend not in ('decimal', 'float'):
+            raise ConfigurationError("numeric_backend setting must be 'decimal' or 'float'")
+        if self.bulk_chunk_size <= 0:
+            raise ConfigurationError("bulk_chunk_size setting must be positive")
+        if self.parallel_workers < 0:
+            raise ConfigurationError("parallel_workers setting must not be negative")
+        if self.parallel_chunk_size <= 0:
+            raise ConfigurationError("parallel_chunk_size setting must be positive")
 
 
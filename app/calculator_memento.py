@@ -2,17 +2,58 @@
 import datetime as dt
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
 
 @dataclass
 class CalculatorMemento:
-    """Record object detailing the Calculator history state."""
-    
-    history: List[Calculation]
+    """
+    Record object detailing a single change to the Calculator history state.
+
+    Mementos store deltas rather than history copies: the Calculations appended by
+    the change, the Calculations evicted from the front of history to make room for
+    them, and, for wholesale replacements such as a history load, the cleared history.
+    """
+
+    appended: List[Calculation] = field(default_factory=list)
+    evicted: List[Calculation] = field(default_factory=list)
+    cleared: Optional[List[Calculation]] = None
     timestamp: dt.datetime = field(default_factory=dt.datetime.now)
 
+    def apply(self, history: CalculationHistory) -> None:
+        """
+        Applies this change to a history, as on a redo.
+
+        Runs in time proportional to the size of the change, not of the history
+
+        Parameters
+        ----------
+        history: CalculationHistory
+            The history state preceding this change. Modified in place
+        """
+        if self.cleared is not None:
+            history.clear()
+        history.extend(self.appended)
+        history.drop_left(len(self.evicted))
+
+    def revert(self, history: CalculationHistory) -> None:
+        """
+        Reverts this change on a history, as on an undo.
+
+        Runs in time proportional to the size of the change, not of the history
+
+        Parameters
+        ----------
+        history: CalculationHistory
+            The history state following this change. Modified in place
+        """
+        history.prepend(self.evicted)
+        history.drop_right(len(self.appended))
+        if self.cleared is not None:
+            history.extend(self.cleared)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CalculatorMemento':
         """
@@ -21,15 +62,18 @@ class CalculatorMemento:
         Parameters
         ----------
         data: Dict[str, Any]
-            Dictionary containing saved calculation history
+            Dictionary containing a saved history change
 
         Returns
         -------
         CalculatorMemento
             A new CalculatorMemento instance with deserialized state
         """
+        cleared = data.get('cleared')
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
+            appended=[Calculation.from_dict(calc) for calc in data['appended']],
+            evicted=[Calculation.from_dict(calc) for calc in data['evicted']],
+            cleared=None if cleared is None else [Calculation.from_dict(calc) for calc in cleared],
             timestamp=dt.datetime.fromisoformat(data['timestamp'])
         )
 
@@ -43,6 +87,8 @@ class CalculatorMemento:
             A dictionary of the current memento state
         """
         return {
-            'history': [calc.to_dict() for calc in self.history],
+            'appended': [calc.to_dict() for calc in self.appended],
+            'evicted': [calc.to_dict() for calc in self.evicted],
+            'cleared': None if self.cleared is None else [calc.to_dict() for calc in self.cleared],
             'timestamp': self.timestamp.isoformat()
         }
@@ -1,31 +1,58 @@
 """This module provides the REPL interface that retrieves and directs inputs from the user"""
 import logging as log
+import time
 
 from decimal import Decimal
+from typing import Optional
 
 from app.calculator import Calculator
-from app.exceptions import OperationError, ValidationError
-from app.history import AutoSaveObserver, LoggingObserver
+from app.exceptions import ConfigurationError, OperationError, ValidationError
+from app.history import AsyncAutoSaveObserver, AutoSaveObserver, LoggingObserver
 from app.operations import OperationFactory
 
-def calculator_repl():
-    """Launches and maintains the REPL interface"""
+def calculator_repl(started: Optional[float] = None):
+    """
+    Launches and maintains the REPL interface
+
+    Parameters
+    ----------
+    started: Optional[float], optional
+        The time.perf_counter() reading at process start, so the startup report's
+        time to first prompt includes imports. Defaults to the time of this call
+    """
+    started = time.perf_counter() if started is None else started
     try:
         calc = Calculator()
         calc.add_observer(LoggingObserver())
-        calc.add_observer(AutoSaveObserver(calc))
+        if calc.config.auto_save_async:
+            calc.add_observer(AsyncAutoSaveObserver(calc))
+        else:
+            calc.add_observer(AutoSaveObserver(calc))
+
+        report = calc.startup_report(started)
+        log.info(report)
+        if calc.config.startup_report:
+            print(report)
 
         print("Welcome to Python REPL Calculator, v.1.5")
         print("Type 'help' for usage information, or 'exit' to quit")
         while True:
             try:
                 command = input(">>$: ").lower().strip()
+
+                if calc.config.watch_env:
+                    try:
+                        if calc.config.reload_if_changed():
+                            log.info("Configuration reloaded from .env")
+                    except ConfigurationError as e:
+                        print(f"Warning: Configuration reload failed: {e}")
                 
                 match command:
                     case 'help':
                         print("Available Commands")
                         print("------------------")
                         print("add, subtract, multiply, divide, power, root -- Perform calculations")
+                        print("eval - Evaluate an expression, such as (1 + 2) * root(8, 3)")
                         print("history - Display your calculation history")
                         print("clear - Clear your calculation history")
                         print("undo - Undo your last calculation")
@@ -101,9 +128,20 @@ def calculator_repl():
                         except Exception as e: # pragma: no cover
                             print(f"Unexpected error during operand entry: {e}")
                     
+                    case 'eval':
+                        try:
+                            expression = input(">> expression: ").strip()
+                            result = calc.evaluate(expression)
+                            print(f"Result: {result.normalize()}")
+                        except (OperationError, ValidationError) as e:
+                            print(f"Error: {e}")
+
                     case _:
                         print(f"Unknown command: '{command}'. Type 'help' for available commands.")
 
+                for error in calc.pop_observer_errors():
+                    print(f"Warning: {error}")
+
             except KeyboardInterrupt: # pragma: no cover
                 print("Keyboard Interrupt (Ctrl+C) detected. Input cancelled")
             except EOFError: # pragma: no cover
@@ -112,6 +150,11 @@ def calculator_repl():
             except Exception as e: # pragma: no cover
                 print(f"Unexpected Error: {e}")
 
+        try:
+            calc.close()
+        except Exception as e:
+            print(f"Warning: Shutdown incomplete: {e}")
+
     except Exception as e: # pragma: no cover
         print(f"Fatal error detected: {e}")
         log.error(f"Fatal error in REPL: {e}")
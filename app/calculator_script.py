@@ -0,0 +1,142 @@
+"""This module provides the non-interactive interface that runs calculator commands from a script"""
+import logging as log
+import sys
+import time
+
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from app.calculator import Calculator
+from app.exceptions import OperationError, ValidationError
+from app.operations import OperationFactory
+
+# Result lines buffered before each write to the output stream
+OUTPUT_BUFFER_LINES = 1024
+
+def parse_commands(lines: Iterable[str]) -> Iterator[Tuple[int, str, str]]:
+    """
+    Parses script lines lazily into commands
+
+    Blank lines and lines starting with '#' are skipped
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        The script text, one command per line, such as 'add 3 4' or 'eval (1 + 2) * 3'
+
+    Returns
+    -------
+    Iterator[Tuple[int, str, str]]
+        The line number, lowercased command and remaining argument text of each command
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        command, _, argument = line.partition(' ')
+        yield number, command.lower(), argument.strip()
+
+def run_script(calc: Calculator, lines: Iterable[str], out: TextIO) -> int:
+    """
+    Executes script commands on a Calculator, writing their output in batches
+
+    Operation commands take two operands, such as 'add 3 4', and any operation
+    registered to the OperationFactory can be used. 'eval', 'history', 'clear',
+    'undo', 'redo', 'save' and 'load' behave as in the REPL, and 'exit' stops the
+    script. A failing command writes an error line with its line number, and the
+    script continues
+
+    Parameters
+    ----------
+    calc: Calculator
+        The Calculator to run the commands on
+    lines: Iterable[str]
+        The script text, one command per line
+    out: TextIO
+        The stream receiving results and errors
+
+    Returns
+    -------
+    int
+        The number of failed commands
+    """
+    buffer: List[str] = []
+    failures = 0
+    operation_name: Optional[str] = None
+    for number, command, argument in parse_commands(lines):
+        try:
+            match command:
+                case 'exit':
+                    break
+                case 'eval':
+                    buffer.append(str(calc.evaluate(argument).normalize()))
+                case 'history':
+                    buffer.extend(calc.show_history())
+                case 'clear':
+                    calc.clear_history()
+                case 'undo':
+                    calc.undo()
+                case 'redo':
+                    calc.redo()
+                case 'save':
+                    calc.save_history()
+                case 'load':
+                    calc.load_history()
+                case _:
+                    operands = argument.split()
+                    if len(operands) != 2:
+                        raise ValidationError(f"'{command}' takes 2 operands, got {len(operands)}")
+                    if command != operation_name:
+                        # Assigned directly, since set_operation logs every change of operation
+                        calc.operation_strategy = OperationFactory.create_operation(command)
+                        operation_name = command
+                    result = calc.perform_operation(*operands)
+                    buffer.append(str(result.normalize() if isinstance(result, Decimal) else result))
+        except (OperationError, ValidationError, ValueError) as e:
+            failures += 1
+            buffer.append(f"Error on line {number}: {e}")
+        if len(buffer) >= OUTPUT_BUFFER_LINES:
+            out.write('\n'.join(buffer) + '\n')
+            buffer.clear()
+    if buffer:
+        out.write('\n'.join(buffer) + '\n')
+    out.flush()
+    return failures
+
+def calculator_script(path: Optional[str] = None, started: Optional[float] = None) -> int:
+    """
+    Runs a calculator script from a file or standard input, then saves the history once
+
+    No observers are registered, so commands are not auto saved or logged individually
+
+    Parameters
+    ----------
+    path: Optional[str], optional
+        The script file path. Reads standard input if not passed, or if '-'
+    started: Optional[float], optional
+        The time.perf_counter() reading at process start, for the startup report
+
+    Returns
+    -------
+    int
+        The exit status: 0 on success, or 1 if any command failed or the script
+        could not be read or saved
+    """
+    started = time.perf_counter() if started is None else started
+    calc = Calculator()
+    log.info(calc.startup_report(started))
+    try:
+        if path is None or path == '-':
+            failures = run_script(calc, sys.stdin, sys.stdout)
+        else:
+            with open(path, encoding=calc.config.default_encoding) as script:
+                failures = run_script(calc, script, sys.stdout)
+        calc.save_history()
+    except (OSError, OperationError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        log.error(f"Script failed: {e}")
+        return 1
+    finally:
+        calc.close()
+    log.info(f"Script completed with {failures} failed commands")
+    return 1 if failures else 0
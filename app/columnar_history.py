@@ -0,0 +1,372 @@
+"""This module provides a binary columnar file format for Calculation histories"""
+import datetime as dt
+import json
+import mmap
+import os
+import struct
+
+from array import array
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from app.calculation import Calculation, NUMERIC_BACKENDS
+from app.exceptions import SerializationError
+
+MAGIC = b'CALCCOL1'
+EPOCH = dt.datetime(1970, 1, 1)
+
+_FOOTER_TAIL = struct.Struct('<Q8s')
+_DECIMAL_HEAD = struct.Struct('<Bi')
+_DECIMAL_KINDS = {'F': 1, 'n': 2, 'N': 3}
+_DECIMAL_SPECIALS = {1: 'Infinity', 2: 'NaN', 3: 'sNaN'}
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+def pack_decimal(value: Decimal) -> bytes:
+    """
+    Encodes a Decimal exactly as a flag byte, an exponent and packed BCD digits
+
+    Parameters
+    ----------
+    value: Decimal
+        The value to encode
+
+    Returns
+    -------
+    bytes
+        The packed representation
+    """
+    sign, digits, exponent = value.as_tuple()
+    kind = _DECIMAL_KINDS.get(exponent, 0) if isinstance(exponent, str) else 0
+    digit_str = ''.join(map(str, digits))
+    if len(digit_str) % 2:
+        digit_str += 'f'
+    return _DECIMAL_HEAD.pack(sign | kind << 1, 0 if kind else exponent) + bytes.fromhex(digit_str)
+
+def unpack_decimal(data: Union[bytes, memoryview]) -> Decimal:
+    """
+    Decodes a Decimal packed by pack_decimal
+
+    Parameters
+    ----------
+    data: Union[bytes, memoryview]
+        The packed representation
+
+    Returns
+    -------
+    Decimal
+        The decoded value
+    """
+    flags, exponent = _DECIMAL_HEAD.unpack_from(data)
+    digits = bytes(data[_DECIMAL_HEAD.size:]).hex().rstrip('f')
+    sign = '-' if flags & 1 else ''
+    kind = flags >> 1
+    if kind:
+        return Decimal(sign + _DECIMAL_SPECIALS[kind] + (digits if kind > 1 else ''))
+    return Decimal(f"{sign}{digits}E{exponent}")
+
+def to_decimal(value: Union[Decimal, float]) -> Decimal:
+    """Converts a float backend value to its shortest round-tripping Decimal for packing"""
+    return Decimal(repr(value)) if isinstance(value, float) else value
+
+def _to_micros(timestamp: dt.datetime) -> int:
+    """Converts a naive datetime to integer microseconds since the epoch"""
+    return (timestamp - EPOCH) // _MICROSECOND
+
+def write_columnar(path: Path, calcs: Iterable[Calculation]) -> None:
+    """
+    Writes Calculations to a columnar history file.
+
+    The file holds one contiguous, 8-byte aligned region per column followed by a
+    JSON footer describing the layout. The operation column is dictionary-encoded
+    as uint16 codes; timestamps (int64 microseconds), precisions (int32) and
+    backends (uint8 index into NUMERIC_BACKENDS) are fixed width; Decimal columns
+    are packed values addressed by a uint64 offset array. Float backend values are
+    packed as their shortest round-tripping Decimal.
+    The file is written to a temporary path and moved into place.
+
+    Parameters
+    ----------
+    path: Path
+        Destination file path
+    calcs: Iterable[Calculation]
+        The records to write, in history order
+    """
+    calcs = list(calcs)
+    dictionary: Dict[str, int] = {}
+    fixed = {
+        'operation': array('H', (dictionary.setdefault(c.operation, len(dictionary)) for c in calcs)),
+        'timestamp': array('q', (_to_micros(c.timestamp) for c in calcs)),
+        'precision': array('i', (int(c.precision) for c in calcs)),
+        'backend': array('B', (NUMERIC_BACKENDS.index(c.backend) for c in calcs)),
+    }
+    packed = {}
+    for name in ('operandx', 'operandy', 'result'):
+        values = [pack_decimal(to_decimal(getattr(c, name))) for c in calcs]
+        offsets = array('Q', [0])
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+        packed[name] = (offsets, b''.join(values))
+
+    columns: Dict[str, Any] = {}
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'wb') as out:
+        out.write(MAGIC)
+
+        def write_aligned(data: Union[bytes, array]) -> int:
+            out.write(b'\0' * (-out.tell() % 8))
+            offset = out.tell()
+            out.write(data)
+            return offset
+
+        for name, column in fixed.items():
+            columns[name] = {'format': column.typecode, 'offset': write_aligned(column)}
+        for name, (offsets, data) in packed.items():
+            columns[name] = {
+                'format': 'packed',
+                'offsets': write_aligned(offsets),
+                'data': write_aligned(data),
+            }
+        footer = json.dumps({
+            'rows': len(calcs),
+            'operations': list(dictionary),
+            'columns': columns,
+        }).encode('utf-8')
+        out.write(footer)
+        out.write(_FOOTER_TAIL.pack(len(footer), MAGIC))
+    os.replace(temp_path, path)
+
+class PackedDecimalColumn:
+    """Lazy, read-only view of a packed Decimal column; values decode on access"""
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        """
+        Configures the view
+
+        Parameters
+        ----------
+        offsets: memoryview
+            The column's uint64 offset array, one entry longer than the row count
+        data: memoryview
+            The column's packed value region
+        """
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        """
+        Get the number of values in the column
+
+        Returns
+        -------
+        int
+            The row count
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Decimal, List[Decimal]]:
+        """
+        Decodes a value by row position, or a list of values by slice
+
+        Parameters
+        ----------
+        index: Union[int, slice]
+            A row position, or a slice of row positions
+
+        Raises
+        ------
+        IndexError
+            If an integer index is out of range
+
+        Returns
+        -------
+        Union[Decimal, List[Decimal]]
+            The decoded value or values
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return unpack_decimal(self._data[self._offsets[index]:self._offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[Decimal]:
+        """
+        Decodes the column in row order
+
+        Returns
+        -------
+        Iterator[Decimal]
+            An iterator over the column values
+        """
+        return (self[i] for i in range(len(self)))
+
+    def release(self) -> None:
+        """Releases the view's buffers"""
+        self._offsets.release()
+        self._data.release()
+
+class ColumnarHistoryReader:
+    """
+    Memory-mapped reader for columnar history files.
+
+    Opening a file maps it and parses only the footer. Column accessors return
+    zero-copy views, so a scan over one column touches only that column's pages,
+    and rows are materialized as Calculations only on request.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Maps a columnar history file
+
+        Parameters
+        ----------
+        path: Path
+            The columnar history file
+
+        Raises
+        ------
+        SerializationError
+            If the file is not a valid columnar history file
+        """
+        with open(path, 'rb') as source:
+            if os.fstat(source.fileno()).st_size < len(MAGIC) + _FOOTER_TAIL.size:
+                raise SerializationError("Invalid columnar history file: file truncated")
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[Any] = []
+        try:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError("bad file signature")
+            footer_length, magic = _FOOTER_TAIL.unpack_from(self._mmap, len(self._mmap) - _FOOTER_TAIL.size)
+            if magic != MAGIC:
+                raise ValueError("bad footer signature")
+            footer_start = len(self._mmap) - _FOOTER_TAIL.size - footer_length
+            footer = json.loads(self._mmap[footer_start:footer_start + footer_length])
+            self.rows: int = footer['rows']
+            self.operations: List[str] = footer['operations']
+            self._columns: Dict[str, Dict[str, Any]] = footer['columns']
+        except (ValueError, KeyError, struct.error) as e:
+            self._mmap.close()
+            raise SerializationError(f"Invalid columnar history file: {e}")
+
+    def _fixed(self, name: str) -> memoryview:
+        """
+        Maps a fixed-width column
+
+        Parameters
+        ----------
+        name: str
+            The column name
+
+        Returns
+        -------
+        memoryview
+            A typed, zero-copy view of the column
+        """
+        column = self._columns[name]
+        width = struct.calcsize(column['format'])
+        raw = memoryview(self._mmap)[column['offset']:column['offset'] + width * self.rows]
+        view = raw.cast(column['format'])
+        self._views += [view, raw]
+        return view
+
+    def column(self, name: str) -> Union[memoryview, PackedDecimalColumn]:
+        """
+        Maps a single column without reading any other
+
+        Parameters
+        ----------
+        name: str
+            One of 'operation' (dictionary codes; see operations), 'timestamp'
+            (microseconds since the epoch), 'precision', 'backend' (NUMERIC_BACKENDS
+            codes), 'operandx', 'operandy' or 'result'
+
+        Raises
+        ------
+        KeyError
+            If the column does not exist
+
+        Returns
+        -------
+        Union[memoryview, PackedDecimalColumn]
+            A typed view for fixed-width columns, or a lazy view for Decimal columns
+        """
+        column = self._columns[name]
+        if column['format'] != 'packed':
+            return self._fixed(name)
+        offsets_raw = memoryview(self._mmap)[column['offsets']:column['offsets'] + 8 * (self.rows + 1)]
+        offsets = offsets_raw.cast('Q')
+        data = memoryview(self._mmap)[column['data']:column['data'] + offsets[self.rows]]
+        decimals = PackedDecimalColumn(offsets, data)
+        self._views += [decimals, offsets_raw]
+        return decimals
+
+    def read(self, start: int = 0, stop: Union[int, None] = None) -> List[Calculation]:
+        """
+        Materializes a range of rows as Calculations
+
+        Parameters
+        ----------
+        start: int, optional
+            First row position. Negative values count from the end
+        stop: Union[int, None], optional
+            Row position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The Calculations in the range, in row order
+        """
+        rows = slice(start, stop)
+        operations = self.operations
+        calcs = [
+            Calculation(operations[code], operandx, operandy, result, precision,
+                        EPOCH + dt.timedelta(microseconds=micros))
+            for code, operandx, operandy, result, precision, micros in zip(
+                self.column('operation')[rows],
+                self.column('operandx')[rows],
+                self.column('operandy')[rows],
+                self.column('result')[rows],
+                self.column('precision')[rows],
+                self.column('timestamp')[rows],
+            )
+        ]
+        if 'backend' in self._columns:
+            # Files written before the backend column hold only Decimal records
+            for calc, code in zip(calcs, self.column('backend')[rows]):
+                if code:
+                    calc.backend = NUMERIC_BACKENDS[code]
+                    calc.operandx, calc.operandy, calc.result = \
+                        float(calc.operandx), float(calc.operandy), float(calc.result)
+        return calcs
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows in the file
+
+        Returns
+        -------
+        int
+            The row count
+        """
+        return self.rows
+
+    def close(self) -> None:
+        """
+        Releases all column views and unmaps the file
+
+        Views obtained from column() are invalid afterwards
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> 'ColumnarHistoryReader':
+        """Enters a context that closes the reader on exit"""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Closes the reader"""
+        self.close()
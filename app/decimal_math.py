@@ -0,0 +1,483 @@
+"""This module provides arbitrary-precision Decimal power and root functions for the Operations module"""
+import math
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+from typing import Iterator, Optional
+
+MAX_RESULT_DIGITS = 100000
+DEFAULT_PLACES = 10
+
+_places: ContextVar[int] = ContextVar('decimal_places', default=DEFAULT_PLACES)
+_GUARD_DIGITS = 10
+_NEWTON_MAX_DEGREE = 1000
+_INTEGER_EXPONENT_DIGITS = 2
+_INTEGER_MAX_DIGITS = 2000
+_ESTIMATE = Context(prec=20)
+
+@contextmanager
+def working_precision(places: int) -> Iterator[None]:
+    """
+    Sets the number of decimal places power and root results are exact to
+
+    Parameters
+    ----------
+    places: int
+        Decimal places, usually CalculatorConfig.precision
+    """
+    token = _places.set(places)
+    try:
+        yield
+    finally:
+        _places.reset(token)
+
+def round_to(value: Decimal, quantizer: Decimal) -> Decimal:
+    """
+    Rounds a value to a quantizer's exponent and strips trailing zeros, however many digits it has
+
+    Parameters
+    ----------
+    value: Decimal
+        The value to round
+    quantizer: Decimal
+        A value with the target exponent, such as Decimal('0.0000000000')
+
+    Returns
+    -------
+    Decimal
+        The rounded, normalized value
+    """
+    context = _sized_context(max(value.adjusted() + 1, 1) - quantizer.as_tuple().exponent)
+    return value.quantize(quantizer, context=context).normalize(context)
+
+def _context(magnitude: int, extra: int = 0) -> Context:
+    """
+    Builds a context with enough significant digits for a result's integer part and decimal places
+
+    Parameters
+    ----------
+    magnitude: int
+        Estimated number of integer digits in the result. Zero or negative for results below 1
+    extra: int, optional
+        Further guard digits
+
+    Returns
+    -------
+    Context
+        The working context
+    """
+    return _sized_context(max(magnitude, 0) + _places.get() + extra)
+
+@lru_cache(maxsize=64)
+def _sized_context(prec: int) -> Context:
+    """
+    Get the shared context with prec significant digits
+
+    Parameters
+    ----------
+    prec: int
+        Significant digits
+
+    Returns
+    -------
+    Context
+        A context allowing exponents a little beyond MAX_RESULT_DIGITS
+    """
+    return Context(prec=prec, rounding=ROUND_HALF_EVEN, Emax=MAX_RESULT_DIGITS + prec, Emin=-MAX_RESULT_DIGITS - prec)
+
+def _log10(x: Decimal) -> float:
+    """
+    Approximates log10(abs(x)) in floating point, for operands beyond the float range too
+
+    Parameters
+    ----------
+    x: Decimal
+        A non-zero value
+
+    Returns
+    -------
+    float
+        The approximate logarithm
+    """
+    exponent = x.adjusted()
+    return exponent + math.log10(float(x.copy_abs().scaleb(-exponent)))
+
+def _magnitude(log10: float, y: float) -> int:
+    """
+    Estimates the number of integer digits in abs(x) ** y
+
+    Parameters
+    ----------
+    log10: float
+        The approximate log10(abs(x)), from _log10
+    y: float
+        The exponent
+
+    Raises
+    ------
+    OverflowError
+        If the result would exceed MAX_RESULT_DIGITS digits
+
+    Returns
+    -------
+    int
+        The estimated digit count, rounded up. Below -MAX_RESULT_DIGITS for results that round to zero
+    """
+    estimate = y * log10 if log10 else 0.0
+    if estimate > MAX_RESULT_DIGITS:
+        raise OverflowError(f"Result exceeds {MAX_RESULT_DIGITS} digits")
+    return math.ceil(max(estimate, -2.0 * MAX_RESULT_DIGITS)) + 1
+
+def _strip(value: Decimal) -> Decimal:
+    """
+    Removes trailing fractional zeros and writes out positive exponents, giving plain notation
+
+    Parameters
+    ----------
+    value: Decimal
+        A finite result
+
+    Returns
+    -------
+    Decimal
+        An equal value with the shortest plain representation
+    """
+    sign, digits, exponent = value.as_tuple()
+    if exponent > 0:
+        return Decimal((sign, digits + (0,) * exponent, 0))
+    if exponent == 0 or digits[-1]:
+        return value
+    significant = ''.join(map(str, digits)).rstrip('0') or '0'
+    shift = min(len(digits) - len(significant), -exponent)
+    return Decimal((sign, digits[:len(digits) - shift], exponent + shift))
+
+def _plain(value: Decimal, context: Context) -> Decimal:
+    """
+    Strips trailing fractional zeros like _strip, through the cheaper Context.normalize for non-integral values
+
+    Parameters
+    ----------
+    value: Decimal
+        A finite result
+    context: Context
+        A context with at least as many digits as value
+
+    Returns
+    -------
+    Decimal
+        An equal value with the shortest plain representation
+    """
+    if value == value.to_integral_value():
+        return _strip(value)
+    return context.normalize(value)
+
+def power(x: Decimal, y: Decimal) -> Decimal:
+    """
+    Raises x to the power y, exact to the working precision's decimal places
+
+    Integral exponents below 10 ** _INTEGER_EXPONENT_DIGITS raise the base
+    exactly, in integer arithmetic for integral bases, and round once. Larger
+    integral exponents use exact integer arithmetic for integral bases, and
+    exponentiation by squaring otherwise. Exponents that are reciprocals of
+    integers are taken as roots. Other fractional exponents use exp(y * ln(x)).
+
+    Parameters
+    ----------
+    x: Decimal
+        Base operand
+    y: Decimal
+        Exponent operand
+
+    Raises
+    ------
+    ValueError
+        If x is negative and y is fractional
+    OverflowError
+        If the result would exceed MAX_RESULT_DIGITS digits
+
+    Returns
+    -------
+    Decimal
+        The value of x ** y
+    """
+    if x == 0:
+        return Decimal(0)
+    if y.adjusted() < _INTEGER_EXPONENT_DIGITS:
+        exponent, denominator = y.as_integer_ratio()
+        if denominator == 1 and abs(exponent) * (abs(x.adjusted()) + 1) <= MAX_RESULT_DIGITS:
+            return _integer_power(x, exponent)
+    if 0 < y <= MAX_RESULT_DIGITS:
+        # Positive integral powers of integers are computed exactly in integer arithmetic
+        exponent, base = int(y), int(x)
+        if exponent == y and base == x and exponent * (x.adjusted() + 1) <= MAX_RESULT_DIGITS:
+            return Decimal(base ** exponent)
+    magnitude = _magnitude(_log10(x), float(y))
+    if magnitude < -MAX_RESULT_DIGITS:
+        return Decimal(0)
+    if y == y.to_integral_value():
+        exponent = int(y)
+        if x == x.to_integral_value():
+            exact = Decimal(int(x) ** abs(exponent))
+            if exponent > 0:
+                return exact
+            return _strip(_context(magnitude).divide(1, exact))
+        context = _context(magnitude, _GUARD_DIGITS + len(str(abs(exponent))))
+        result = _square_and_multiply(x, abs(exponent), context)
+        if exponent < 0:
+            result = context.divide(1, result)
+        return _strip(_context(magnitude).plus(result))
+    if x < 0:
+        raise ValueError("Fractional powers of negative numbers are not supported")
+    reciprocal = Decimal(1) / y
+    if reciprocal == reciprocal.to_integral_value():
+        return root(x, reciprocal)
+    context = _context(magnitude, _GUARD_DIGITS)
+    result = context.exp(context.multiply(y, context.ln(x)))
+    return _strip(_context(magnitude).plus(result))
+
+def _integer_power(x: Decimal, exponent: int) -> Decimal:
+    """
+    Raises x to a small integral power exactly, rounding only the final result
+
+    Integral bases are raised in integer arithmetic. Results keep one integer digit
+    more than they have, as many as the floating point estimate of power gives them
+
+    Parameters
+    ----------
+    x: Decimal
+        A non-zero base
+    exponent: int
+        The exponent, with abs(exponent) * (abs(x.adjusted()) + 1) within MAX_RESULT_DIGITS
+
+    Returns
+    -------
+    Decimal
+        The value of x ** exponent
+    """
+    numerator, denominator = x.as_integer_ratio()
+    if denominator == 1:
+        exact = abs(numerator) ** abs(exponent)
+        result = Decimal(exact) if exponent > 0 else _reciprocal(exact)
+        return result.copy_negate() if numerator < 0 and exponent % 2 else result
+    exact = _sized_context(MAX_RESULT_DIGITS).power(x, abs(exponent))
+    if exponent > 0:
+        context = _context(exact.adjusted() + 2)
+        return _plain(context.plus(exact), context)
+    context = _context(1 - exact.adjusted())
+    return _plain(context.divide(1, exact), context)
+
+def _reciprocal(n: int) -> Decimal:
+    """
+    Divides 1 by a positive integer, to the digits power and root results keep
+
+    Parameters
+    ----------
+    n: int
+        The divisor
+
+    Returns
+    -------
+    Decimal
+        The value of 1 / n, with trailing zeros stripped
+    """
+    context = _sized_context(_places.get() + (n < 10))
+    return context.normalize(context.divide(1, n))
+
+def _square_and_multiply(x: Decimal, exponent: int, context: Context) -> Decimal:
+    """
+    Computes x ** exponent by repeated squaring
+
+    Parameters
+    ----------
+    x: Decimal
+        The base
+    exponent: int
+        A positive integral exponent
+    context: Context
+        The working context, with guard digits for the rounding of each step
+
+    Returns
+    -------
+    Decimal
+        The power, rounded to the context
+    """
+    result = Decimal(1)
+    base = x
+    while exponent:
+        if exponent & 1:
+            result = context.multiply(result, base)
+        exponent >>= 1
+        if exponent:
+            base = context.multiply(base, base)
+    return result
+
+def root(x: Decimal, y: Decimal) -> Decimal:
+    """
+    Takes the yth root of x, exact to the working precision's decimal places
+
+    Integral degrees below 10 ** _INTEGER_EXPONENT_DIGITS take an integer root
+    of the scaled radicand, with math.isqrt for square roots. Larger ones use
+    Newton iteration from a floating point estimate. Both return exact values
+    for perfect powers. Fractional and very large degrees use exp(ln(x) / y).
+    Negative x yields the negated root of abs(x).
+
+    Parameters
+    ----------
+    x: Decimal
+        Radicand operand
+    y: Decimal
+        Degree operand. Must not be zero
+
+    Raises
+    ------
+    OverflowError
+        If the result would exceed MAX_RESULT_DIGITS digits
+
+    Returns
+    -------
+    Decimal
+        The yth root of x
+    """
+    if x == 0:
+        return Decimal(0)
+    base = x.copy_abs()
+    if y.adjusted() < _INTEGER_EXPONENT_DIGITS:
+        degree, denominator = y.as_integer_ratio()
+        result = _integer_root(base, degree) if denominator == 1 else None
+        if result is not None:
+            return result.copy_negate() if x < 0 else result
+    log10 = _log10(base)
+    magnitude = _magnitude(log10, 1 / float(y))
+    if y != y.to_integral_value() or abs(y) > _NEWTON_MAX_DEGREE:
+        context = _context(magnitude, _GUARD_DIGITS)
+        result = context.exp(context.divide(context.ln(base), y))
+    else:
+        degree = abs(int(y))
+        result = _newton_root(base, degree, log10 / degree, magnitude)
+        if y < 0:
+            result = _context(magnitude, _GUARD_DIGITS).divide(1, result)
+    result = _strip(_context(magnitude).plus(result))
+    return -result if x < 0 else result
+
+def _integer_root(x: Decimal, degree: int) -> Optional[Decimal]:
+    """
+    Computes the degree-th root of x in integer arithmetic, rounding only the final result
+
+    The integer root of the radicand's integer ratio, scaled by a power of ten, holds
+    every digit the result keeps plus guard digits. It is exact for perfect powers
+
+    Parameters
+    ----------
+    x: Decimal
+        A positive radicand
+    degree: int
+        A non-zero degree. Negative degrees give the reciprocal of the root
+
+    Returns
+    -------
+    Optional[Decimal]
+        The root, or None if the scaled radicand would exceed _INTEGER_MAX_DIGITS digits
+    """
+    places = _places.get()
+    size = abs(degree)
+    adjusted = x.adjusted()
+    if size * (places + 4) + abs(adjusted) > _INTEGER_MAX_DIGITS:
+        return None
+    numerator, denominator = x.as_integer_ratio()
+    if denominator == 1:
+        floor = math.isqrt(numerator) if size == 2 else _floor_root(numerator, size)
+        if floor ** size == numerator:
+            return Decimal(floor) if degree > 0 else _reciprocal(floor)
+    if degree < 0:
+        numerator, denominator, adjusted = denominator, numerator, -adjusted - 1
+    shift = places + 3 + max(-(adjusted // size), 0)
+    radicand, remainder = divmod(numerator * 10 ** (size * shift), denominator)
+    scaled = math.isqrt(radicand) if size == 2 else _floor_root(radicand, size)
+    # A trailing 1 marks inexact roots, so they never round as ties. As in power, the
+    # result keeps one integer digit more than it has
+    inexact = bool(remainder) or scaled ** size != radicand
+    context = _context(len(str(scaled)) - shift + 1)
+    return _plain(context.divide(scaled * 10 + inexact, 10 ** (shift + 1)), context)
+
+def _floor_root(n: int, degree: int) -> int:
+    """
+    Computes the integer part of the degree-th root of n by integer Newton iteration
+
+    Starts above the root, so the iterates decrease to it: from a floating point
+    estimate raised past its rounding error while n is in the float range, and from
+    a power of two otherwise
+
+    Parameters
+    ----------
+    n: int
+        A positive integer
+    degree: int
+        A positive degree
+
+    Returns
+    -------
+    int
+        The largest integer whose degree-th power is at most n
+    """
+    if n.bit_length() < 1000:
+        root = int(float(n) ** (1 / degree) * (1 + 1e-12)) + 1
+    else:
+        root = 1 << -(-n.bit_length() // degree)
+    while True:
+        estimate = ((degree - 1) * root + n // root ** (degree - 1)) // degree
+        if estimate >= root:
+            return root
+        root = estimate
+
+def _newton_root(x: Decimal, degree: int, log10: float, magnitude: int) -> Decimal:
+    """
+    Computes the positive degree-th root of x by Newton iteration
+
+    Starts from a floating point estimate and doubles the working precision each
+    step until it reaches the result's required precision plus guard digits.
+    Returns the exact root when x is a perfect power.
+
+    Parameters
+    ----------
+    x: Decimal
+        A positive radicand
+    degree: int
+        A positive integral degree
+    log10: float
+        The approximate log10 of the root
+    magnitude: int
+        Estimated number of integer digits in the root
+
+    Returns
+    -------
+    Decimal
+        The root
+    """
+    if degree == 1:
+        return x
+    scale = math.floor(log10)
+    estimate = Decimal(10 ** (log10 - scale)).scaleb(scale)
+    if 0 < log10 < 15 and x == x.to_integral_value():
+        candidate = round(estimate)
+        if candidate ** degree == int(x):
+            return Decimal(candidate)
+    target = _context(magnitude, _GUARD_DIGITS).prec
+    if degree == 2:
+        estimate = _sized_context(target).sqrt(x)
+    prec = 15 if degree != 2 else target
+    while prec < target:
+        prec = min(2 * prec, target)
+        context = _sized_context(prec)
+        # One Newton step doubles the correct digits, and a second absorbs the rounding of the first
+        for _ in range(2):
+            step = context.divide(x, context.power(estimate, degree - 1))
+            estimate = context.divide(context.add(context.multiply(degree - 1, estimate), step), degree)
+    rounded = _context(magnitude).plus(estimate)
+    candidate = _strip(rounded)
+    if candidate is rounded:
+        return estimate
+    # Trailing zeros suggest a perfect power, confirmed with an exact power
+    exact = Context(prec=len(candidate.as_tuple().digits) * degree + 1)
+    return candidate if exact.power(candidate, degree) == x else estimate
@@ -1,4 +1,6 @@
 """This module provides a family of exceptions for calculation-related errors"""
+from itertools import islice
+from typing import Any, Dict, Tuple
 
 class CalculatorError(Exception):
     """Base exception class for errors concerning Calculator components"""
@@ -24,3 +26,25 @@ class SerializationError(CalculatorError):
 class ValidationError(CalculatorError):
     """Raised when invalid operands are passed to the Operation module"""
     pass
+
+class BatchValidationError(ValidationError):
+    """
+    Raised when a batch of inputs contains invalid values, reporting every one of them
+
+    Attributes
+    ----------
+    errors: Dict[int, str]
+        The validation error message for each invalid value, keyed by its index in the batch
+    """
+    max_reported = 5
+
+    def __init__(self, errors: Dict[int, str]) -> None:
+        self.errors = errors
+        reported = [f"[{index}] {message}" for index, message in islice(errors.items(), self.max_reported)]
+        if len(errors) > self.max_reported:
+            reported.append(f"and {len(errors) - self.max_reported} more")
+        super().__init__(f"{len(errors)} invalid values: {'; '.join(reported)}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickles the error by its errors mapping, which the constructor takes"""
+        return (self.__class__, (self.errors,))
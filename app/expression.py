@@ -0,0 +1,399 @@
+"""This module provides a compiler for infix expressions over the registered Operations"""
+import re
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Mapping, Optional, Tuple
+
+from app.decimal_math import DEFAULT_PLACES, working_precision
+from app.exceptions import ValidationError
+from app.operations import OperationFactory
+
+Evaluator = Callable[[Mapping[str, Decimal]], Decimal]
+
+_TOKEN = re.compile(r'\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\S))')
+_INFIX = {'+': 'add', '-': 'subtract', '*': 'multiply', '/': 'divide', '^': 'power'}
+_FOLD_ERRORS = (ValidationError, ArithmeticError, ValueError, OverflowError)
+
+class CompiledExpression:
+    """
+    An expression compiled into nested closures, ready for repeated evaluation.
+
+    Operations are resolved through OperationFactory once, at compile time, and
+    subexpressions without variables are evaluated once and stored as constants.
+    """
+
+    def __init__(self, source: str, evaluator: Evaluator, variables: FrozenSet[str], literals: Tuple[Decimal, ...]) -> None:
+        """
+        Wraps a compiled expression
+
+        Parameters
+        ----------
+        source: str
+            The expression text
+        evaluator: Evaluator
+            The compiled expression, taking variable bindings
+        variables: FrozenSet[str]
+            The names the expression needs bound
+        literals: Tuple[Decimal, ...]
+            The numeric literals written in the expression
+        """
+        self.source = source
+        self.variables = variables
+        self.literals = literals
+        self._evaluator = evaluator
+
+    def evaluate(self, bindings: Optional[Mapping[str, Decimal]] = None, **kwargs: Decimal) -> Decimal:
+        """
+        Evaluates the expression
+
+        Parameters
+        ----------
+        bindings: Optional[Mapping[str, Decimal]], optional
+            Values for the expression's variables
+        kwargs: Decimal
+            Further variable values, by name
+
+        Raises
+        ------
+        ValidationError
+            If a variable is unbound, or an Operation rejects its operands
+
+        Returns
+        -------
+        Decimal
+            The expression's value
+        """
+        env = {**bindings, **kwargs} if bindings else kwargs
+        missing = self.variables.difference(env)
+        if missing:
+            raise ValidationError(f"Unbound variables: {', '.join(sorted(missing))}")
+        return self._evaluator(env)
+
+    def __repr__(self) -> str:
+        """
+        Generate a string representation of this expression
+
+        Returns
+        -------
+        str
+            The expression source
+        """
+        return f"CompiledExpression({self.source!r})"
+
+class _Parser:
+    """Recursive-descent parser producing compiled evaluators, folding constant subexpressions"""
+
+    def __init__(self, source: str) -> None:
+        """
+        Tokenizes the source
+
+        Parameters
+        ----------
+        source: str
+            The expression text
+        """
+        self.tokens = self._tokenize(source)
+        self.position = 0
+        self.variables: set = set()
+        self.literals: List[Decimal] = []
+
+    @staticmethod
+    def _tokenize(source: str) -> List[Tuple[str, str]]:
+        """
+        Splits the source into tokens
+
+        Parameters
+        ----------
+        source: str
+            The expression text
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            ('num' | 'name' | 'sym', text) pairs, in source order
+        """
+        tokens = []
+        for number, name, symbol in _TOKEN.findall(source):
+            if number:
+                tokens.append(('num', number))
+            elif name:
+                tokens.append(('name', name))
+            else:
+                tokens.append(('sym', symbol))
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        """
+        Get the next token without consuming it
+
+        Returns
+        -------
+        Optional[Tuple[str, str]]
+            The next token, or None at the end of input
+        """
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self, symbol: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Consumes the next token
+
+        Parameters
+        ----------
+        symbol: Optional[str], optional
+            The symbol the token must be. Any token is accepted if not passed
+
+        Raises
+        ------
+        ValidationError
+            If the input has ended, or the token is not symbol
+
+        Returns
+        -------
+        Tuple[str, str]
+            The consumed token
+        """
+        token = self._peek()
+        if token is None:
+            raise ValidationError("Invalid expression: unexpected end of input")
+        if symbol is not None and token != ('sym', symbol):
+            raise ValidationError(f"Invalid expression: expected '{symbol}' but found '{token[1]}'")
+        self.position += 1
+        return token
+
+    def parse(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses the whole source
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a complete expression, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The expression's evaluator, and its value if the expression is constant, or None
+        """
+        node = self._sum()
+        token = self._peek()
+        if token is not None:
+            raise ValidationError(f"Invalid expression: unexpected '{token[1]}'")
+        return node
+
+    def _sum(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses a sum node: sum := product (('+' | '-') product)*
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a sum, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        node = self._product()
+        while self._peek() in (('sym', '+'), ('sym', '-')):
+            symbol = self._take()[1]
+            node = self._apply(_INFIX[symbol], node, self._product())
+        return node
+
+    def _product(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses a product node: product := unary (('*' | '/') unary)*
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a product, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        node = self._unary()
+        while self._peek() in (('sym', '*'), ('sym', '/')):
+            symbol = self._take()[1]
+            node = self._apply(_INFIX[symbol], node, self._unary())
+        return node
+
+    def _unary(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses a unary node: unary := ('-' | '+') unary | power
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a signed term, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        if self._peek() == ('sym', '-'):
+            self._take()
+            evaluate, constant = self._unary()
+            if constant is not None:
+                return self._constant(-constant)
+            return (lambda env: -evaluate(env)), None
+        if self._peek() == ('sym', '+'):
+            self._take()
+            return self._unary()
+        return self._power()
+
+    def _power(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses a power node: power := atom ('^' unary)?
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a power, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        node = self._atom()
+        if self._peek() == ('sym', '^'):
+            self._take()
+            node = self._apply(_INFIX['^'], node, self._unary())
+        return node
+
+    def _atom(self) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Parses a atom node: atom := number | name | name '(' sum ',' sum ')' | '(' sum ')'
+
+        Raises
+        ------
+        ValidationError
+            If the tokens do not form a number, variable, call or parenthesized expression, or name an unknown operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        kind, text = self._take()
+        if kind == 'num':
+            value = Decimal(text)
+            self.literals.append(value)
+            return self._constant(value)
+        if kind == 'name':
+            if self._peek() == ('sym', '('):
+                self._take()
+                left = self._sum()
+                self._take(',')
+                right = self._sum()
+                self._take(')')
+                return self._apply(text, left, right)
+            self.variables.add(text)
+            return (lambda env: env[text]), None
+        if text == '(':
+            node = self._sum()
+            self._take(')')
+            return node
+        raise ValidationError(f"Invalid expression: unexpected '{text}'")
+
+    @staticmethod
+    def _constant(value: Decimal) -> Tuple[Evaluator, Decimal]:
+        """
+        Builds a node for a known value
+
+        Parameters
+        ----------
+        value: Decimal
+            The node's value
+
+        Returns
+        -------
+        Tuple[Evaluator, Decimal]
+            An evaluator returning value, and value itself
+        """
+        return (lambda env: value), value
+
+    @classmethod
+    def _apply(
+        cls,
+        name: str,
+        left: Tuple[Evaluator, Optional[Decimal]],
+        right: Tuple[Evaluator, Optional[Decimal]]
+    ) -> Tuple[Evaluator, Optional[Decimal]]:
+        """
+        Builds an Operation node, folding it when both operands are constant
+
+        A fold that fails is left to evaluation time, where the failure is reported normally
+
+        Parameters
+        ----------
+        name: str
+            The operation name or alias, as registered with OperationFactory
+        left: Tuple[Evaluator, Optional[Decimal]]
+            The node of the first operand
+        right: Tuple[Evaluator, Optional[Decimal]]
+            The node of the second operand
+
+        Raises
+        ------
+        ValidationError
+            If name is not a registered operation
+
+        Returns
+        -------
+        Tuple[Evaluator, Optional[Decimal]]
+            The node's evaluator, and its value if it is constant, or None
+        """
+        try:
+            execute = OperationFactory.get_executor(name)
+        except ValueError:
+            raise ValidationError(f"Invalid expression: unknown operation '{name}'")
+        (evaluate_left, constant_left), (evaluate_right, constant_right) = left, right
+        if constant_left is not None and constant_right is not None:
+            try:
+                return cls._constant(execute(constant_left, constant_right))
+            except _FOLD_ERRORS:
+                pass
+        return (lambda env: execute(evaluate_left(env), evaluate_right(env))), None
+
+@lru_cache(maxsize=256)
+def compile_expression(source: str, places: int = DEFAULT_PLACES) -> CompiledExpression:
+    """
+    Compiles an infix expression, reusing the cached result for repeated sources
+
+    Supports numbers, variables, parentheses, unary minus, the infix operators
+    + - * / ^ (^ binds tightest and is right-associative), and two-argument calls
+    to any registered operation, such as root(8, 3). Operations are resolved when
+    an expression is first compiled; call compile_expression.cache_clear() after
+    re-registering an operation name. Constant subexpressions are folded with
+    power and root results exact to places decimal places, so evaluate the
+    expression under the same working_precision.
+
+    Parameters
+    ----------
+    source: str
+        The expression text
+    places: int, optional
+        The working precision for constant folding, usually CalculatorConfig.precision
+
+    Raises
+    ------
+    ValidationError
+        If the expression is malformed or names an unknown operation
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled expression
+    """
+    parser = _Parser(source)
+    if not parser.tokens:
+        raise ValidationError("Invalid expression: empty expression")
+    with working_precision(places):
+        evaluator, _ = parser.parse()
+    return CompiledExpression(source, evaluator, frozenset(parser.variables), tuple(parser.literals))
@@ -1,10 +1,14 @@
 """This module implements the Observer pattern to manage logging and saving"""
 import logging as log
+import threading
+import time
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 from app.calculation import Calculation
+from app.calculator_memento import CalculatorMemento
+from app.exceptions import OperationError
 
 class HistoryObserver(ABC):
     """
@@ -24,8 +28,49 @@ class HistoryObserver(ABC):
         """
         pass # pragma: no cover
 
+    def update_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Handle a batch of new calculations
+
+        Override where a batch can be handled more cheaply than one update per record
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations passed for logging/saving, in execution order
+        """
+        [self.update(calc) for calc in calcs]
+
+    def update_event(self, event: str, memento: Optional[CalculatorMemento]) -> None:
+        """
+        Handle a history change that does not add a calculation
+
+        Ignored by default. Override for observers that track the full history state
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento]
+            The history delta applied by an undo or redo
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release resources and complete pending work before shutdown
+
+        Does nothing by default. Override for observers that defer work
+        """
+        pass
+
 class LoggingObserver(HistoryObserver):
-    """Concrete observer responsible for Calculation logging."""
+    """
+    Concrete observer responsible for Calculation logging.
+
+    Messages use deferred %-style arguments, so records filtered out by the log
+    level are never formatted.
+    """
     def update(self, calc: Calculation) -> None:
         """
         Adds a calculation to the log.
@@ -43,9 +88,30 @@ class LoggingObserver(HistoryObserver):
         if not calc:
             raise AttributeError("Error: NoneType passed to LoggingObserver")
         log.info(
-            f"Calculation executed: {calc.operation} "
-            f"({calc.operandx}, {calc.operandy}) = "
-            f"{calc.result}"
+            "Calculation executed: %s (%s, %s) = %s",
+            calc.operation, calc.operandx, calc.operandy, calc.result
+        )
+
+    def update_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Adds a summary of a calculation batch to the log.
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations passed for logging
+
+        Raises
+        ------
+        AttributeError
+            if the Observer is called without any Calculations
+        """
+        if not calcs:
+            raise AttributeError("Error: Empty batch passed to LoggingObserver")
+        last = calcs[-1]
+        log.info(
+            "Batch executed: %d x %s, last (%s, %s) = %s",
+            len(calcs), calcs[0].operation, last.operandx, last.operandy, last.result
         )
 
 class AutoSaveObserver(HistoryObserver):
@@ -58,7 +124,8 @@ class AutoSaveObserver(HistoryObserver):
         ----------
         calc: Any
             A link to the implementing Calculator instance
-                Must have the 'config' and 'save_history' attributes
+                Must have the 'config' and 'save_history' attributes, and a 'journal'
+                attribute when config.auto_save_mode is 'journal'
 
         Raises
         ------
@@ -86,7 +153,326 @@ class AutoSaveObserver(HistoryObserver):
         if not calc:
             raise AttributeError("Error: NoneType passed to AutoSaveObserver")
         if self.calculator.config.auto_save:
-            self.calculator.save_history()
+            self._save([calc])
             log.info("Auto-save Completed")
 
+    def update_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Execute a single auto-save covering a batch of Calculations.
 
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations passed for saving
+
+        Raises
+        ------
+        AttributeError
+            if the Observer is called without any Calculations
+        """
+        if not calcs:
+            raise AttributeError("Error: Empty batch passed to AutoSaveObserver")
+        if self.calculator.config.auto_save:
+            self._save(calcs)
+            log.info(f"Auto-save Completed: batch of {len(calcs)}")
+
+    def update_event(self, event: str, memento: Optional[CalculatorMemento]) -> None:
+        """
+        Journal an undo, redo or clear marker.
+
+        Only journal mode saves these events; full mode leaves them to the next save.
+        Undoing or redoing a wholesale history replacement compacts the journal instead
+        of copying the replaced history into it.
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento]
+            The history delta applied by an undo or redo
+        """
+        config = self.calculator.config
+        if not config.auto_save or config.auto_save_mode != 'journal':
+            return
+        if memento is not None and memento.cleared is not None:
+            self.calculator.save_history()
+            log.info("Auto-save Completed: journal compacted")
+            return
+        self.calculator.journal.record(event, memento)
+        self._compact_if_due()
+
+    def _save(self, calcs: List[Calculation]) -> None:
+        """
+        Saves new Calculations according to config.auto_save_mode
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The new Calculations, in execution order
+        """
+        if self.calculator.config.auto_save_mode == 'journal':
+            self.calculator.journal.append(calcs)
+            self._compact_if_due()
+        else:
+            self.calculator.save_history()
+
+    def _compact_if_due(self) -> None:
+        """Rewrites the history file, resetting the journal, once it reaches the compaction interval"""
+        if self.calculator.journal.record_count >= self.calculator.config.journal_compact_interval:
+            self.calculator.save_history()
+            log.info("History journal compacted")
+
+class AsyncAutoSaveObserver(AutoSaveObserver):
+    """
+    Concrete observer implementing the autosave function on a background thread.
+
+    Notifications only mark the history dirty. A worker thread coalesces bursts of
+    changes into a single save, issued once no change has arrived for
+    config.auto_save_debounce seconds, or config.auto_save_max_latency seconds after
+    the first unsaved change, whichever is sooner. In 'full' mode a save rewrites the
+    history file once; in 'journal' mode the pending changes are journaled in order,
+    with consecutive Calculations merged into one journal record, and a failed
+    journal write is repaired by a full save. A failed save is
+    re-raised on the next notification, flush or close, after that notification
+    has been scheduled.
+    """
+    def __init__(self, calc: Any):
+        """
+        Configures the AsyncAutoSaveObserver and starts its worker thread
+
+        Parameters
+        ----------
+        calc: Any
+            A link to the implementing Calculator instance
+                Must have the 'config' and 'save_history' attributes, and a 'journal'
+                attribute when config.auto_save_mode is 'journal'
+
+        Raises
+        ------
+        TypeError
+            if the implementing Calculator isn't properly configured
+        """
+        super().__init__(calc)
+        self.save_count = 0
+        self.error: Optional[Exception] = None
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[str, Any]] = []
+        self._dirty_since: Optional[float] = None
+        self._last_change = 0.0
+        self._saving = False
+        self._flush_requested = False
+        self._closed = False
+        self._exited = False
+        self._resync = False
+        self._worker = threading.Thread(target=self._run, name="AsyncAutoSave", daemon=True)
+        self._worker.start()
+
+    def update(self, calc: Calculation) -> None:
+        """
+        Schedule an auto-save.
+
+        Parameters
+        ----------
+        calc: Calculation
+            The Calculation passed for saving
+
+        Raises
+        ------
+        AttributeError
+            if the Observer is called without a Calculation argument
+        OperationError
+            if a previous background save failed
+        """
+        if not calc:
+            raise AttributeError("Error: NoneType passed to AsyncAutoSaveObserver")
+        self._mark_dirty('calcs', [calc])
+
+    def update_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Schedule an auto-save covering a batch of Calculations.
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations passed for saving
+
+        Raises
+        ------
+        AttributeError
+            if the Observer is called without any Calculations
+        OperationError
+            if a previous background save failed
+        """
+        if not calcs:
+            raise AttributeError("Error: Empty batch passed to AsyncAutoSaveObserver")
+        self._mark_dirty('calcs', list(calcs))
+
+    def update_event(self, event: str, memento: Optional[CalculatorMemento]) -> None:
+        """
+        Schedule an auto-save after an undo, redo or clear.
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento]
+            The history delta applied by an undo or redo
+
+        Raises
+        ------
+        OperationError
+            if a previous background save failed
+        """
+        self._mark_dirty('event', (event, memento))
+
+    def flush(self) -> None:
+        """
+        Saves any pending changes immediately and waits for the save to finish
+
+        Raises
+        ------
+        OperationError
+            if the save, or a previous background save, failed
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while (self._dirty_since is not None or self._saving) and not self._exited:
+                self._condition.wait()
+            self._flush_requested = False
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Flushes pending changes and stops the worker thread
+
+        Raises
+        ------
+        OperationError
+            if the final save, or a previous background save, failed
+        """
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._worker.join()
+
+    def _mark_dirty(self, kind: str, payload: Any) -> None:
+        """
+        Records an unsaved change and wakes the worker, then reports any earlier failure
+
+        Parameters
+        ----------
+        kind: str
+            'calcs' for Calculations, or 'event' for other history changes
+        payload: Any
+            The Calculations, or the (event, memento) pair. Kept only in journal mode
+
+        Raises
+        ------
+        OperationError
+            if a previous background save failed
+        """
+        config = self.calculator.config
+        if config.auto_save:
+            with self._condition:
+                if config.auto_save_mode == 'journal':
+                    self._pending.append((kind, payload))
+                now = time.monotonic()
+                if self._dirty_since is None:
+                    self._dirty_since = now
+                self._last_change = now
+                self._condition.notify_all()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """
+        Reports a failed background save once
+
+        Raises
+        ------
+        OperationError
+            if a background save failed since the last report
+        """
+        error, self.error = self.error, None
+        if error is not None:
+            raise OperationError(f"Auto-save failed: {error}")
+
+    def _write(self, pending: List[Tuple[str, Any]]) -> None:
+        """
+        Saves the changes collected since the last save
+
+        Parameters
+        ----------
+        pending: List[Tuple[str, Any]]
+            Journal mode changes, in the order they were made. Empty in full mode
+
+        After a failed journal mode save, the journal may be missing changes, so the
+        next save rewrites the history file instead
+        """
+        if self.calculator.config.auto_save_mode != 'journal' or self._resync:
+            self.calculator.save_history()
+            self._resync = False
+            return
+        calcs: List[Calculation] = []
+        for kind, payload in pending:
+            if kind == 'calcs':
+                calcs += payload
+                continue
+            if calcs:
+                self._save(calcs)
+                calcs = []
+            AutoSaveObserver.update_event(self, *payload)
+        if calcs:
+            self._save(calcs)
+
+    def _run(self) -> None:
+        """Worker loop: waits out the debounce window, then saves"""
+        config = self.calculator.config
+        with self._condition:
+            try:
+                while True:
+                    while self._dirty_since is None and not self._closed:
+                        self._condition.wait()
+                    if self._dirty_since is None:
+                        return
+                    if not (self._flush_requested or self._closed):
+                        deadline = min(self._last_change + config.auto_save_debounce,
+                                       self._dirty_since + config.auto_save_max_latency)
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            self._condition.wait(remaining)
+                            continue
+                    pending, self._pending = self._pending, []
+                    self._dirty_since = None
+                    self._saving = True
+                    self._condition.release()
+                    try:
+                        self._save_pending(pending)
+                    finally:
+                        self._condition.acquire()
+                        self._saving = False
+                        self._condition.notify_all()
+            finally:
+                self._exited = True
+                self._condition.notify_all()
+
+    def _save_pending(self, pending: List[Tuple[str, Any]]) -> None:
+        """
+        Runs one background save, keeping any failure for later report
+
+        Parameters
+        ----------
+        pending: List[Tuple[str, Any]]
+            Journal mode changes, in the order they were made
+        """
+        try:
+            self._write(pending)
+            self.save_count += 1
+            log.info("Auto-save Completed: background")
+        except Exception as e:
+            self.error = e
+            self._resync = True
+            log.error(f"Background Auto-save Failed: {e}")
@@ -0,0 +1,119 @@
+"""This module provides an append-only journal for incremental history autosaves"""
+import json
+import logging as log
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
+from app.calculator_memento import CalculatorMemento
+from app.exceptions import SerializationError
+
+class HistoryJournal:
+    """
+    Append-only log of history changes made since the last full history save.
+
+    Each change is written as one JSON line: 'append' records carry the new
+    Calculations, 'undo' and 'redo' records carry the memento delta they applied,
+    and 'clear' records mark a history wipe. Replaying the journal over the
+    canonical history file reproduces the in-memory history.
+    """
+
+    def __init__(self, path: Path, encoding: str = 'utf-8') -> None:
+        """
+        Configures the journal
+
+        Parameters
+        ----------
+        path: Path
+            Location of the journal file
+        encoding: str, optional
+            Text encoding for the journal file
+        """
+        self.path = path
+        self.encoding = encoding
+        self.record_count = 0
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """
+        Appends a single record to the journal file
+
+        Parameters
+        ----------
+        record: Dict[str, Any]
+            The JSON-serializable record to append
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding=self.encoding) as journal:
+            journal.write(json.dumps(record, default=str) + '\n')
+        self.record_count += 1
+
+    def append(self, calcs: List[Calculation]) -> None:
+        """
+        Records Calculations appended to history
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The new Calculations, in execution order
+        """
+        self._write({'event': 'append', 'calculations': [calc.to_dict() for calc in calcs]})
+
+    def record(self, event: str, memento: Optional[CalculatorMemento] = None) -> None:
+        """
+        Records an undo, redo or clear marker
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento], optional
+            The history delta applied by an undo or redo
+        """
+        record: Dict[str, Any] = {'event': event}
+        if memento is not None:
+            record['memento'] = memento.to_dict()
+        self._write(record)
+
+    def replay(self, history: CalculationHistory, max_size: int) -> None:
+        """
+        Applies journaled changes to a history loaded from the canonical file
+
+        Unreadable records, such as a line truncated by a crash, are skipped with a warning
+
+        Parameters
+        ----------
+        history: CalculationHistory
+            The canonical history state. Modified in place
+        max_size: int
+            The history size bound applied to appended Calculations
+        """
+        self.record_count = 0
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding=self.encoding) as journal:
+            for line_number, line in enumerate(journal, 1):
+                try:
+                    record = json.loads(line)
+                    match record['event']:
+                        case 'append':
+                            history.extend(
+                                Calculation.from_dict(calc) for calc in record['calculations'])
+                            history.drop_left(len(history) - max_size)
+                        case 'undo':
+                            CalculatorMemento.from_dict(record['memento']).revert(history)
+                        case 'redo':
+                            CalculatorMemento.from_dict(record['memento']).apply(history)
+                        case 'clear':
+                            history.clear()
+                        case _:
+                            raise KeyError(record['event'])
+                except (ValueError, KeyError, TypeError, SerializationError) as e:
+                    log.warning(f"Skipped unreadable journal record {line_number}: {e}")
+                self.record_count += 1
+
+    def reset(self) -> None:
+        """Discards all journaled changes, as after a full history save"""
+        self.path.unlink(missing_ok=True)
+        self.record_count = 0
@@ -0,0 +1,764 @@
+"""This module provides interchangeable storage backends for saved Calculation histories"""
+import datetime as dt
+import logging as log
+import sqlite3
+import threading
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from app.calculation import Calculation
+from app.columnar_history import ColumnarHistoryReader, write_columnar
+from app.exceptions import SerializationError
+from app.lazy_import import lazy_import
+from app.record_log import RecordLog
+
+pd = lazy_import('pandas')
+
+HISTORY_COLUMNS = ('operation', 'operandx', 'operandy', 'result', 'precision', 'timestamp', 'backend')
+
+class HistoryStore(ABC):
+    """
+    Persistent storage for a Calculation history, at a single path
+
+    Attributes
+    ----------
+    digest: bool
+        An integrity digest of the file is recorded alongside it after each write
+    trusted_load: bool
+        Loads can skip record verification when that digest matches. Only stores
+        with trusted loads keep a digest, since nothing else reads it
+    """
+    digest: ClassVar[bool] = False
+    trusted_load: ClassVar[bool] = False
+
+    def __init__(self, path: Path) -> None:
+        """
+        Configures the store
+
+        Parameters
+        ----------
+        path: Path
+            Location of the history file
+        """
+        self.path = path
+
+    def exists(self) -> bool:
+        """
+        Checks for a saved history
+
+        Returns
+        -------
+        bool
+            True if the history file exists
+        """
+        return self.path.exists()
+
+    @abstractmethod
+    def write(self, calcs: List[Calculation]) -> None:
+        """
+        Replaces the saved history
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The records to save, in history order
+        """
+        pass # pragma: no cover
+
+    @abstractmethod
+    def load(self, max_size: int, verify: bool = True) -> List[Calculation]:
+        """
+        Reads the saved records a history starts from
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of records to read. The newest are kept
+        verify: bool, optional
+            Recomputes each record's result to check it
+
+        Raises
+        ------
+        SerializationError
+            If the saved records are malformed
+
+        Returns
+        -------
+        List[Calculation]
+            Up to max_size records, oldest first
+        """
+        pass # pragma: no cover
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the store
+
+        Does nothing by default. Override for stores that keep files open
+        """
+        pass
+
+class RandomAccessHistoryStore(HistoryStore):
+    """History storage that reads any range of records without reading the rest"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Get the number of saved records
+
+        Returns
+        -------
+        int
+            The record count
+        """
+        pass # pragma: no cover
+
+    @abstractmethod
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a contiguous range of saved records
+
+        Parameters
+        ----------
+        start: int, optional
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        pass # pragma: no cover
+
+    def load(self, max_size: int, verify: bool = True) -> List[Calculation]:
+        """
+        Reads and verifies only the newest saved records
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of records to read
+        verify: bool, optional
+            Recomputes each record's result to check it
+
+        Returns
+        -------
+        List[Calculation]
+            Up to max_size records, oldest first
+        """
+        loaded = self.read(-max_size, None) if max_size > 0 else []
+        if verify:
+            Calculation.validate_many(loaded)
+        return loaded
+
+class CsvHistoryStore(HistoryStore):
+    """History storage in a CSV file, rewritten on every save"""
+    digest = True
+    trusted_load = True
+
+    def write(self, calcs: List[Calculation]) -> None:
+        """
+        Replaces the CSV file. An empty history writes the header row only
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The records to save, in history order
+        """
+        if calcs:
+            pd.DataFrame([calc.to_dict() for calc in calcs]).to_csv(self.path, index=False)
+        else:
+            pd.DataFrame(columns=list(HISTORY_COLUMNS)).to_csv(self.path, index=False)
+            log.info("Calculation History Empty: Headers file recorded")
+
+    def load(self, max_size: int, verify: bool = True) -> List[Calculation]:
+        """
+        Reads the CSV file, converting the newest rows
+
+        Columns are read as strings so Decimal fields round-trip exactly
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of records to convert
+        verify: bool, optional
+            Recomputes each record's result to check it
+
+        Returns
+        -------
+        List[Calculation]
+            Up to max_size records, oldest first
+        """
+        df = pd.read_csv(self.path, dtype=str, keep_default_na=False)
+        if df.empty:
+            log.info(f"No history loaded: file empty")
+            return []
+        df = df.tail(max_size)
+        return Calculation.from_columns({
+            column: df[column].tolist() for column in HISTORY_COLUMNS if column in df
+        }, verify=verify)
+
+class ColumnarHistoryStore(RandomAccessHistoryStore):
+    """History storage in the memory-mapped columnar format of app.columnar_history"""
+
+    def write(self, calcs: List[Calculation]) -> None:
+        """
+        Replaces the columnar file
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The records to save, in history order
+        """
+        write_columnar(self.path, calcs)
+
+    def __len__(self) -> int:
+        """
+        Get the number of saved records
+
+        Returns
+        -------
+        int
+            The row count from the file footer, or 0 without a file
+        """
+        if not self.exists():
+            return 0
+        with ColumnarHistoryReader(self.path) as reader:
+            return len(reader)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a contiguous range of saved records
+
+        Parameters
+        ----------
+        start: int, optional
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        with ColumnarHistoryReader(self.path) as reader:
+            return reader.read(start, stop)
+
+class RecordLogHistoryStore(RandomAccessHistoryStore):
+    """
+    History storage in the indexed record log of app.record_log
+
+    The log is an archive: history is kept as its newest records, and records
+    evicted from history stay in the log before them. Saves append the records
+    added since the last write or load, so the archive can grow past the history size
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Configures the store
+
+        Parameters
+        ----------
+        path: Path
+            Location of the log file. The index is kept alongside it
+        """
+        super().__init__(path)
+        self.log = RecordLog(path)
+        self._lock = threading.Lock()
+        self._calcs: List[Calculation] = []
+        self._length: Optional[int] = None
+
+    def write(self, calcs: List[Calculation]) -> None:
+        """
+        Saves the history as the newest records of the log
+
+        Records added since the last write or load are appended, and undone ones are
+        truncated. The log is only replaced when the history has nothing in common with
+        its newest records, as after a clear, or when another writer changed it
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The records to save, in history order
+        """
+        with self._lock:
+            plan = self._plan(calcs) if self._length == len(self.log) else None
+            if plan is None:
+                self.log.write(calcs)
+            else:
+                kept, appended = plan
+                self.log.truncate(kept)
+                self.log.append(appended)
+                log.info(f"History records kept: {kept}, appended: {len(appended)}")
+            self._calcs, self._length = list(calcs), len(self.log)
+
+    def _plan(self, calcs: List[Calculation]) -> Optional[Tuple[int, List[Calculation]]]:
+        """
+        Finds how the log's newest records become a new history
+
+        The longest run of Calculations the new history shares, in order, with the last
+        write or load keeps its records. Records after the run are dropped, and any before
+        it must match the records preceding the run in the log, as when an eviction is undone
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The new history
+
+        Returns
+        -------
+        Optional[Tuple[int, List[Calculation]]]
+            The number of log records to keep and the records to append after them,
+            or None if the log must be replaced
+        """
+        positions = {id(calc): i for i, calc in enumerate(self._calcs)}
+        first = next((i for i, calc in enumerate(calcs) if id(calc) in positions), None)
+        if first is None:
+            return None
+        start = stop = positions[id(calcs[first])]
+        while (stop < len(self._calcs) and first + stop - start < len(calcs)
+               and self._calcs[stop] is calcs[first + stop - start]):
+            stop += 1
+        begin = self._length - len(self._calcs) + start
+        if first and (begin < first or self.log.read(begin - first, begin) != calcs[:first]):
+            return None
+        return begin + stop - start, calcs[first + stop - start:]
+
+    def __len__(self) -> int:
+        """
+        Get the number of saved records
+
+        Returns
+        -------
+        int
+            The record count, read from the index size
+        """
+        return len(self.log)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a contiguous range of saved records
+
+        Parameters
+        ----------
+        start: int, optional
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        return self.log.read(start, stop)
+
+    def load(self, max_size: int, verify: bool = True) -> List[Calculation]:
+        """
+        Reads and verifies only the newest saved records
+
+        The next write appends to the records read
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of records to read
+        verify: bool, optional
+            Recomputes each record's result to check it
+
+        Returns
+        -------
+        List[Calculation]
+            Up to max_size records, oldest first
+        """
+        with self._lock:
+            length = len(self.log)
+            loaded = super().load(max_size, verify)
+            self._calcs, self._length = loaded, length
+        return loaded
+
+class SQLiteHistoryStore(RandomAccessHistoryStore):
+    """
+    History storage in an SQLite database, one row per Calculation.
+
+    The database runs in WAL mode, so other connections can read while the
+    calculator writes, and indexes operation and timestamp for find(). Decimal
+    fields are stored as exact text and timestamps as ISO 8601 text.
+
+    Writes are incremental: the store remembers which row holds each Calculation
+    it last wrote or read, and a write inserts and deletes only the rows that
+    changed, in a single transaction. After a commit by another connection, the
+    next write replaces every row instead.
+
+    The connection is shared by all threads, one at a time.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS calculations ("
+        "id INTEGER PRIMARY KEY, operation TEXT NOT NULL, operandx TEXT NOT NULL, "
+        "operandy TEXT NOT NULL, result TEXT NOT NULL, precision INTEGER NOT NULL, "
+        "timestamp TEXT NOT NULL, backend TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS calculations_operation ON calculations (operation)",
+        "CREATE INDEX IF NOT EXISTS calculations_timestamp ON calculations (timestamp)",
+    )
+    _SELECT = f"SELECT id, {', '.join(HISTORY_COLUMNS)} FROM calculations"
+    _INSERT = (f"INSERT INTO calculations (id, {', '.join(HISTORY_COLUMNS)}) "
+               f"VALUES (?, {', '.join('?' * len(HISTORY_COLUMNS))})")
+
+    def __init__(self, path: Path) -> None:
+        """
+        Configures the store. The database is opened on first use
+
+        Parameters
+        ----------
+        path: Path
+            Location of the database file
+        """
+        super().__init__(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._ids: List[int] = []
+        self._calcs: List[Calculation] = []
+        self._version: Optional[int] = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """
+        Get the database connection, opening the database and creating its schema on first use
+
+        Returns
+        -------
+        sqlite3.Connection
+            A connection in autocommit mode, so transactions are explicit
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Holds the store lock and a write transaction, committed if the block succeeds
+
+        After a failure, the next write replaces every row, since the rows of the
+        last write are no longer known
+
+        Yields
+        ------
+        sqlite3.Connection
+            The database connection
+        """
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+                db.execute("COMMIT")
+            except BaseException:
+                self._version = None
+                if db.in_transaction:
+                    db.execute("ROLLBACK")
+                raise
+            self._version = self._data_version(db)
+
+    @staticmethod
+    def _data_version(db: sqlite3.Connection) -> int:
+        """
+        Get the counter SQLite advances whenever another connection commits
+
+        Parameters
+        ----------
+        db: sqlite3.Connection
+            The store's connection
+
+        Returns
+        -------
+        int
+            The current data version. A change since the last reading means the
+            rows may no longer match the records last written or loaded
+        """
+        return db.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _row(row_id: int, calc: Calculation) -> Tuple[Any, ...]:
+        """
+        Converts a Calculation to the values of its row
+
+        Parameters
+        ----------
+        row_id: int
+            The value of the id column, which orders the rows
+        calc: Calculation
+            The record to convert
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            The id followed by the values of HISTORY_COLUMNS, with numbers as exact strings
+        """
+        return (row_id, calc.operation, str(calc.operandx), str(calc.operandy), str(calc.result),
+                int(calc.precision), calc.timestamp.isoformat(), calc.backend)
+
+    @staticmethod
+    def _to_calculations(rows: Sequence[Sequence[Any]]) -> Tuple[List[int], List[Calculation]]:
+        """
+        Converts selected rows to Calculations, without verifying them
+
+        Parameters
+        ----------
+        rows: Sequence[Sequence[Any]]
+            Rows of the id column followed by HISTORY_COLUMNS
+
+        Raises
+        ------
+        SerializationError
+            If a row holds invalid values
+
+        Returns
+        -------
+        Tuple[List[int], List[Calculation]]
+            The row ids and the Calculations, in row order
+        """
+        if not rows:
+            return [], []
+        ids, *columns = zip(*rows)
+        return list(ids), Calculation.from_columns(dict(zip(HISTORY_COLUMNS, columns)), verify=False)
+
+    def write(self, calcs: List[Calculation]) -> None:
+        """
+        Saves the history, changing only the rows that differ from the last write
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The records to save, in history order
+        """
+        with self._transaction() as db:
+            if self._version != self._data_version(db):
+                self._ids, self._calcs = [], []
+            self._ids, self._calcs = self._sync(db, calcs), list(calcs)
+
+    def _sync(self, db: sqlite3.Connection, calcs: List[Calculation]) -> List[int]:
+        """
+        Turns the rows of the last write into the rows of a new history
+
+        The longest run of Calculations the two share, in order, keeps its rows.
+        Rows before and after the run are deleted, and the new history's other
+        Calculations are inserted around the run. Appending to history and evicting
+        its oldest records, or undoing that, touch only the rows that changed
+
+        Parameters
+        ----------
+        db: sqlite3.Connection
+            The database connection, in a transaction
+        calcs: List[Calculation]
+            The new history
+
+        Returns
+        -------
+        List[int]
+            The row id of each Calculation in calcs
+        """
+        positions = {id(calc): i for i, calc in enumerate(self._calcs)}
+        first = next((i for i, calc in enumerate(calcs) if id(calc) in positions), None)
+        if first is None:
+            db.execute("DELETE FROM calculations")
+            ids = list(range(1, len(calcs) + 1))
+            db.executemany(self._INSERT, map(self._row, ids, calcs))
+            return ids
+
+        start = stop = positions[id(calcs[first])]
+        while (stop < len(self._calcs) and first + stop - start < len(calcs)
+               and self._calcs[stop] is calcs[first + stop - start]):
+            stop += 1
+        kept = self._ids[start:stop]
+        db.execute("DELETE FROM calculations WHERE id < ? OR id > ?", (kept[0], kept[-1]))
+        before = list(range(kept[0] - first, kept[0]))
+        after = list(range(kept[-1] + 1, kept[-1] + 1 + len(calcs) - first - len(kept)))
+        db.executemany(self._INSERT, map(self._row, before, calcs[:first]))
+        db.executemany(self._INSERT, map(self._row, after, calcs[first + len(kept):]))
+        log.info(f"History rows kept: {len(kept)}, inserted: {len(before) + len(after)}")
+        return before + kept + after
+
+    def __len__(self) -> int:
+        """
+        Get the number of saved records
+
+        Returns
+        -------
+        int
+            The row count
+        """
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM calculations").fetchone()[0]
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a contiguous range of saved records
+
+        Parameters
+        ----------
+        start: int, optional
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        return self._read(start, stop)
+
+    def load(self, max_size: int, verify: bool = True) -> List[Calculation]:
+        """
+        Reads and verifies only the newest saved records
+
+        The next write keeps the rows of the records read
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of records to read
+        verify: bool, optional
+            Recomputes each record's result to check it
+
+        Returns
+        -------
+        List[Calculation]
+            Up to max_size records, oldest first
+        """
+        loaded = self._read(-max_size, None, remember=True) if max_size > 0 else []
+        if verify:
+            Calculation.validate_many(loaded)
+        return loaded
+
+    def _read(self, start: int, stop: Optional[int], remember: bool = False) -> List[Calculation]:
+        """
+        Reads a contiguous range of rows in one read transaction
+
+        Parameters
+        ----------
+        start: int
+            First record position. Negative values count from the end
+        stop: Optional[int]
+            Record position to stop before, or None to read to the end
+        remember: bool, optional
+            Keeps the rows of the records read for the next write, as when loading history
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, oldest first
+        """
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN")
+            try:
+                count = db.execute("SELECT count(*) FROM calculations").fetchone()[0]
+                start, stop, _ = slice(start, stop).indices(count)
+                rows = db.execute(f"{self._SELECT} ORDER BY id LIMIT ? OFFSET ?",
+                                  (max(stop - start, 0), start)).fetchall()
+            finally:
+                db.execute("COMMIT")
+            ids, calcs = self._to_calculations(rows)
+            if remember:
+                self._ids, self._calcs = ids, calcs
+                self._version = self._data_version(db)
+        return calcs
+
+    def find(
+            self,
+            operation: Optional[str] = None,
+            since: Optional[dt.datetime] = None,
+            until: Optional[dt.datetime] = None,
+            limit: Optional[int] = None
+    ) -> List[Calculation]:
+        """
+        Queries saved records through the operation and timestamp indexes
+
+        Parameters
+        ----------
+        operation: Optional[str], optional
+            Only records of this Calculation operation name, such as 'Addition'
+        since: Optional[dt.datetime], optional
+            Only records timestamped at or after this time
+        until: Optional[dt.datetime], optional
+            Only records timestamped before this time
+        limit: Optional[int], optional
+            Only the newest matching records, up to this many
+
+        Returns
+        -------
+        List[Calculation]
+            The matching records, oldest first
+        """
+        conditions, parameters = [], []
+        if operation is not None:
+            conditions.append("operation = ?")
+            parameters.append(operation)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            parameters.append(since.isoformat())
+        if until is not None:
+            conditions.append("timestamp < ?")
+            parameters.append(until.isoformat())
+        query = self._SELECT + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, parameters).fetchall()
+        return self._to_calculations(rows[::-1])[1]
+
+    def close(self) -> None:
+        """Closes the database connection, if open"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._version = None
+
+HISTORY_STORES: Dict[str, Type[HistoryStore]] = {
+    'csv': CsvHistoryStore,
+    'columnar': ColumnarHistoryStore,
+    'records': RecordLogHistoryStore,
+    'sqlite': SQLiteHistoryStore,
+}
+
+def create_history_store(history_format: str, path: Path) -> HistoryStore:
+    """
+    Creates the store for a history format
+
+    Parameters
+    ----------
+    history_format: str
+        A key of HISTORY_STORES
+    path: Path
+        Location of the history file
+
+    Raises
+    ------
+    SerializationError
+        If the history format is not recognized
+
+    Returns
+    -------
+    HistoryStore
+        A new store for the path
+    """
+    try:
+        return HISTORY_STORES[history_format](path)
+    except KeyError:
+        raise SerializationError(f"Unknown history format: {history_format}")
@@ -1,11 +1,13 @@
 """This module provides an input sanitation service for the calculator repl"""
+import math
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, List, Union
 
 from app.calculator_config import CalculatorConfig
-from app.exceptions import ValidationError
+from app.exceptions import BatchValidationError, ValidationError
 
 @dataclass
 class InputValidator:
@@ -33,13 +35,107 @@ class InputValidator:
         Decimal:
             A Decimal representation of the input
         """
-        if isinstance(value, str):
+        kind = type(value)
+        if kind is str:
             value = value.strip()
         try:
-            num = Decimal(str(value))
-            if abs(num) > config.max_input_value:
+            # Decimal, int and str convert exactly without a round trip through str()
+            if kind is Decimal:
+                num = value
+            elif kind is int or kind is str:
+                num = Decimal(value)
+            else:
+                num = Decimal(str(value))
+            if num.copy_abs() > _decimal_limit(config.max_input_value):
                 raise ValidationError(
                     f"Value exceeds allowed maximum: {config.max_input_value}")
             return num.normalize()
         except InvalidOperation:
             raise ValidationError(f"Invalid number format: {value}")
+
+    @staticmethod
+    def validate_float(value: Any, config: CalculatorConfig) -> float:
+        """
+        Validate a numerical input to float, for the float numeric backend
+
+        Parameters
+        ----------
+        value: Any
+            An input value to validate
+        config: CalculatorConfig
+            The configuration settings for this session
+
+        Raises
+        ------
+        ValidationError:
+            if an invalid input is provided
+
+        Returns
+        -------
+        float:
+            A float representation of the input
+        """
+        if isinstance(value, bool):
+            raise ValidationError(f"Invalid number format: {value}")
+        try:
+            num = float(value)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Invalid number format: {value}")
+        if not math.isfinite(num):
+            raise ValidationError(f"Invalid number format: {value}")
+        if abs(num) > _float_limit(config.max_input_value):
+            raise ValidationError(
+                f"Value exceeds allowed maximum: {config.max_input_value}")
+        return num
+
+    @staticmethod
+    def validate_many(
+            values: Iterable[Any],
+            config: CalculatorConfig,
+            backend: str = 'decimal'
+    ) -> List[Union[Decimal, float]]:
+        """
+        Validate a sequence of numerical inputs in one pass
+
+        Every value is validated, so a failure reports all invalid values at once
+
+        Parameters
+        ----------
+        values: Iterable[Any]
+            The input values to validate, such as a list or an array
+        config: CalculatorConfig
+            The configuration settings for this session
+        backend: str, optional
+            'decimal' to validate with validate_number, or 'float' with validate_float
+
+        Raises
+        ------
+        BatchValidationError:
+            if any invalid inputs are provided, with the error for each by index
+
+        Returns
+        -------
+        List[Union[Decimal, float]]:
+            The validated values, in input order
+        """
+        validate = InputValidator.validate_float if backend == 'float' else InputValidator.validate_number
+        valid = []
+        errors = {}
+        for index, value in enumerate(values):
+            try:
+                valid.append(validate(value, config))
+            except ValidationError as e:
+                errors[index] = str(e)
+        if errors:
+            raise BatchValidationError(errors)
+        return valid
+
+@lru_cache(maxsize=8)
+def _decimal_limit(limit: Any) -> Decimal:
+    """Converts the configured input limit once, so each check compares two Decimals"""
+    return Decimal(limit)
+
+@lru_cache(maxsize=8)
+def _float_limit(limit: Any) -> float:
+    """Converts the configured input limit once, since float and Decimal comparisons are slow"""
+    return float(limit)
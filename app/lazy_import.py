@@ -0,0 +1,131 @@
+"""This module provides deferred imports for dependencies that are slow to load and rarely used"""
+import importlib
+import importlib.util
+import sys
+import threading
+
+from types import ModuleType
+from typing import Any, List
+
+# Serializes first use, so a module is imported once however many threads reach it together
+_lock = threading.RLock()
+
+class _LazyModule(ModuleType):
+    """
+    Stand-in for a module that imports it on first attribute access.
+
+    importlib.util.LazyLoader is not used because, before Python 3.12.3, other
+    threads can read its module while it is still executing and see missing
+    attributes. Here every access waits for the import to finish, then reads,
+    writes and deletes are forwarded to the imported module.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Configures the stand-in
+
+        Parameters
+        ----------
+        name : str
+            The absolute name of the module to import
+        """
+        super().__init__(name)
+        self.__dict__['_module'] = None
+
+    def _load(self) -> ModuleType:
+        """
+        Imports the module, unless it already has been
+
+        Raises
+        ------
+        Exception
+            Any error raised while executing the module
+
+        Returns
+        -------
+        ModuleType
+            The imported module
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            with _lock:
+                module = self.__dict__['_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        """
+        Reads an attribute of the module, importing it first if needed
+
+        Parameters
+        ----------
+        attr : str
+            The attribute name
+
+        Returns
+        -------
+        Any
+            The module's attribute
+        """
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        """
+        Sets an attribute on the module, importing it first if needed
+
+        Parameters
+        ----------
+        attr : str
+            The attribute name
+        value : Any
+            The new value
+        """
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        """
+        Deletes an attribute of the module, importing it first if needed
+
+        Parameters
+        ----------
+        attr : str
+            The attribute name
+        """
+        delattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        """Lists the module's attributes, importing it first if needed"""
+        return dir(self._load())
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Imports a module on first attribute access instead of immediately
+
+    The import runs under a lock, so threads using the module for the first time
+    at once all wait for it to finish. A module that is already imported is
+    returned as is
+
+    Parameters
+    ----------
+    name : str
+        The absolute module name, such as 'pandas'
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module is not installed. Errors raised while executing the module
+        surface on first attribute access
+
+    Returns
+    -------
+    ModuleType
+        The module, or a stand-in that imports it when first used
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    return _LazyModule(name)
@@ -0,0 +1,279 @@
+"""This module provides file handler construction and a non-blocking, queue-based logging pipeline"""
+import atexit
+import logging as log
+import queue
+
+from logging.handlers import (
+    BaseRotatingHandler, MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+)
+from pathlib import Path
+from typing import List, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def build_file_handler(
+    log_file: Path,
+    encoding: str = 'utf-8',
+    rotation: str = 'none',
+    max_bytes: int = 10485760,
+    backup_count: int = 5
+) -> log.FileHandler:
+    """
+    Creates the handler writing records to the log file
+
+    Parameters
+    ----------
+    log_file: Path
+        The log file path
+    encoding: str, optional
+        Text encoding for the log file
+    rotation: str, optional
+        'none', 'size' to roll over at max_bytes, or 'time' to roll over at midnight
+    max_bytes: int, optional
+        File size that triggers a roll over with 'size' rotation
+    backup_count: int, optional
+        Number of rolled over files kept with 'size' or 'time' rotation
+
+    Returns
+    -------
+    log.FileHandler
+        A formatted file handler
+    """
+    match rotation:
+        case 'size':
+            handler = RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        case 'time':
+            handler = TimedRotatingFileHandler(
+                log_file, when='midnight', backupCount=backup_count, encoding=encoding)
+        case _:
+            handler = log.FileHandler(log_file, encoding=encoding)
+    handler.setFormatter(log.Formatter(LOG_FORMAT))
+    return handler
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records unformatted, leaving all formatting to the listener thread"""
+
+    def prepare(self, record: log.LogRecord) -> log.LogRecord:
+        """
+        Passes the record through unchanged
+
+        The queue never leaves the process, so the record does not need to be made picklable
+
+        Parameters
+        ----------
+        record: log.LogRecord
+            The record to enqueue
+
+        Returns
+        -------
+        log.LogRecord
+            The same record
+        """
+        return record
+
+class _BatchBuffer(MemoryHandler):
+    """
+    MemoryHandler that writes each batch to a stream target with a single write and flush.
+
+    Records are formatted by the target and joined into one chunk, so a batch of N
+    records costs one stream write and one flush instead of N of each. Rotating
+    targets are still checked for roll over before every record. Targets that are
+    not stream handlers receive the records one at a time.
+    """
+
+    def flush(self) -> None:
+        """Writes all buffered records to the target"""
+        with self.lock:
+            if not self.buffer or self.target is None:
+                return
+            target = self.target
+            if isinstance(target, log.StreamHandler):
+                with target.lock:
+                    self._write_batch(target)
+            else:
+                [target.handle(record) for record in self.buffer]
+            self.buffer.clear()
+
+    def _write_batch(self, target: log.StreamHandler) -> None:
+        """
+        Formats the buffered records and writes them through the target's stream
+
+        Parameters
+        ----------
+        target: log.StreamHandler
+            The stream handler receiving the batch. Its lock must be held
+        """
+        chunk: List[str] = []
+        size = self._stream_size(target) if isinstance(target, RotatingFileHandler) else 0
+        try:
+            for record in self.buffer:
+                if record.levelno < target.level or not target.filter(record):
+                    continue
+                message = target.format(record) + target.terminator
+                if isinstance(target, RotatingFileHandler):
+                    # Pending records are not yet in the file, so size is tracked here
+                    rollover = 0 < target.maxBytes <= size + len(message)
+                elif isinstance(target, BaseRotatingHandler):
+                    rollover = target.shouldRollover(record)
+                else:
+                    rollover = False
+                if rollover:
+                    self._write_chunk(target, chunk)
+                    chunk, size = [], 0
+                    target.doRollover()
+                chunk.append(message)
+                size += len(message)
+            self._write_chunk(target, chunk)
+        except Exception:
+            target.handleError(self.buffer[-1])
+
+    @staticmethod
+    def _stream_size(target: log.StreamHandler) -> int:
+        """
+        Get the current size of the target's file, opening it if needed
+
+        Parameters
+        ----------
+        target: log.StreamHandler
+            A file handler
+
+        Returns
+        -------
+        int
+            The stream position at the end of the file
+        """
+        if target.stream is None:
+            target.stream = target._open()
+        return target.stream.seek(0, 2)
+
+    @staticmethod
+    def _write_chunk(target: log.StreamHandler, chunk: List[str]) -> None:
+        """
+        Writes formatted records with one stream write and one flush
+
+        Parameters
+        ----------
+        target: log.StreamHandler
+            The stream handler receiving the records
+        chunk: List[str]
+            Formatted records, each ending with the target's terminator
+        """
+        if not chunk:
+            return
+        if target.stream is None:
+            target.stream = target._open()
+        target.stream.write(''.join(chunk))
+        target.stream.flush()
+
+class _BatchingListener(QueueListener):
+    """QueueListener that flushes its buffer whenever the queue stays idle for flush_interval seconds"""
+
+    def __init__(self, record_queue: queue.SimpleQueue, buffer: _BatchBuffer, flush_interval: float) -> None:
+        """
+        Configures the listener
+
+        Parameters
+        ----------
+        record_queue: queue.SimpleQueue
+            The queue the pipeline's QueueHandler puts records on
+        buffer: _BatchBuffer
+            The handler that collects dequeued records and writes them in batches
+        flush_interval: float
+            Seconds the queue may stay empty before the buffer is flushed
+        """
+        super().__init__(record_queue, buffer, respect_handler_level=True)
+        self.buffer = buffer
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> log.LogRecord:
+        """
+        Waits for the next record, flushing buffered records while idle
+
+        Parameters
+        ----------
+        block: bool
+            Whether to wait for a record
+
+        Returns
+        -------
+        log.LogRecord
+            The next queued record, or the listener's stop sentinel
+        """
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                self.buffer.flush()
+
+class LoggingPipeline:
+    """
+    Non-blocking logging setup for the root logger.
+
+    Log calls only enqueue the unformatted record through a QueueHandler; message
+    formatting and file writes happen on a background QueueListener thread. The
+    listener collects records and writes each batch to the target with a single stream write and
+    flush. A batch is written when it fills, when a WARNING or higher record
+    arrives, or when the queue has been idle for the flush interval.
+    """
+
+    _active: Optional['LoggingPipeline'] = None
+
+    def __init__(self, target: log.Handler, batch_size: int = 100, flush_interval: float = 1.0) -> None:
+        """
+        Configures the pipeline
+
+        Parameters
+        ----------
+        target: log.Handler
+            The handler receiving batched records, usually from build_file_handler
+        batch_size: int, optional
+            Number of records buffered before a write
+        flush_interval: float, optional
+            Seconds of inactivity before buffered records are written
+        """
+        self.target = target
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.buffer = _BatchBuffer(batch_size, flushLevel=log.WARNING, target=target, flushOnClose=True)
+        self.listener = _BatchingListener(self.queue, self.buffer, flush_interval)
+        self.running = False
+
+    def start(self, level: int = log.INFO) -> None:
+        """
+        Routes the root logger through the pipeline and starts the listener
+
+        Any previously started pipeline is stopped first
+
+        Parameters
+        ----------
+        level: int, optional
+            The root logger level
+        """
+        if LoggingPipeline._active is not None:
+            LoggingPipeline._active.stop()
+        log.basicConfig(handlers=[_DeferredQueueHandler(self.queue)], level=level, force=True)
+        self.listener.start()
+        self.running = True
+        LoggingPipeline._active = self
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """
+        Writes all queued records and stops the listener
+
+        The root logger writes directly to the target handler afterwards, so later
+        records are not lost. Does nothing if the pipeline is not running
+        """
+        if not self.running:
+            return
+        self.running = False
+        atexit.unregister(self.stop)
+        root = log.getLogger()
+        for handler in root.handlers[:]:
+            if isinstance(handler, QueueHandler) and handler.queue is self.queue:
+                root.removeHandler(handler)
+                root.addHandler(self.target)
+        self.listener.stop()
+        self.buffer.flush()
+        if LoggingPipeline._active is self:
+            LoggingPipeline._active = None
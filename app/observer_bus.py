@@ -0,0 +1,260 @@
+"""This module provides queued, asynchronous dispatch for HistoryObservers"""
+import logging as log
+import threading
+
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+
+from app.calculation import Calculation
+from app.calculator_memento import CalculatorMemento
+from app.exceptions import OperationError
+from app.history import HistoryObserver
+
+QUEUE_POLICIES = ('block', 'drop_oldest', 'coalesce')
+
+class QueuedObserver(HistoryObserver):
+    """
+    Decorator that delivers notifications to a wrapped observer on its own thread.
+
+    Notifications are placed on a bounded queue and return immediately, so the
+    Calculator's latency no longer depends on the wrapped observer's cost. When the
+    queue is full, the policy decides what happens: 'block' waits for space,
+    'drop_oldest' discards the oldest pending Calculations, and 'coalesce' merges
+    the new Calculations into the newest pending batch, delivered through
+    update_batch. Events other than calculations are never dropped or merged.
+    """
+
+    def __init__(self, observer: HistoryObserver, max_size: int = 1000, policy: str = 'block') -> None:
+        """
+        Wraps an observer and starts its worker thread
+
+        Parameters
+        ----------
+        observer: HistoryObserver
+            The observer receiving notifications
+        max_size: int, optional
+            Maximum number of pending notifications
+        policy: str, optional
+            One of 'block', 'drop_oldest' or 'coalesce'
+
+        Raises
+        ------
+        ValueError
+            If the queue size or policy is invalid
+        """
+        if max_size <= 0:
+            raise ValueError("Queue size must be positive")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self.observer = observer
+        self.max_size = max_size
+        self.policy = policy
+        self.delivered = 0
+        self.dropped = 0
+        self.error: Optional[Exception] = None
+        self._queue: Deque[Tuple[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._exited = False
+        self._worker = threading.Thread(
+            target=self._run, name=f"Queued{observer.__class__.__name__}", daemon=True)
+        self._worker.start()
+
+    @property
+    def lag(self) -> int:
+        """
+        Get the number of notifications waiting for delivery
+
+        Returns
+        -------
+        int
+            Pending notifications, including one being delivered
+        """
+        with self._condition:
+            return len(self._queue) + self._busy
+
+    def update(self, calc: Calculation) -> None:
+        """
+        Queue a new calculation
+
+        Parameters
+        ----------
+        calc: Calculation
+            The Calculation passed to the wrapped observer
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed on an earlier notification
+        """
+        self._put('calcs', [calc])
+
+    def update_batch(self, calcs: List[Calculation]) -> None:
+        """
+        Queue a batch of new calculations
+
+        Parameters
+        ----------
+        calcs: List[Calculation]
+            The Calculations passed to the wrapped observer
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed on an earlier notification
+        """
+        self._put('calcs', list(calcs))
+
+    def update_event(self, event: str, memento: Optional[CalculatorMemento]) -> None:
+        """
+        Queue an undo, redo or clear event
+
+        Parameters
+        ----------
+        event: str
+            One of 'undo', 'redo' or 'clear'
+        memento: Optional[CalculatorMemento]
+            The history delta applied by an undo or redo
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed on an earlier notification
+        """
+        self._put('event', (event, memento))
+
+    def drain(self) -> None:
+        """Waits until every queued notification has been delivered"""
+        with self._condition:
+            while (self._queue or self._busy) and not self._exited:
+                self._condition.wait()
+
+    def stop(self) -> None:
+        """
+        Delivers pending notifications and stops the worker
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed since its last reported failure
+        """
+        self.drain()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Stops the worker, then closes the wrapped observer
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed since its last reported failure, or on close
+        """
+        self.stop()
+        self.observer.close()
+
+    def _put(self, kind: str, payload: Any) -> None:
+        """
+        Enqueues a notification according to the queue policy
+
+        The notification is queued before any earlier failure is reported, so it is never lost
+
+        Parameters
+        ----------
+        kind: str
+            'calcs' for Calculations, or 'event' for other history changes
+        payload: Any
+            The Calculations, or the (event, memento) pair
+
+        Raises
+        ------
+        OperationError
+            If the worker has stopped, or the wrapped observer failed on an earlier notification
+        """
+        with self._condition:
+            if self._exited:
+                raise OperationError(f"{self.observer.__class__.__name__} is not running")
+            if len(self._queue) >= self.max_size:
+                if self.policy == 'coalesce' and kind == 'calcs' and self._queue[-1][0] == 'calcs':
+                    self._queue[-1][1].extend(payload)
+                    payload = None
+                elif self.policy == 'drop_oldest':
+                    self._drop_oldest_calcs()
+                while payload is not None and len(self._queue) >= self.max_size and not self._exited:
+                    self._condition.wait()
+            if payload is not None:
+                self._queue.append((kind, payload))
+                self._condition.notify_all()
+        self._raise_error()
+
+    def _drop_oldest_calcs(self) -> None:
+        """Discards the oldest pending Calculations. Events are kept, so a queue of only events still blocks"""
+        for i, (kind, _) in enumerate(self._queue):
+            if kind == 'calcs':
+                del self._queue[i]
+                self.dropped += 1
+                return
+
+    def _raise_error(self) -> None:
+        """
+        Reports a wrapped observer failure once
+
+        Raises
+        ------
+        OperationError
+            If the wrapped observer failed since the last report
+        """
+        error, self.error = self.error, None
+        if error is not None:
+            raise OperationError(f"{self.observer.__class__.__name__} failed: {error}")
+
+    def _run(self) -> None:
+        """Worker loop: delivers queued notifications in order"""
+        with self._condition:
+            try:
+                while True:
+                    while not self._queue and not self._closed:
+                        self._condition.wait()
+                    if not self._queue:
+                        return
+                    kind, payload = self._queue.popleft()
+                    self._busy = True
+                    self._condition.notify_all()
+                    self._condition.release()
+                    try:
+                        self._deliver(kind, payload)
+                    finally:
+                        self._condition.acquire()
+                        self._busy = False
+                        self._condition.notify_all()
+            finally:
+                self._exited = True
+                self._condition.notify_all()
+
+    def _deliver(self, kind: str, payload: Any) -> None:
+        """
+        Passes one notification to the wrapped observer, keeping any failure for later report
+
+        Parameters
+        ----------
+        kind: str
+            'calcs' for Calculations, or 'event' for other history changes
+        payload: Any
+            The Calculations, or the (event, memento) pair
+        """
+        try:
+            if kind == 'event':
+                self.observer.update_event(*payload)
+            elif len(payload) == 1:
+                self.observer.update(payload[0])
+            else:
+                self.observer.update_batch(payload)
+            self.delivered += 1
+        except Exception as e:
+            self.error = e
+            log.error(f"Queued observer {self.observer.__class__.__name__} failed: {e}")
@@ -1,18 +1,32 @@
 """This module provides a class structure for composing and executing arithmetic operations"""
 
+import logging as log
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict
+from typing import Callable, ClassVar, Dict, Iterable, List, Optional, Type
 
+from app import decimal_math
 from app.exceptions import ValidationError
+from app.lazy_import import lazy_import
+
+# Imported on first use: package metadata is only scanned for unknown operation names
+metadata = lazy_import('importlib.metadata')
+
+Executor = Callable[[Decimal, Decimal], Decimal]
+
+ENTRY_POINT_GROUP = 'calculator.operations'
 
 class Operation(ABC):
     """
     Abstract base class for the Operation family of classes.
 
-    Serves as an Abstract Product for OperationFactory
+    Serves as an Abstract Product for OperationFactory. Operations are stateless by
+    default, so the Factory shares one instance of each; subclasses holding
+    per-instance state set stateless to False to get a new instance per request
     """
 
+    stateless: ClassVar[bool] = True
+
     @abstractmethod
     def execute(self, x: Decimal, y: Decimal) -> Decimal:
         """
@@ -34,6 +48,28 @@ class Operation(ABC):
         """
         pass # pragma: no cover
 
+    def execute_float(self, x: float, y: float) -> float:
+        """
+        Performs the class's arithmetic on binary float operands, for the float numeric backend.
+
+        Defaults to converting the operands for execute. Operations whose execute is
+        plain Python arithmetic alias it as execute_float; others override with native
+        float arithmetic where possible
+
+        Parameters
+        ----------
+        x : float
+            First operand
+        y : float
+            Second operand
+
+        Returns
+        -------
+        float
+            The result of the class's arithmetic operation.
+        """
+        return float(self.execute(Decimal(repr(x)), Decimal(repr(y))))
+
     def validate_operands(self, x: Decimal, y: Decimal) -> None:
         """
         Validate's the class's operands for execution.
@@ -81,6 +117,8 @@ class Addition(Operation):
         """
         return x + y
 
+    execute_float = execute
+
 class Subtraction(Operation):
     """Concrete Product for subtraction operations"""
 
@@ -102,6 +140,8 @@ class Subtraction(Operation):
         """
         return x - y
 
+    execute_float = execute
+
 class Multiplication(Operation):
     """Concrete Product for multiplication operations"""
 
@@ -123,6 +163,8 @@ class Multiplication(Operation):
         """
         return x * y
 
+    execute_float = execute
+
 class Division(Operation):
     """Concrete Product for division operations"""
 
@@ -145,6 +187,8 @@ class Division(Operation):
         self.validate_operands(x, y)
         return x / y
 
+    execute_float = execute
+
     def validate_operands(self, x: Decimal, y: Decimal) -> None:
         """
         Prechecks operands for a zero divisor.
@@ -182,13 +226,51 @@ class Power(Operation):
         Returns
         -------
         Decimal
+            A value representing x ^ y, exact to the working decimal places
+        """
+        self.validate_operands(x, y)
+        return decimal_math.power(x, y)
+
+    def execute_float(self, x: float, y: float) -> float:
+        """
+        Performs an exponentiation using two float operands
+
+        Parameters
+        ----------
+        x : float
+            Base operand
+        y : float
+            Exponent operand
+
+        Returns
+        -------
+        float
             A value representing x ^ y
         """
+        self.validate_operands(x, y)
         if x == 0:
-            return Decimal(0)
-        if y < 0:
-            return Decimal(1 / pow(float(x), float(y * -1)))
-        return Decimal(pow(float(x), float(y)))
+            return 0.0
+        return x ** y
+
+    def validate_operands(self, x: Decimal, y: Decimal) -> None:
+        """
+        Prechecks operands for imaginary power conditions
+
+        Parameters
+        ----------
+        x : Decimal
+            Base operand
+        y : Decimal
+            Exponent operand
+
+        Raises
+        ------
+        ValidationError
+            If a negative base is raised to a fractional exponent
+        """
+        super().validate_operands(x, y)
+        if x < 0 and y != int(y):
+            raise ValidationError("Fractional powers of negative numbers are not supported")
 
 class Root(Operation):
     """Concrete Product for root operations"""
@@ -207,15 +289,32 @@ class Root(Operation):
         Return
         ------
         Decimal
+            The yth root of x, exact to the working decimal places
+        """
+        self.validate_operands(x, y)
+        return decimal_math.root(x, y)
+
+    def execute_float(self, x: float, y: float) -> float:
+        """
+        Performs a root operation using two float operands
+
+        Parameters
+        ----------
+        x : float
+            Radicand operand
+        y : float
+            Degree operand
+
+        Returns
+        -------
+        float
             The yth root of x
         """
         self.validate_operands(x, y)
         if x == 0:
-            return Decimal(0)
-        (base, sign) = (x * -1, -1) if x < 0 else (x, 1)
-        if y < 0:
-            return Decimal(sign / pow(float(base), 1 / float(y * -1)))
-        return Decimal(sign * pow(float(base), 1 / float(y)))
+            return 0.0
+        root = abs(x) ** (1 / y)
+        return -root if x < 0 else root
 
     def validate_operands(self, x: Decimal, y: Decimal) -> None:
         """
@@ -240,46 +339,203 @@ class Root(Operation):
             raise ValidationError("Zero radicand is undefined")
 
 class OperationFactory:
-    """Factory class for the Operation class family"""
-
-    _operations: Dict[str, type] = {
-            'add': Addition,
-            'addition': Addition,
-            'subtract': Subtraction,
-            'subtraction': Subtraction,
-            'multiply': Multiplication,
-            'multiplication': Multiplication,
-            'divide': Division,
-            'division': Division,
-            'power': Power,
-            'root': Root,
-    }
+    """
+    Factory class for the Operation class family
+
+    Every registered name and alias is resolved to its canonical name once, at
+    registration. Stateless Operations are created once and shared as flyweights,
+    and their execute methods form a dispatch table keyed by canonical name.
+
+    Installed packages can provide Operations through the 'calculator.operations'
+    entry point group, such as 'modulo = my_package.operations:Modulo'. Entry
+    points are read from package metadata on the first unknown name, and each
+    plugin is imported and registered only when its name is first requested.
+    Explicitly registered names take precedence over plugins.
+    """
+
+    _classes: Dict[str, Type[Operation]] = {}
+    _aliases: Dict[str, str] = {}
+    _instances: Dict[str, Operation] = {}
+    _dispatch: Dict[str, Executor] = {}
+    _resolved: Dict[str, Operation] = {}
+    _plugins: Optional[Dict[str, 'metadata.EntryPoint']] = None
 
     @classmethod
-    def register_operation(cls, name: str, operation_class: type) -> None:
+    def register_operation(cls, name: str, operation_class: type, aliases: Iterable[str] = ()) -> None:
         """
         Registers an operation class to the Factory
 
+        Registering an existing name or alias replaces its Operation
+
         Parameters
         ----------
         name : str
-            text identifier for the operation
+            text identifier for the operation, used as its canonical name
         operation_class : type
             class implementation of the operation
+        aliases : Iterable[str], optional
+            further identifiers resolving to the same operation
 
         Raises
         ------
         TypeError
             If a class outside the Operation family is registered
         """
-        if not issubclass(operation_class, Operation):
+        if not isinstance(operation_class, type) or not issubclass(operation_class, Operation):
             raise TypeError("Registered class must inherit from Operation")
-        cls._operations[name.lower()] = operation_class
+        canonical = name.lower()
+        cls._resolved.clear()
+        cls._classes[canonical] = operation_class
+        for key in (canonical, *(alias.lower() for alias in aliases)):
+            cls._aliases[key] = canonical
+        if operation_class.stateless:
+            instance = cls._instances[canonical] = operation_class()
+            cls._dispatch[canonical] = instance.execute
+        else:
+            cls._instances.pop(canonical, None)
+            cls._dispatch[canonical] = lambda x, y: operation_class().execute(x, y)
+
+    @classmethod
+    def unregister_operation(cls, name: str) -> None:
+        """
+        Removes an operation and all of its aliases from the Factory
+
+        Parameters
+        ----------
+        name : str
+            Any identifier of the operation
+
+        Raises
+        ------
+        ValueError
+            If the name is not registered to the Factory
+        """
+        canonical = cls.canonical_name(name)
+        cls._resolved.clear()
+        for alias in [alias for alias, target in cls._aliases.items() if target == canonical]:
+            del cls._aliases[alias]
+        del cls._classes[canonical]
+        del cls._dispatch[canonical]
+        cls._instances.pop(canonical, None)
+
+    @classmethod
+    def canonical_name(cls, operation_type: str) -> str:
+        """
+        Resolves an identifier or alias to the operation's canonical name
+
+        Parameters
+        ----------
+        operation_type : str
+            a string identifier for the desired Operation
+
+        Raises
+        ------
+        ValueError
+            If the provided operation_type is not registered to the Factory
+
+        Returns
+        -------
+        str
+            The canonical name, such as 'add' for 'Addition'
+        """
+        canonical = cls._aliases.get(operation_type)
+        if canonical is None:
+            canonical = cls._aliases.get(operation_type.lower()) or cls._load_plugin(operation_type)
+            if canonical is None:
+                raise ValueError(f"Unknown operation: {operation_type}")
+        return canonical
+
+    @classmethod
+    def name_of(cls, operation: Operation) -> str:
+        """
+        Get the canonical name an Operation's class is registered under
+
+        Parameters
+        ----------
+        operation : Operation
+            An instance of a registered Operation class
+
+        Raises
+        ------
+        ValueError
+            If the Operation's class is not registered to the Factory
+
+        Returns
+        -------
+        str
+            The canonical name, such as 'add' for an Addition
+        """
+        for name, operation_class in cls._classes.items():
+            if operation_class is type(operation):
+                return name
+        raise ValueError(f"Unregistered operation: {operation}")
+
+    @classmethod
+    def discover_operations(cls, refresh: bool = False) -> List[str]:
+        """
+        Lists the plugin Operations declared in installed package metadata, without importing them
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Scans the metadata again, for packages installed since the last scan
+
+        Returns
+        -------
+        List[str]
+            The names of plugins not yet loaded
+        """
+        if cls._plugins is None or refresh:
+            cls._plugins = {
+                entry_point.name.lower(): entry_point
+                for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP)
+            }
+        return sorted(cls._plugins)
+
+    @classmethod
+    def _load_plugin(cls, operation_type: str) -> Optional[str]:
+        """
+        Imports and registers the plugin Operation declared under a name
+
+        Parameters
+        ----------
+        operation_type : str
+            a string identifier for the desired Operation
+
+        Raises
+        ------
+        ValueError
+            If the plugin fails to import
+        TypeError
+            If the plugin is not an Operation class
+
+        Returns
+        -------
+        Optional[str]
+            The canonical name of the loaded Operation, or None if no plugin declares the name
+        """
+        name = operation_type.lower()
+        cls.discover_operations()
+        entry_point = cls._plugins.get(name)
+        if entry_point is None:
+            return None
+        try:
+            operation_class = entry_point.load()
+        except Exception as e:
+            raise ValueError(f"Failed to load operation '{name}' from {entry_point.value}: {e}")
+        cls.register_operation(name, operation_class)
+        # Another thread may have loaded the same plugin meanwhile
+        cls._plugins.pop(name, None)
+        log.info(f"Loaded plugin operation '{name}' from {entry_point.value}")
+        return name
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
         """
-        Instantiates an Operations subclass by string identifier.
+        Get an Operations subclass instance by string identifier.
+
+        Stateless Operations are shared instances, so repeated calls do not allocate,
+        and each identifier is resolved once
 
         Parameters
         ----------
@@ -296,9 +552,41 @@ class OperationFactory:
         Operation
             an instance of the specified Operation subclass
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        instance = cls._resolved.get(operation_type)
+        if instance is not None:
+            return instance
+        canonical = cls.canonical_name(operation_type)
+        instance = cls._instances.get(canonical)
+        if instance is None:
+            return cls._classes[canonical]()
+        cls._resolved[operation_type] = instance
+        return instance
 
+    @classmethod
+    def get_executor(cls, operation_type: str) -> Executor:
+        """
+        Get the dispatch table entry executing an Operation by string identifier
 
+        Parameters
+        ----------
+        operation_type : str
+            a string identifier for the desired Operation
+
+        Raises
+        ------
+        ValueError
+            If the provided operation_type is not registered to the Factory
+
+        Returns
+        -------
+        Executor
+            A function taking the two Decimal operands and returning the result
+        """
+        return cls._dispatch[cls.canonical_name(operation_type)]
+
+OperationFactory.register_operation('add', Addition, aliases=('addition',))
+OperationFactory.register_operation('subtract', Subtraction, aliases=('subtraction',))
+OperationFactory.register_operation('multiply', Multiplication, aliases=('multiplication',))
+OperationFactory.register_operation('divide', Division, aliases=('division',))
+OperationFactory.register_operation('power', Power)
+OperationFactory.register_operation('root', Root)
@@ -0,0 +1,149 @@
+"""This module provides a process pool that executes large batches of Operations on all cores"""
+import logging as log
+import multiprocessing
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from decimal import Decimal
+from typing import List, Optional, Sequence, Union
+
+from app.decimal_math import working_precision
+from app.operations import OperationFactory
+
+Operand = Union[Decimal, float]
+
+def execute_chunk(
+        operation: str,
+        xs: Sequence[Operand],
+        ys: Sequence[Operand],
+        precision: int,
+        backend: str
+) -> List[Operand]:
+    """
+    Executes an Operation over a chunk of operand pairs, in a worker process
+
+    Parameters
+    ----------
+    operation: str
+        The Operation's registered OperationFactory name
+    xs: Sequence[Operand]
+        The validated first operands
+    ys: Sequence[Operand]
+        The validated second operands
+    precision: int
+        The decimal places to compute non-terminating results to
+    backend: str
+        'decimal' to run execute, or 'float' to run execute_float
+
+    Raises
+    ------
+    ValidationError
+        If any operand pair is invalid for the Operation
+
+    Returns
+    -------
+    List[Operand]
+        The results, in input order
+    """
+    if backend == 'float':
+        execute = OperationFactory.create_operation(operation).execute_float
+    else:
+        execute = OperationFactory.get_executor(operation)
+    with working_precision(precision):
+        return [execute(x, y) for x, y in zip(xs, ys)]
+
+class ParallelExecutor:
+    """
+    Shards batches of operand pairs across a pool of worker processes
+
+    Operations are sent to workers by their registered OperationFactory name, so
+    an Operation must be registered when app.operations is imported, or through a
+    plugin entry point, to be available in a worker. Workers are started with the
+    'spawn' method, which is safe with the background threads of other components,
+    on the first batch
+    """
+
+    def __init__(self, workers: int, chunk_size: int) -> None:
+        """
+        Configures the executor
+
+        Parameters
+        ----------
+        workers: int
+            Number of worker processes
+        chunk_size: int
+            Number of operand pairs sent to a worker at a time
+
+        Raises
+        ------
+        ValueError
+            If the worker count or chunk size is not positive
+        """
+        if workers <= 0:
+            raise ValueError("Parallel worker count must be positive")
+        if chunk_size <= 0:
+            raise ValueError("Parallel chunk size must be positive")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def map(
+            self,
+            operation: str,
+            xs: Sequence[Operand],
+            ys: Sequence[Operand],
+            precision: int,
+            backend: str = 'decimal'
+    ) -> List[Operand]:
+        """
+        Executes an Operation over operand pairs in parallel
+
+        A failure in any chunk cancels the chunks not yet started
+
+        Parameters
+        ----------
+        operation: str
+            The Operation's registered OperationFactory name
+        xs: Sequence[Operand]
+            The validated first operands
+        ys: Sequence[Operand]
+            The validated second operands, of the same length
+        precision: int
+            The decimal places to compute non-terminating results to
+        backend: str, optional
+            'decimal' or 'float'
+
+        Raises
+        ------
+        ValidationError
+            If any operand pair is invalid for the Operation
+
+        Returns
+        -------
+        List[Operand]
+            The results, in input order
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+            log.info(f"Started {self.workers} parallel workers")
+        size = self.chunk_size
+        futures: List[Future] = [
+            self._pool.submit(execute_chunk, operation, xs[start:start + size], ys[start:start + size],
+                precision, backend)
+            for start in range(0, len(xs), size)
+        ]
+        results: List[Operand] = []
+        try:
+            for future in futures:
+                results.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+    def close(self) -> None:
+        """Stops the worker processes, if started"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+            log.info("Stopped parallel workers")
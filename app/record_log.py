@@ -0,0 +1,262 @@
+"""This module provides an indexed record log file format for random access to Calculation histories"""
+import datetime as dt
+import os
+import struct
+
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from app.calculation import Calculation, NUMERIC_BACKENDS
+from app.columnar_history import EPOCH, pack_decimal, to_decimal, unpack_decimal
+from app.exceptions import SerializationError
+
+_RECORD_HEAD = struct.Struct('<qiH')
+_FIELD_LENGTH = struct.Struct('<H')
+_OFFSET = struct.Struct('<Q')
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+def encode_record(calc: Calculation) -> bytes:
+    """
+    Encodes a Calculation as a single log record
+
+    Records hold the timestamp (int64 microseconds since the epoch), precision (int32),
+    the length-prefixed operation name, the three length-prefixed packed decimals,
+    and, for non-Decimal records only, a trailing backend code (uint8 index into
+    NUMERIC_BACKENDS), so Decimal records keep the original layout.
+
+    Parameters
+    ----------
+    calc: Calculation
+        The record to encode
+
+    Returns
+    -------
+    bytes
+        The encoded record
+    """
+    operation = calc.operation.encode('utf-8')
+    parts = [
+        _RECORD_HEAD.pack((calc.timestamp - EPOCH) // _MICROSECOND, int(calc.precision), len(operation)),
+        operation,
+    ]
+    for value in (calc.operandx, calc.operandy, calc.result):
+        packed = pack_decimal(to_decimal(value))
+        parts += [_FIELD_LENGTH.pack(len(packed)), packed]
+    if calc.backend != 'decimal':
+        parts.append(bytes([NUMERIC_BACKENDS.index(calc.backend)]))
+    return b''.join(parts)
+
+def decode_record(data: bytes) -> Calculation:
+    """
+    Decodes a log record produced by encode_record
+
+    Parameters
+    ----------
+    data: bytes
+        The encoded record
+
+    Raises
+    ------
+    SerializationError
+        If the record is truncated or malformed
+
+    Returns
+    -------
+    Calculation
+        The decoded record
+    """
+    try:
+        micros, precision, length = _RECORD_HEAD.unpack_from(data)
+        position = _RECORD_HEAD.size + length
+        operation = data[_RECORD_HEAD.size:position].decode('utf-8')
+        values = []
+        for _ in range(3):
+            (length,) = _FIELD_LENGTH.unpack_from(data, position)
+            position += _FIELD_LENGTH.size
+            values.append(unpack_decimal(data[position:position + length]))
+            position += length
+        backend = NUMERIC_BACKENDS[data[position]] if position < len(data) else 'decimal'
+        if backend == 'float':
+            values = list(map(float, values))
+    except (struct.error, UnicodeDecodeError, ValueError, ArithmeticError, IndexError) as e:
+        raise SerializationError(f"Invalid history log record: {e}")
+    return Calculation(operation, *values, precision, EPOCH + dt.timedelta(microseconds=micros), backend)
+
+class RecordLog:
+    """
+    Append-friendly history log with an offset index for constant-time random access.
+
+    Records are stored back to back in the log file, and a sidecar index file
+    ('<log>.idx') holds one uint64 start offset per record. Any entry, range or
+    tail can be read by seeking through the index, without decoding the rest of
+    the log.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Configures the log
+
+        Parameters
+        ----------
+        path: Path
+            Location of the log file. The index is kept alongside it
+        """
+        self.path = path
+        self.index_path = path.with_name(path.name + '.idx')
+
+    def write(self, calcs: Iterable[Calculation]) -> None:
+        """
+        Replaces the log contents
+
+        Both files are written to temporary paths and moved into place, log first
+
+        Parameters
+        ----------
+        calcs: Iterable[Calculation]
+            The records to write, in history order
+        """
+        records = [encode_record(calc) for calc in calcs]
+        offsets = array('Q', [0] * len(records))
+        position = 0
+        for i, record in enumerate(records):
+            offsets[i] = position
+            position += len(record)
+        temp_log = self.path.with_name(self.path.name + '.tmp')
+        temp_index = self.index_path.with_name(self.index_path.name + '.tmp')
+        temp_log.write_bytes(b''.join(records))
+        with open(temp_index, 'wb') as index:
+            offsets.tofile(index)
+        os.replace(temp_log, self.path)
+        os.replace(temp_index, self.index_path)
+
+    def append(self, calcs: Iterable[Calculation]) -> None:
+        """
+        Appends records to the log
+
+        Parameters
+        ----------
+        calcs: Iterable[Calculation]
+            The records to append, in history order
+        """
+        with open(self.path, 'ab') as log_file, open(self.index_path, 'ab') as index:
+            position = log_file.seek(0, os.SEEK_END)
+            for calc in calcs:
+                record = encode_record(calc)
+                index.write(_OFFSET.pack(position))
+                log_file.write(record)
+                position += len(record)
+
+    def truncate(self, count: int) -> None:
+        """
+        Drops the records after the first count, found through the index
+
+        The index is cut first, so an interrupted truncate leaves no record pointing past the log
+
+        Parameters
+        ----------
+        count: int
+            The number of records to keep
+        """
+        if count >= len(self):
+            return
+        with open(self.index_path, 'r+b') as index:
+            index.seek(count * _OFFSET.size)
+            (offset,) = _OFFSET.unpack(index.read(_OFFSET.size))
+            index.truncate(count * _OFFSET.size)
+        with open(self.path, 'r+b') as log_file:
+            log_file.truncate(offset)
+
+    def __len__(self) -> int:
+        """
+        Get the number of records in the log
+
+        Returns
+        -------
+        int
+            The record count, read from the index size
+        """
+        try:
+            return self.index_path.stat().st_size // _OFFSET.size
+        except FileNotFoundError:
+            return 0
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Calculation]:
+        """
+        Reads a contiguous range of records
+
+        Parameters
+        ----------
+        start: int, optional
+            First record position. Negative values count from the end
+        stop: Optional[int], optional
+            Record position to stop before. Reads to the end if not passed
+
+        Returns
+        -------
+        List[Calculation]
+            The records in the range, in log order
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+        with open(self.index_path, 'rb') as index:
+            index.seek(start * _OFFSET.size)
+            offsets = array('Q')
+            offsets.frombytes(index.read((stop - start + 1) * _OFFSET.size))
+        with open(self.path, 'rb') as log_file:
+            log_file.seek(offsets[0])
+            if len(offsets) > stop - start:
+                data = log_file.read(offsets[-1] - offsets[0])
+                offsets.pop()
+            else:
+                data = log_file.read()
+        base = offsets[0]
+        bounds = [offset - base for offset in offsets] + [len(data)]
+        return [decode_record(data[bounds[i]:bounds[i + 1]]) for i in range(len(offsets))]
+
+    def tail(self, count: int) -> List[Calculation]:
+        """
+        Reads the newest records
+
+        Parameters
+        ----------
+        count: int
+            The maximum number of records to read
+
+        Returns
+        -------
+        List[Calculation]
+            Up to count records, oldest first
+        """
+        return self.read(max(len(self) - count, 0)) if count > 0 else []
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Calculation, List[Calculation]]:
+        """
+        Reads a record by position, or a list of records by slice
+
+        Parameters
+        ----------
+        index: Union[int, slice]
+            A record position, or a slice of positions
+
+        Raises
+        ------
+        IndexError
+            If an integer index is out of range
+
+        Returns
+        -------
+        Union[Calculation, List[Calculation]]
+            The record at index, or the records selected by the slice
+        """
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                return [self[i] for i in range(*index.indices(len(self)))]
+            return self.read(index.start or 0, index.stop)
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RecordLog index out of range")
+        return self.read(index, index + 1)[0]
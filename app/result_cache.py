@@ -0,0 +1,207 @@
+"""This module provides a bounded memoizing cache for Operation results"""
+import threading
+
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+CACHE_POLICIES = ('lru', 'lfu')
+
+CacheKey = Tuple[str, Union[Decimal, float], Union[Decimal, float], int, str]
+
+class ResultCache:
+    """
+    Bounded cache of Operation results with LRU or LFU eviction.
+
+    Keys are (operation name, x, y, precision, numeric backend). Decimal operands
+    hash and compare by numeric value, so equal operands written differently, such
+    as 2 and 2.0, share an entry. Only successful results are stored; callers must not cache
+    exceptions. With the 'lfu' policy, ties between equally used entries are
+    broken by recency. All operations take constant time.
+    """
+
+    def __init__(self, max_size: int = 1024, policy: str = 'lru') -> None:
+        """
+        Configures the cache
+
+        Parameters
+        ----------
+        max_size: int, optional
+            Maximum number of stored results
+        policy: str, optional
+            'lru' to evict the least recently used result, or 'lfu' to evict the
+            least frequently used one
+
+        Raises
+        ------
+        ValueError
+            If the size or policy is invalid
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+        self.max_size = max_size
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._values: Dict[Hashable, Decimal] = {}
+        self._recency: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self._counts: Dict[Hashable, int] = {}
+        self._frequencies: Dict[int, 'OrderedDict[Hashable, None]'] = {}
+        self._min_count = 0
+
+    @staticmethod
+    def make_key(
+        operation: str,
+        x: Union[Decimal, float],
+        y: Union[Decimal, float],
+        precision: int,
+        backend: str = 'decimal'
+    ) -> CacheKey:
+        """
+        Builds the cache key for a Calculation
+
+        Parameters
+        ----------
+        operation: str
+            The Operation name
+        x: Union[Decimal, float]
+            The validated first operand
+        y: Union[Decimal, float]
+            The validated second operand
+        precision: int
+            The configured Decimal precision
+        backend: str, optional
+            The numeric backend, which keeps equal Decimal and float operands apart
+
+        Returns
+        -------
+        CacheKey
+            The key identifying the result
+        """
+        return (operation, x, y, precision, backend)
+
+    def get(self, key: Hashable) -> Optional[Decimal]:
+        """
+        Looks up a result, counting a hit or miss
+
+        Parameters
+        ----------
+        key: Hashable
+            A key from make_key
+
+        Returns
+        -------
+        Optional[Decimal]
+            The stored result, or None if it is not cached
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key)
+            return value
+
+    def put(self, key: Hashable, value: Decimal) -> None:
+        """
+        Stores a result, evicting another once the cache is full
+
+        Parameters
+        ----------
+        key: Hashable
+            A key from make_key
+        value: Decimal
+            The successful result for key
+        """
+        with self._lock:
+            if key in self._values:
+                self._values[key] = value
+                self._touch(key)
+                return
+            if len(self._values) >= self.max_size:
+                self._evict()
+            self._values[key] = value
+            if self.policy == 'lru':
+                self._recency[key] = None
+            else:
+                self._counts[key] = 1
+                self._frequencies.setdefault(1, OrderedDict())[key] = None
+                self._min_count = 1
+
+    def clear(self) -> None:
+        """Removes all results and resets the counters"""
+        with self._lock:
+            self._values.clear()
+            self._recency.clear()
+            self._counts.clear()
+            self._frequencies.clear()
+            self._min_count = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters
+
+        Returns
+        -------
+        Dict[str, int]
+            The hits, misses, evictions and current size
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._values),
+            }
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored results
+
+        Returns
+        -------
+        int
+            The entry count
+        """
+        return len(self._values)
+
+    def _touch(self, key: Hashable) -> None:
+        """
+        Records a use of a stored key. The lock must be held
+
+        Parameters
+        ----------
+        key: Hashable
+            The key being used
+        """
+        if self.policy == 'lru':
+            self._recency.move_to_end(key)
+            return
+        count = self._counts[key]
+        bucket = self._frequencies[count]
+        del bucket[key]
+        if not bucket:
+            del self._frequencies[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._frequencies.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _evict(self) -> None:
+        """Removes the entry chosen by the eviction policy. The lock must be held"""
+        if self.policy == 'lru':
+            key, _ = self._recency.popitem(last=False)
+        else:
+            bucket = self._frequencies[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._frequencies[self._min_count]
+            del self._counts[key]
+        del self._values[key]
+        self.evictions += 1
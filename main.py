@@ -1,4 +1,24 @@
+import time
+
+started = time.perf_counter()
+
+import argparse
+import sys
+
+from app.bulk_job import bulk_job_command
 from app.calculator_repl import calculator_repl
+from app.calculator_script import calculator_script
 
 if __name__ == "__main__":
-    calculator_repl()
+    parser = argparse.ArgumentParser(description="Python REPL Calculator")
+    parser.add_argument('--script', metavar='FILE',
+        help="run one command per line from FILE, or '-' for standard input, instead of prompting")
+    parser.add_argument('--bulk', nargs=2, metavar=('INPUT', 'OUTPUT'),
+        help="evaluate the operation, operandx and operandy columns of the INPUT csv file into OUTPUT")
+    args = parser.parse_args()
+
+    if args.bulk is not None:
+        sys.exit(bulk_job_command(*args.bulk))
+    if args.script is not None or not sys.stdin.isatty():
+        sys.exit(calculator_script(args.script, started))
+    calculator_repl(started)
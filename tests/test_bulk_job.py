@@ -0,0 +1,92 @@
+"""This module provides the test suite for the bulk job runner in app.bulk_job"""
+import csv
+import pytest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from app.bulk_job import BulkJobReport, bulk_job_command, run_bulk_job
+from app.calculator_config import CalculatorConfig
+from app.exceptions import SerializationError
+
+def write_rows(path: Path, rows: list, encoding: str) -> Path:
+    with open(path, 'w', newline='', encoding=encoding) as file:
+        csv.writer(file).writerows(rows)
+    return path
+
+def read_rows(path: Path, encoding: str) -> list:
+    with open(path, newline='', encoding=encoding) as file:
+        return list(csv.reader(file))
+
+@pytest.fixture
+def config(tmp_path):
+    return CalculatorConfig(base_dir=tmp_path, bulk_chunk_size=2, max_input_value=1000, default_encoding='utf-8')
+
+def test_run_bulk_job(tmp_path, config):
+    source = write_rows(tmp_path / "in.csv", [
+        ['id', 'operation', 'operandx', 'operandy'],
+        ['1', 'add', '3', '4'],
+        ['2', 'Division', '1', '4'],
+        ['3', 'divide', '1', '0'],
+        ['4', 'modulo', '1', '2'],
+        ['5', 'power', 'x', '2'],
+        ['6', 'root', '9', '2'],
+    ], 'utf-8')
+    progress = []
+    report = run_bulk_job(source, tmp_path / "out.csv", config, lambda job: progress.append(job.rows))
+
+    assert read_rows(tmp_path / "out.csv", 'utf-8') == [
+        ['id', 'operation', 'operandx', 'operandy', 'result', 'error'],
+        ['1', 'add', '3', '4', '7', ''],
+        ['2', 'Division', '1', '4', '0.25', ''],
+        ['3', 'divide', '1', '0', '', 'Divisor operand cannot be 0'],
+        ['4', 'modulo', '1', '2', '', 'Unknown operation: modulo'],
+        ['5', 'power', 'x', '2', '', 'Invalid number format: x'],
+        ['6', 'root', '9', '2', '3', ''],
+    ]
+    assert (report.rows, report.failures) == (6, 3)
+    assert progress == [2, 4, 6]
+
+def test_run_bulk_job_float_backend(tmp_path, config):
+    config.numeric_backend = 'float'
+    config.bulk_chunk_size = 10
+    source = write_rows(tmp_path / "in.csv", [
+        ['operation', 'operandx', 'operandy'],
+        ['divide', '1', '4'],
+        ['power', '2', '0.5'],
+        ['divide', '1', '8'],
+    ], 'utf-8')
+    report = run_bulk_job(source, tmp_path / "out.csv", config)
+    assert [row[3] for row in read_rows(tmp_path / "out.csv", 'utf-8')[1:]] == ['0.25', '1.4142135623730951', '0.125']
+    assert report.failures == 0
+
+def test_run_bulk_job_missing_columns(tmp_path, config):
+    source = write_rows(tmp_path / "in.csv", [['operation', 'x', 'y'], ['add', '1', '2']], 'utf-8')
+    with pytest.raises(SerializationError, match="Bulk job input is missing columns: operandx, operandy"):
+        run_bulk_job(source, tmp_path / "out.csv", config)
+
+def test_report():
+    report = BulkJobReport()
+    assert report.throughput == 0.0
+    report = BulkJobReport(rows=500, failures=2, seconds=0.25)
+    assert report.throughput == 2000.0
+    assert str(report) == "500 rows, 2 failed, 0.2 s, 2000 rows/s"
+
+@pytest.mark.parametrize(
+        "rows, expected",
+        [
+            ([['operation', 'operandx', 'operandy'], ['add', '1', '2']], 0),
+            ([['operation', 'operandx', 'operandy'], ['add', '1', 'x']], 1),
+            ([['operation']], 1),
+        ],
+        ids=[
+            "success",
+            "failed_rows",
+            "invalid_input",
+])
+def test_bulk_job_command(tmp_path, config, capsys, rows: list, expected: int):
+    source = write_rows(tmp_path / "in.csv", rows, config.default_encoding)
+    with patch('app.bulk_job.CalculatorConfig', return_value=config):
+        assert bulk_job_command(str(source), str(tmp_path / "out.csv")) == expected
+    err = capsys.readouterr().err
+    assert ("Error: Bulk job failed" in err) is (rows == [['operation']])
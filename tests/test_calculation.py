@@ -5,9 +5,11 @@ import logging as log
 from decimal import Decimal
 from datetime import datetime
 from typing import Dict, Any
+from unittest.mock import patch
 
 from app.calculation import Calculation
 from app.exceptions import SerializationError
+from app.operations import OperationFactory
 
 @pytest.mark.parametrize(
         "data, expected",
@@ -108,7 +110,8 @@ def test_to_dict():
         "operandy": Decimal(6),
         "result": Decimal(14),
         "precision": calc.precision,
-        "timestamp": calc.timestamp.isoformat()
+        "timestamp": calc.timestamp.isoformat(),
+        "backend": "decimal",
     }
 
 def test_to_str():
@@ -122,7 +125,7 @@ def test_repr():
     assert calc.__repr__() == (
         "Calculation(operation='add', operandx = 8, operandy = 6, result = 14, "
         f"precision = {calc.precision}, "
-        f"timestamp = '{calc.timestamp.isoformat()}')"
+        f"timestamp = '{calc.timestamp.isoformat()}', backend = 'decimal')"
     )
 
 def test_valid_eq():
@@ -149,3 +152,126 @@ def test_valid_eq():
 def test_bad_eq(other: object):
     calc = Calculation(operation="add", operandx=Decimal("8"), operandy=Decimal("6"), result=Decimal("14"))
     assert not calc.__eq__(other), f"Object <{other.__repr__}> flagged as equal to <{calc.__repr__}>"
+
+def test_from_columns():
+    """Tests bulk deserialization from string and datetime columns"""
+    now = datetime.now()
+    calcs = Calculation.from_columns({
+        "operation": ["add", "multiply"],
+        "operandx": ["0.1000000000000000000001", "6"],
+        "operandy": ["2", "8"],
+        "result": ["2.1000000000000000000001", "48"],
+        "precision": ["10", 10],
+        "timestamp": [now.isoformat(), now.isoformat()],
+    })
+    assert calcs[0].operandx == Decimal("0.1000000000000000000001")
+    assert calcs[0].result == Decimal("2.1000000000000000000001")
+    assert calcs[1].precision == 10
+    assert calcs[1].timestamp == now
+    assert Calculation.from_columns({
+        "operation": ["add"], "operandx": [1], "operandy": [1], "result": [2],
+        "precision": [10], "timestamp": [now],
+    })[0].timestamp == now
+
+def test_from_columns_mixed_backends():
+    """Tests that float backend rows are parsed as floats and decimal rows as Decimals"""
+    now = datetime.now().isoformat()
+    calcs = Calculation.from_columns({
+        "operation": ["add", "divide"],
+        "operandx": ["0.1", "1"],
+        "operandy": ["0.2", "3"],
+        "result": [repr(0.1 + 0.2), "0.3333333333"],
+        "precision": ["10", "10"],
+        "timestamp": [now, now],
+        "backend": ["float", "decimal"],
+    })
+    assert calcs[0].backend == 'float'
+    assert calcs[0].result == 0.1 + 0.2 and isinstance(calcs[0].operandx, float)
+    assert calcs[1].backend == 'decimal'
+    assert calcs[1].operandx == Decimal(1) and isinstance(calcs[1].operandx, Decimal)
+
+@patch('app.calculation.log.warning')
+def test_float_backend_validation(mock_warning):
+    """Tests that float records are recomputed with float arithmetic and compared exactly"""
+    Calculation.validate_many([
+        Calculation("divide", 1.0, 3.0, 1 / 3, backend='float'),
+        Calculation("add", 0.1, 0.2, 0.3, backend='float'),
+    ])
+    mock_warning.assert_called_once_with(
+        f"Loaded calculation result 0.3 differs from computed result {0.1 + 0.2}")
+
+def test_from_dict_float_backend():
+    """Tests that from_dict restores float records and rejects unknown backends"""
+    data = {"operation": "multiply", "operandx": 1.5, "operandy": 2.0, "result": 3.0,
+            "precision": 10, "timestamp": datetime.now().isoformat(), "backend": "float"}
+    calc = Calculation.from_dict(data)
+    assert (calc.backend, calc.result) == ('float', 3.0)
+    assert isinstance(calc.result, float)
+    with pytest.raises(SerializationError, match="Data record contains an invalid backend tag: binary"):
+        Calculation.from_dict({**data, "backend": "binary"})
+    with pytest.raises(SerializationError, match="Error in field deserialization: could not convert"):
+        Calculation.from_dict({**data, "result": "three"})
+
+@pytest.mark.parametrize(
+        "column, value, expected",
+        [
+            ("result", "fourteen", "Error in field deserialization: Invalid data passed to Decimal()"),
+            ("precision", "ten", "Error in field deserialization: invalid literal"),
+            ("timestamp", "yesterday", "Error in field deserialization: Invalid isoformat"),
+            ("operation", "nonsense", "Data record contains an invalid operation tag"),
+            ("backend", "binary", "Data record contains an invalid backend tag: binary"),
+        ],
+        ids=[
+            "bad_decimal_value",
+            "bad_precision_value",
+            "bad_timestamp_value",
+            "bad_op_tag",
+            "bad_backend_tag",
+])
+def test_err_from_columns(column: str, value: Any, expected: str):
+    """Tests error handling on the from_columns method"""
+    columns = {
+        "operation": ["add"], "operandx": ["8"], "operandy": ["6"], "result": ["14"],
+        "precision": ["10"], "timestamp": [datetime.now().isoformat()],
+    }
+    columns[column] = [value]
+    with pytest.raises(SerializationError, match=expected):
+        Calculation.from_columns(columns)
+
+def test_from_columns_missing_column():
+    """Tests error handling on a missing column"""
+    with pytest.raises(SerializationError, match="Error in field deserialization: 'timestamp'"):
+        Calculation.from_columns({"operation": []})
+
+def test_from_columns_unverified():
+    """Tests that from_columns skips result recomputation when verify is disabled"""
+    columns = {
+        "operation": ["add"], "operandx": ["8"], "operandy": ["6"], "result": ["14"],
+        "precision": ["10"], "timestamp": [datetime.now().isoformat()],
+    }
+    with patch.object(Calculation, 'validate_many') as mock_validate:
+        Calculation.from_columns(columns, verify=False)
+        mock_validate.assert_not_called()
+
+def test_from_columns_unequal_lengths():
+    """Tests that columns of unequal length are rejected rather than truncated"""
+    columns = {
+        "operation": ["add", "add"], "operandx": ["8", "1"], "operandy": ["6", "1"], "result": ["14"],
+        "precision": ["10", "10"], "timestamp": [datetime.now().isoformat()] * 2,
+    }
+    with pytest.raises(SerializationError, match="Error in field deserialization: zip()"):
+        Calculation.from_columns(columns)
+
+@patch('app.calculation.log.warning')
+def test_validate_many(mock_warning):
+    """Tests that bulk validation creates each operation once and logs mismatches"""
+    calcs = [
+        Calculation("add", Decimal(1), Decimal(2), Decimal(3)),
+        Calculation("add", Decimal(2), Decimal(2), Decimal(5)),
+        Calculation("divide", Decimal(1), Decimal(3), Decimal("0.3333"), 4),
+    ]
+    with patch('app.calculation.OperationFactory.create_operation',
+               wraps=OperationFactory.create_operation) as mock_create:
+        Calculation.validate_many(calcs)
+    assert [c.args for c in mock_create.call_args_list] == [("add",), ("divide",)]
+    mock_warning.assert_called_once_with("Loaded calculation result 5 differs from computed result 4")
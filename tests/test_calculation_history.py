@@ -0,0 +1,79 @@
+"""This module provides the test suite for the CalculationHistory ring buffer"""
+import pytest
+
+from decimal import Decimal
+
+from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
+
+def make_calc(x: int) -> Calculation:
+    return Calculation(operation="add", operandx=Decimal(x), operandy=Decimal(0), result=Decimal(x))
+
+def results(history: CalculationHistory):
+    return [int(calc.result) for calc in history]
+
+def test_append_and_index():
+    """Tests indexed access from both ends"""
+    history = CalculationHistory()
+    [history.append(make_calc(i)) for i in range(3)]
+    assert len(history) == 3
+    assert history[0] == make_calc(0)
+    assert history[-1] == make_calc(2)
+    with pytest.raises(IndexError):
+        history[3]
+    with pytest.raises(IndexError):
+        history[-4]
+
+def test_wraparound_eviction():
+    """Tests that steady-state append and eviction reuse slots without growth"""
+    history = CalculationHistory(make_calc(i) for i in range(8))
+    history.append(make_calc(8))
+    history.drop_left(1)
+    capacity = history.capacity
+    for i in range(9, 20):
+        history.append(make_calc(i))
+        assert history.drop_left(1)[0] == make_calc(i - 8)
+    assert history.capacity == capacity
+    assert results(history) == list(range(12, 20))
+    assert history[1:3] == [make_calc(13), make_calc(14)]
+    assert history[::-4] == [make_calc(19), make_calc(15)]
+
+def test_prepend_and_drop_right():
+    """Tests restoring entries at the front and removing them from the back"""
+    history = CalculationHistory([make_calc(2), make_calc(3)])
+    history.prepend([make_calc(0), make_calc(1)])
+    assert results(history) == [0, 1, 2, 3]
+    assert history.drop_right(2) == [make_calc(2), make_calc(3)]
+    assert results(history) == [0, 1]
+
+def test_drop_bounds():
+    """Tests that drops clamp to the stored record count"""
+    history = CalculationHistory([make_calc(0)])
+    assert history.drop_left(-1) == []
+    assert history.drop_right(5) == [make_calc(0)]
+    assert len(history) == 0
+
+def test_growth_preserves_order():
+    """Tests reallocation while the ring is wrapped"""
+    history = CalculationHistory(make_calc(i) for i in range(8))
+    history.drop_left(5)
+    history.extend(make_calc(i) for i in range(8, 20))
+    assert results(history) == list(range(5, 20))
+
+def test_clear_and_copy():
+    """Tests clear and list copies"""
+    history = CalculationHistory([make_calc(0), make_calc(1)])
+    snapshot = history.copy()
+    history.clear()
+    assert history == []
+    assert snapshot == [make_calc(0), make_calc(1)]
+
+def test_equality_and_repr():
+    """Tests comparisons against other sequences"""
+    history = CalculationHistory([make_calc(0)])
+    assert history == CalculationHistory([make_calc(0)])
+    assert history == (make_calc(0),)
+    assert history != [make_calc(1)]
+    assert history != "history"
+    assert make_calc(0) in history
+    assert repr(history).startswith("CalculationHistory([")
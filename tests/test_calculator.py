@@ -1,5 +1,8 @@
 """This module provides a test suite for the Calculator class in app.calculator"""
 import datetime
+import os
+import threading
+import time
 import pandas as pd
 import pytest
 
@@ -11,9 +14,13 @@ from tempfile import TemporaryDirectory
 from app.calculator import Calculator
 from app.calculator_repl import calculator_repl
 from app.calculator_config import CalculatorConfig
-from app.exceptions import OperationError, ValidationError
+from app.exceptions import BatchValidationError, ConfigurationError, OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
+from app.history_store import CsvHistoryStore, SQLiteHistoryStore
+from app.lazy_import import _LazyModule
 from app.operations import OperationFactory
+from app.parallel_executor import ParallelExecutor
+from app.result_cache import ResultCache
 
 @pytest.fixture
 def calculator():
@@ -43,6 +50,29 @@ def test_calculator_init(calculator):
     assert calculator.redo_stack == []
     assert calculator.operation_strategy is None
 
+def test_history_loads_on_first_access(calculator):
+    assert list(calculator.startup_timings) == ['config', 'logging', 'setup']
+    with patch.object(Calculator, 'load_history', autospec=True,
+            side_effect=Calculator.load_history) as mock_load:
+        assert calculator.history == []
+        assert calculator.show_history() == []
+        mock_load.assert_called_once()
+    assert 'history_load' in calculator.startup_timings
+    assert calculator.undo_stack == []
+
+@patch('app.calculator.log.warning')
+def test_failed_initial_load(mock_warning, calculator):
+    with patch.object(Calculator, 'load_history', side_effect=OperationError("History Load Failed: bad file")):
+        assert calculator.history == []
+    mock_warning.assert_called_once_with("History Load failed: History Load Failed: bad file")
+
+def test_startup_report(calculator):
+    started = time.perf_counter()
+    calculator.startup_timings = {'config': 0.0012, 'logging': 0.5}
+    report = calculator.startup_report()
+    assert report == "Startup: config 1.2 ms, logging 500.0 ms"
+    assert calculator.startup_report(started).startswith(f"{report}, first prompt ")
+
 @patch('app.calculator.log.info')
 def test_logging_setup(logging_info_mock):
     with patch.object(CalculatorConfig, 'log_dir', \
@@ -53,6 +83,24 @@ def test_logging_setup(logging_info_mock):
         calculator = Calculator(CalculatorConfig())
         logging_info_mock.assert_any_call("Calculator configured successfully")
 
+def test_logging_pipeline_setup(tmp_path):
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+        patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+        patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+        patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_history_file.return_value = tmp_path / "history/calculator_history.csv"
+
+        calculator = Calculator(CalculatorConfig(base_dir=tmp_path, log_pipeline=True, log_flush_interval=60))
+        assert calculator.log_pipeline.running
+        calculator.close()
+        assert not calculator.log_pipeline.running
+        log_text = (tmp_path / "logs/calculator.log").read_text(calculator.config.default_encoding)
+        assert "Calculator configured successfully" in log_text
+
 def test_add_observer(calculator):
     observer = LoggingObserver()
     calculator.add_observer(observer)
@@ -113,8 +161,9 @@ def test_undo_unavailable(calculator):
 def test_redo_unavailable(calculator):
     assert calculator.redo() == False
 
+@patch('app.calculator.Calculator._write_history_digest')
 @patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
+def test_save_history(mock_to_csv, mock_write_digest, calculator):
     operation = OperationFactory.create_operation('add')
     calculator.set_operation(operation)
     calculator.perform_operation(8, 6)
@@ -179,3 +228,601 @@ def test_get_dataframe(calculator):
     calculator.perform_operation(8, 6)
     df = calculator.get_history_dataframe()
     assert isinstance(df, pd.DataFrame)
+
+def test_perform_many_pairs(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    results = calculator.perform_many([(1, 2), ('3', '4'), (Decimal('5'), 6)])
+    assert results == [Decimal('3'), Decimal('7'), Decimal('11')]
+    assert len(calculator.history) == 3
+    assert len(calculator.undo_stack) == 1
+
+def test_perform_many_columns(calculator):
+    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    results = calculator.perform_many([2, 3], [4, 5])
+    assert results == [Decimal('8'), Decimal('15')]
+
+def test_perform_many_single_notification(calculator):
+    observer = Mock()
+    calculator.add_observer(observer)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(1, 2), (3, 4)])
+    observer.update_batch.assert_called_once()
+    observer.update.assert_not_called()
+
+def test_perform_many_undo(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.perform_many([(1, 2), (3, 4)])
+    calculator.undo()
+    assert len(calculator.history) == 1
+
+def test_perform_many_overflow(calculator):
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(1, 1), (2, 2), (3, 3)])
+    assert [calc.result for calc in calculator.history] == [Decimal('4'), Decimal('6')]
+
+def test_perform_many_empty(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    assert calculator.perform_many([]) == []
+    assert calculator.undo_stack == []
+
+def test_perform_many_atomic(calculator):
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    with pytest.raises(ValidationError):
+        calculator.perform_many([(4, 2), (1, 0)])
+    assert calculator.history == []
+
+def test_perform_many_reports_every_invalid_pair(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    with pytest.raises(BatchValidationError, match="3 invalid values: \\[1\\] Invalid number format: a; ") as info:
+        calculator.perform_many(['1', 'a', '3', '4'], ['1', 'b', 'c', '1e9999'])
+    errors = info.value.errors
+    assert list(errors) == [1, 2, 3]
+    assert errors[1] == "Invalid number format: a"
+    assert errors[2] == "Invalid number format: c"
+    assert errors[3].startswith("Value exceeds allowed maximum")
+    assert calculator.history == []
+
+def test_perform_many_parallel(calculator):
+    calculator.parallel = ParallelExecutor(workers=2, chunk_size=2)
+    calculator.config.parallel_chunk_size = 2
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    try:
+        with patch.object(calculator.parallel, 'map', wraps=calculator.parallel.map) as mock_map:
+            assert calculator.perform_many([(1, 2), (3, 2)]) == [Decimal(1), Decimal(9)]
+            mock_map.assert_not_called()
+            assert calculator.perform_many(range(5), [2] * 5) == [Decimal(i * i) for i in range(5)]
+            mock_map.assert_called_once()
+        assert [calc.operandx for calc in calculator.history] == [Decimal(i) for i in (1, 3, 0, 1, 2, 3, 4)]
+        assert len(calculator.undo_stack) == 2
+    finally:
+        calculator.close()
+    assert calculator.parallel._pool is None
+
+def test_parallel_config(tmp_path):
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+        patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        calc = Calculator(CalculatorConfig(base_dir=tmp_path, parallel_workers=3, parallel_chunk_size=50))
+    assert (calc.parallel.workers, calc.parallel.chunk_size) == (3, 50)
+    calc.close()
+
+def test_perform_many_errors(calculator):
+    with pytest.raises(OperationError, match="No strategy set"):
+        calculator.perform_many([(1, 2)])
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    with pytest.raises(OperationError, match="differ in length"):
+        calculator.perform_many([1, 2], [3])
+    with pytest.raises(ValidationError, match=r"Operands must be \(x, y\) pairs"):
+        calculator.perform_many([(1, 2), (1, 2, 3)])
+    with pytest.raises(ValidationError, match=r"Operands must be \(x, y\) pairs"):
+        calculator.perform_many([(1, 2), 5])
+    assert calculator.history == []
+    assert calculator.undo_stack == []
+
+def test_undo_redo_eviction(calculator):
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(3):
+        calculator.perform_operation(i, 0)
+    assert [calc.result for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+    calculator.undo()
+    assert [calc.result for calc in calculator.history] == [Decimal('0'), Decimal('1')]
+    calculator.redo()
+    assert [calc.result for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+
+def test_undo_stack_stores_deltas(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(5):
+        calculator.perform_operation(i, 0)
+    assert all(len(memento.appended) == 1 for memento in calculator.undo_stack)
+    assert all(memento.cleared is None for memento in calculator.undo_stack)
+
+def test_undo_load(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.save_history()
+    calculator.perform_operation(2, 2)
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    calculator.undo()
+    assert len(calculator.history) == 2
+    calculator.redo()
+    assert len(calculator.history) == 1
+
+@pytest.fixture
+def journal_calculator():
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+            patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+            patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+            patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file, \
+            patch.object(CalculatorConfig, 'journal_file', new_callable=PropertyMock) as mock_journal_file:
+
+            mock_log_dir.return_value = temp_path / "logs"
+            mock_log_file.return_value = temp_path / "logs/calculator.log"
+            mock_history_dir.return_value = temp_path / "history"
+            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
+            mock_journal_file.return_value = temp_path / "history/calculator_history.journal"
+
+            def make_calculator():
+                config = CalculatorConfig(base_dir=temp_path, auto_save=True,
+                    auto_save_mode='journal', journal_compact_interval=4)
+                calc = Calculator(config=config)
+                calc.add_observer(AutoSaveObserver(calc))
+                return calc
+
+            yield make_calculator
+
+def test_journal_autosave_appends(journal_calculator):
+    calc = journal_calculator()
+    calc.set_operation(OperationFactory.create_operation('add'))
+    with patch.object(Calculator, 'save_history') as mock_save:
+        calc.perform_operation(1, 1)
+        calc.perform_many([(2, 2), (3, 3)])
+        mock_save.assert_not_called()
+    assert calc.journal.record_count == 2
+    assert len(calc.journal.path.read_text(calc.journal.encoding).splitlines()) == 2
+
+def test_journal_restores_session(journal_calculator):
+    calc = journal_calculator()
+    calc.set_operation(OperationFactory.create_operation('add'))
+    calc.perform_operation(1, 1)
+    calc.perform_operation(2, 2)
+    calc.undo()
+    restored = journal_calculator()
+    assert [c.result for c in restored.history] == [Decimal('2')]
+    calc.redo()
+    restored = journal_calculator()
+    assert [c.result for c in restored.history] == [Decimal('2'), Decimal('4')]
+    calc.clear_history()
+    assert journal_calculator().history == []
+
+def test_journal_compaction(journal_calculator):
+    calc = journal_calculator()
+    calc.set_operation(OperationFactory.create_operation('add'))
+    for i in range(4):
+        calc.perform_operation(i, 0)
+    assert calc.journal.record_count == 0
+    assert not calc.journal.path.exists()
+    calc.perform_operation(9, 0)
+    calc.undo()
+    calc.redo()
+    calc.undo()
+    assert calc.journal.record_count == 0
+    assert len(journal_calculator().history) == 4
+
+def test_journal_compacts_on_load_undo(journal_calculator):
+    calc = journal_calculator()
+    calc.set_operation(OperationFactory.create_operation('add'))
+    calc.perform_operation(1, 1)
+    calc.load_history()
+    with patch.object(Calculator, 'save_history') as mock_save:
+        calc.undo()
+        mock_save.assert_called_once()
+
+def test_reload_into_journal_mode(calculator):
+    """Tests that a reload cannot switch to journal mode, which the Calculator sets up only at startup"""
+    calculator.config.auto_save = True
+    calculator.add_observer(AutoSaveObserver(calculator))
+    with patch.dict(os.environ, {'CALCULATOR_AUTO_SAVE_MODE': 'journal'}):
+        with pytest.raises(ConfigurationError, match="auto_save_mode setting must not change on reload"):
+            calculator.config.reload()
+    assert calculator.config.auto_save_mode == 'full'
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    assert calculator.observer_errors == []
+    assert len(calculator.history_store.load(10)) == 1
+
+def test_save_load_exact_round_trip(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation('0.1000000000000000000001', '123.456789123456789123456789')
+    expected = calculator.history.copy()
+    calculator.save_history()
+    calculator.clear_history()
+    calculator.load_history()
+    assert calculator.history == expected
+    assert calculator.history[0].timestamp == expected[0].timestamp
+
+@pytest.mark.parametrize(
+        "history_format",
+        ['csv', 'columnar', 'records', 'sqlite'],
+        ids=['csv', 'columnar', 'records', 'sqlite'],
+)
+def test_float_backend(calculator, history_format):
+    calculator.config.numeric_backend = 'float'
+    calculator.config.history_format = history_format
+    calculator.result_cache = ResultCache(8)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    result = calculator.perform_operation('0.1', 0.2)
+    assert isinstance(result, float) and result == 0.1 + 0.2
+    assert calculator.perform_many([(1, '2.5')]) == [3.5]
+    calculator.config.numeric_backend = 'decimal'
+    assert calculator.perform_operation('0.1', '0.2') == Decimal('0.3')
+    assert calculator.result_cache.stats()['size'] == 3
+    with patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+        mock_history_file.return_value = calculator.config.history_dir / f"calculator_history.{history_format}"
+        expected = calculator.history.copy()
+        calculator.save_history()
+        calculator.clear_history()
+        calculator.load_history()
+    assert calculator.history == expected
+    assert [calc.backend for calc in calculator.history] == ['float', 'float', 'decimal']
+    assert isinstance(calculator.history[0].result, float)
+
+def test_save_writes_digest(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(8, 6)
+    calculator.save_history()
+    digest_file = calculator._history_digest_file
+    assert digest_file.read_text().split() == [
+        calculator._hash_history_file(), calculator.config.history_file.name]
+
+@pytest.mark.parametrize(
+        "trusted, tamper, verified",
+        [
+            (False, None, True),
+            (True, None, False),
+            (True, 'digest', True),
+            (True, 'missing', True),
+        ],
+        ids=[
+            "untrusted",
+            "trusted_match",
+            "trusted_mismatch",
+            "trusted_no_digest",
+])
+def test_trusted_load(calculator, trusted, tamper, verified):
+    calculator.config.trusted_load = trusted
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(8, 6)
+    calculator.save_history()
+    if tamper == 'digest':
+        calculator._history_digest_file.write_text("0" * 64 + "  tampered.csv\n")
+    elif tamper == 'missing':
+        calculator._history_digest_file.unlink()
+    with patch('app.calculation.Calculation.validate_many') as mock_validate:
+        calculator.load_history()
+    assert mock_validate.called is verified
+    assert len(calculator.history) == 1
+
+def test_columnar_save_load(calculator):
+    calculator.config.history_format = 'columnar'
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(1, 1), (2, 2), ('0.1000000000000000000001', 3)])
+    expected = calculator.history.copy()
+    calculator.save_history()
+    assert not calculator._history_digest_file.exists()
+    calculator.clear_history()
+    calculator.load_history()
+    assert calculator.history == expected
+
+def test_columnar_load_tail(calculator):
+    calculator.config.history_format = 'columnar'
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(i, 0) for i in range(5)])
+    calculator.save_history()
+    calculator.config.max_history_size = 2
+    calculator.load_history()
+    assert [calc.result for calc in calculator.history] == [Decimal('3'), Decimal('4')]
+
+@pytest.mark.parametrize("history_format", ['columnar', 'records', 'sqlite'])
+def test_random_access_history(calculator, history_format):
+    calculator.config.history_format = history_format
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(i, 0) for i in range(6)])
+    calculator.save_history()
+    assert calculator.get_history_entry(2).result == Decimal('2')
+    assert calculator.get_history_entry(-1).result == Decimal('5')
+    assert [c.result for c in calculator.get_history_range(1, 3)] == [Decimal('1'), Decimal('2')]
+    assert [c.result for c in calculator.get_history_tail(2)] == [Decimal('4'), Decimal('5')]
+    assert calculator.get_history_tail(0) == []
+    with pytest.raises(IndexError):
+        calculator.get_history_entry(6)
+    calculator.config.max_history_size = 3
+    calculator.load_history()
+    assert [c.result for c in calculator.history] == [Decimal('3'), Decimal('4'), Decimal('5')]
+
+def test_record_log_archive(calculator):
+    calculator.config.history_format = 'records'
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_many([(i, 0) for i in range(10)])
+    calculator.save_history()
+    calculator.config.max_history_size = 3
+    calculator.load_history()
+    calculator.perform('add', 10, 0)
+    calculator.save_history()
+    archive = calculator.history_store.read()
+    assert [calc.result for calc in archive] == [Decimal(i) for i in range(11)]
+    calculator.undo()
+    calculator.save_history()
+    assert calculator.history_store.read() == archive[:10]
+    calculator.load_history()
+    assert [calc.result for calc in calculator.history] == [Decimal('7'), Decimal('8'), Decimal('9')]
+
+def test_random_access_csv(calculator):
+    with pytest.raises(OperationError, match="does not support random access"):
+        calculator.get_history_entry(0)
+
+def test_history_store_follows_config(calculator):
+    store = calculator.history_store
+    assert isinstance(store, CsvHistoryStore)
+    assert calculator.history_store is store
+    calculator.config.history_format = 'sqlite'
+    assert isinstance(calculator.history_store, SQLiteHistoryStore)
+    with patch.object(SQLiteHistoryStore, 'close') as mock_close:
+        calculator.config.history_format = 'records'
+        calculator.history_store
+        mock_close.assert_called_once()
+    calculator.close()
+
+def test_sqlite_history(calculator):
+    calculator.config.history_format = 'sqlite'
+    calculator.config.max_history_size = 3
+    calculator.add_observer(AutoSaveObserver(calculator))
+    with patch.object(Calculator, '_write_history_digest') as mock_digest:
+        for i in range(5):
+            calculator.perform('add' if i % 2 else 'subtract', i, 1)
+        calculator.undo()
+        mock_digest.assert_not_called()
+    calculator.save_history()
+    expected = calculator.history.copy()
+    assert calculator.history_store.read() == expected
+    assert [calc.result for calc in expected] == [Decimal('2'), Decimal('1'), Decimal('4')]
+    assert calculator.find_history('add') == [expected[0], expected[2]]
+    assert calculator.find_history('subtraction', limit=1) == [expected[1]]
+    assert calculator.find_history(since=expected[-1].timestamp) == [expected[-1]]
+    assert calculator.find_history(until=expected[0].timestamp) == []
+    with pytest.raises(OperationError, match="Unknown operation: nope"):
+        calculator.find_history('nope')
+
+    calculator.close()
+    with patch.object(CalculatorConfig, 'journal_file', new_callable=PropertyMock) as mock_journal:
+        mock_journal.return_value = calculator.config.history_dir / "unused.journal"
+        reloaded = Calculator(calculator.config)
+        assert reloaded.history == expected
+        reloaded.close()
+
+def test_find_history_csv(calculator):
+    with pytest.raises(OperationError, match="History format 'csv' does not support queries"):
+        calculator.find_history('add')
+
+def test_close_observers(calculator):
+    observers = [Mock(), Mock()]
+    observers[0].close.side_effect = OperationError("save failed")
+    [calculator.add_observer(observer) for observer in observers]
+    with pytest.raises(OperationError, match="Observer shutdown failed: save failed"):
+        calculator.close()
+    observers[1].close.assert_called_once()
+    observers[0].close.side_effect = None
+    calculator.close()
+
+def test_async_observer_dispatch(calculator):
+    calculator.config.observer_dispatch = 'async'
+    delivered = []
+    observer = Mock()
+    observer.update.side_effect = lambda calc: (time.sleep(0.05), delivered.append(calc))
+    calculator.add_observer(observer)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    start = time.monotonic()
+    calc = calculator.perform_operation(1, 2)
+    calculator.perform_operation(2, 3)
+    assert time.monotonic() - start < 0.1
+    lag = calculator.observer_lag()
+    assert lag['Mock']['pending'] == 2
+    assert lag['Mock']['dropped'] == 0
+    calculator.remove_observer(observer)
+    assert calculator.observers == []
+    assert delivered[0].result == calc
+    assert len(delivered) == 2
+
+def test_observer_lag_inline(calculator):
+    calculator.add_observer(LoggingObserver())
+    assert calculator.observer_lag() == {}
+
+def test_observer_failure_keeps_calculation(calculator):
+    failing, working = Mock(), Mock()
+    failing.update.side_effect = OperationError("Auto-save failed: disk full")
+    calculator.add_observer(failing)
+    calculator.add_observer(working)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    assert calculator.perform_operation(3, 4) == Decimal('7')
+    assert len(calculator.history) == 1
+    working.update.assert_called_once()
+    errors = calculator.pop_observer_errors()
+    assert [str(e) for e in errors] == ["Auto-save failed: disk full"]
+    assert calculator.pop_observer_errors() == []
+
+def test_perform_named_operation(calculator):
+    assert calculator.perform('add', 3, 4) == Decimal('7')
+    assert calculator.perform('Multiplication', 3, 4) == Decimal('12')
+    assert calculator.operation_strategy is None
+    assert [calc.operation for calc in calculator.history] == ['Addition', 'Multiplication']
+    with pytest.raises(OperationError, match="Operation Failed: Unknown operation: nope"):
+        calculator.perform('nope', 3, 4)
+
+def test_concurrent_perform(calculator):
+    calculator.config.max_history_size = 10000
+    calculator.add_observer(Mock())
+    errors = []
+
+    def write(operation):
+        try:
+            for i in range(200):
+                calculator.perform(operation, i, 2)
+        except Exception as e: # pragma: no cover
+            errors.append(e)
+
+    def read():
+        try:
+            for _ in range(50):
+                calculator.show_history()
+                calculator.get_history_dataframe()
+        except Exception as e: # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(name,)) for name in ('add', 'multiply', 'add')]
+    threads.append(threading.Thread(target=read))
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    assert errors == []
+    assert len(calculator.history) == len(calculator.undo_stack) == 600
+    assert calculator.observers[0].update.call_count == 600
+    for calc in calculator.history:
+        expected = calc.operandx + 2 if calc.operation == 'Addition' else calc.operandx * 2
+        assert calc.result == expected
+    while calculator.undo():
+        pass
+    assert len(calculator.history) == 0
+
+def test_concurrent_history_dataframe(calculator):
+    """Tests DataFrames built by several threads at once, on first use of the lazily imported pandas"""
+    calculator.config.max_history_size = 10000
+    calculator.perform('add', 1, 2)
+    barrier = threading.Barrier(9)
+    frames = []
+    errors = []
+
+    def write():
+        barrier.wait()
+        for i in range(100):
+            calculator.perform('add', i, 2)
+
+    def read():
+        try:
+            barrier.wait()
+            for _ in range(5):
+                frames.append(calculator.get_history_dataframe())
+        except Exception as e: # pragma: no cover
+            errors.append(e)
+
+    with patch('app.calculator.pd', _LazyModule('pandas')):
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        threads.append(threading.Thread(target=write))
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+    assert errors == []
+    assert len(frames) == 40
+    for frame in frames:
+        assert isinstance(frame, pd.DataFrame)
+        assert 1 <= len(frame) <= 101
+        assert list(frame['operation'].unique()) == ['Addition']
+
+def test_notifications_keep_order(calculator):
+    observer = Mock()
+    calculator.add_observer(observer)
+    with calculator._delivering:
+        calculator.perform('add', 1, 2)
+        calc = calculator.history[-1]
+        calculator.undo()
+        calculator.notify_observers(calc)
+        calculator.notify_observers_batch([calc])
+        calculator.notify_observers_event('clear')
+        assert observer.mock_calls == []
+    calculator._deliver_notifications()
+    assert [call[0] for call in observer.mock_calls] == [
+        'update', 'update_event', 'update', 'update_batch', 'update_event']
+    assert observer.update_event.call_args_list[0].args[0] == 'undo'
+
+def test_observers_notified_outside_lock(calculator):
+    seen = []
+
+    def read_from_thread(calc):
+        reader = threading.Thread(target=lambda: seen.append(calculator.show_history()))
+        reader.start()
+        reader.join(timeout=5)
+
+    observer = Mock()
+    observer.update.side_effect = read_from_thread
+    calculator.add_observer(observer)
+    calculator.perform('add', 1, 2)
+    assert len(seen) == 1 and len(seen[0]) == 1
+
+def test_power_uses_configured_precision(calculator):
+    calculator.set_operation(OperationFactory.create_operation('root'))
+    calculator.config.precision = 20
+    results = [
+        calculator.perform_operation(2, 2),
+        calculator.perform_many([(2, 2)])[0],
+        calculator.evaluate("root(2, 2)"),
+    ]
+    assert all(str(result).startswith('1.41421356237309504880') for result in results)
+
+def test_power_too_large(calculator):
+    calculator.set_operation(OperationFactory.create_operation('root'))
+    with pytest.raises(OperationError, match="Result exceeds 100000 digits"):
+        calculator.perform_operation(1000, '0.00001')
+
+def test_result_cache(calculator):
+    calculator.result_cache = ResultCache(8)
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    with patch('app.operations.Power.execute', wraps=calculator.operation_strategy.execute) as mock_execute:
+        assert calculator.perform_operation(2, 3) == calculator.perform_operation('2.0', 3)
+        calculator.perform_many([(2, 3), (3, 2)])
+    assert mock_execute.call_count == 2
+    assert calculator.result_cache.stats() == {'hits': 2, 'misses': 2, 'evictions': 0, 'size': 2}
+    assert len(calculator.history) == 4
+
+def test_result_cache_skips_failures(calculator):
+    calculator.result_cache = ResultCache(8)
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="Divisor operand cannot be 0"):
+            calculator.perform_operation(1, 0)
+    assert len(calculator.result_cache) == 0
+    assert calculator.result_cache.misses == 2
+
+def test_result_cache_config(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, result_cache=True, result_cache_size=16, result_cache_policy='lfu')
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+        patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        calculator = Calculator(config)
+    assert calculator.result_cache.max_size == 16
+    assert calculator.result_cache.policy == 'lfu'
+
+def test_evaluate_expression(calculator):
+    assert calculator.evaluate("(x + 1) * root(y, 2)", x=2, y='9') == Decimal(9)
+    assert len(calculator.history) == 0
+
+@pytest.mark.parametrize(
+        "expression, bindings, error, expected",
+        [
+            ("x + 1", {'x': 'abc'}, ValidationError, "Invalid number format: abc"),
+            ("2000 + 1", {}, ValidationError, "Value exceeds allowed maximum"),
+            ("x ^ 999 ^ 999", {"x": 999}, OperationError, "Evaluation Failed"),
+        ],
+        ids=[
+            "invalid_binding",
+            "literal_too_large",
+            "overflow",
+])
+def test_evaluate_errors(calculator, expression, bindings, error, expected):
+    calculator.config.max_input_value = Decimal(1000)
+    with pytest.raises(error, match=expected):
+        calculator.evaluate(expression, **bindings)
@@ -3,40 +3,79 @@ import pytest
 from datetime import datetime
 
 from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
 from app.calculator_memento import CalculatorMemento
 
+def make_calc(x: int) -> Calculation:
+    return Calculation(operation="add", operandx=x, operandy=0, result=x)
+
 def test_from_dict():
     """Tests the from_dict method"""
-    inputs = { "history": [{
-        "operation": "add",
-        "operandx": 8,
-        "operandy": 6,
-        "result": 14,
-        "precision": 10,
-        "timestamp": datetime.now().isoformat()
-    }],
+    inputs = {
+        "appended": [{
+            "operation": "add",
+            "operandx": 8,
+            "operandy": 6,
+            "result": 14,
+            "precision": 10,
+            "timestamp": datetime.now().isoformat()
+        }],
+        "evicted": [],
+        "cleared": None,
         "timestamp": datetime.now().isoformat()
     }
     mem = CalculatorMemento.from_dict(inputs)
     assert all([
-        mem.history[0].operation == "add",
-        mem.history[0].operandx == 8,
-        mem.history[0].operandy == 6,
-        mem.history[0].result == 14
+        mem.appended[0].operation == "add",
+        mem.appended[0].operandx == 8,
+        mem.appended[0].operandy == 6,
+        mem.appended[0].result == 14,
+        mem.evicted == [],
+        mem.cleared is None
         ]), f"History record does not match dict base"
 
 def test_to_dict():
     """Tests the to_dict method"""
     calc = Calculation(operation="add", operandx=8, operandy=6, result=14)
-    mem = CalculatorMemento(history=[calc])
+    mem = CalculatorMemento(appended=[calc], cleared=[])
     assert mem.to_dict() == {
-        "history": [{
+        "appended": [{
             "operation": "add",
             "operandx": 8,
             "operandy": 6,
             "result": 14,
-            "precision": mem.history[0].precision,
-            "timestamp": mem.history[0].timestamp.isoformat()
+            "precision": mem.appended[0].precision,
+            "timestamp": mem.appended[0].timestamp.isoformat(),
+            "backend": "decimal",
         }],
+        "evicted": [],
+        "cleared": [],
         "timestamp": mem.timestamp.isoformat()
         }, f"History dict does not match record base"
+
+def test_dict_round_trip():
+    """Tests that a replacement memento survives serialization"""
+    mem = CalculatorMemento(appended=[make_calc(1)], cleared=[make_calc(2)])
+    restored = CalculatorMemento.from_dict(mem.to_dict())
+    assert restored.appended == mem.appended
+    assert restored.cleared == mem.cleared
+
+def test_apply_revert_with_eviction():
+    """Tests that a change evicting more than its predecessor state reverts exactly"""
+    before = [make_calc(0)]
+    history = CalculationHistory(before)
+    mem = CalculatorMemento(appended=[make_calc(1), make_calc(2), make_calc(3)],
+                            evicted=[make_calc(0), make_calc(1)])
+    mem.apply(history)
+    assert history == [make_calc(2), make_calc(3)]
+    mem.revert(history)
+    assert history == before
+
+def test_apply_revert_replacement():
+    """Tests apply and revert of a wholesale history replacement"""
+    history = CalculationHistory([make_calc(0), make_calc(1)])
+    mem = CalculatorMemento(appended=[make_calc(5)], cleared=history.copy())
+    mem.apply(history)
+    assert history == [make_calc(5)]
+    mem.revert(history)
+    assert history == [make_calc(0), make_calc(1)]
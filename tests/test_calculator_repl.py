@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, patch
 
 from app.calculator_repl import calculator_repl
+from app.exceptions import ConfigurationError, OperationError
 
 @patch('builtins.input', side_effect=['exit'])
 @patch('builtins.print')
@@ -48,3 +49,58 @@ def test_calculator_repl_cancel(mock_print, mock_input):
     mock_print.assert_any_call("Unknown command: 'nonsense'. Type 'help' for available commands.")
     mock_print.reset_mock()
     mock_input.reset_mock()
+
+@patch('builtins.input', side_effect=['add', '1', '2', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_async_autosave(mock_print, mock_input):
+    with patch.dict('os.environ', {'CALCULATOR_AUTO_SAVE_ASYNC': 'true'}), \
+        patch('app.calculator.Calculator.save_history') as mock_save_history:
+        calculator_repl()
+    mock_print.assert_any_call("Result: 3")
+    assert mock_save_history.call_count >= 1
+
+@patch('builtins.input', side_effect=['exit'])
+@patch('builtins.print')
+def test_calculator_repl_close_failure(mock_print, mock_input):
+    with patch('app.calculator.Calculator.close', side_effect=OperationError("save failed")):
+        calculator_repl()
+    mock_print.assert_any_call("Warning: Shutdown incomplete: save failed")
+
+@patch('builtins.input', side_effect=['add', '1', '2', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_observer_failure(mock_print, mock_input):
+    with patch('app.history.AutoSaveObserver.update', side_effect=OperationError("disk full")), \
+        patch('app.calculator.Calculator.save_history'):
+        calculator_repl()
+    mock_print.assert_any_call("Result: 3")
+    mock_print.assert_any_call("Warning: disk full")
+
+@patch('builtins.input', side_effect=['eval', '(1 + 2) * root(8, 3)', 'eval', '1 +', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_eval(mock_print, mock_input):
+    with patch('app.calculator.Calculator.save_history'):
+        calculator_repl()
+    mock_print.assert_any_call("Result: 6")
+    mock_print.assert_any_call("Error: Invalid expression: unexpected end of input")
+
+@patch('builtins.input', side_effect=['exit'])
+@patch('builtins.print')
+def test_calculator_repl_startup_report(mock_print, mock_input):
+    with patch.dict('os.environ', {'CALCULATOR_STARTUP_REPORT': 'true'}), \
+        patch('app.calculator.Calculator.save_history'):
+        calculator_repl(started=0.0)
+    reports = [call.args[0] for call in mock_print.call_args_list if call.args[0].startswith("Startup: ")]
+    assert len(reports) == 1
+    assert reports[0].startswith("Startup: config ")
+    assert ", first prompt " in reports[0]
+
+@patch('builtins.input', side_effect=['help', 'help', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_watch_env(mock_print, mock_input):
+    with patch.dict('os.environ', {'CALCULATOR_WATCH_ENV': 'true'}), \
+        patch('app.calculator.Calculator.save_history'), \
+        patch('app.calculator_config.CalculatorConfig.reload_if_changed',
+            side_effect=[True, ConfigurationError("precision setting must be positive"), False]) as mock_reload:
+        calculator_repl()
+    assert mock_reload.call_count == 3
+    mock_print.assert_any_call("Warning: Configuration reload failed: precision setting must be positive")
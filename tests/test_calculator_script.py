@@ -0,0 +1,121 @@
+"""This module provides the test suite for the script interface in app.calculator_script"""
+import io
+import pytest
+
+from pathlib import Path
+from unittest.mock import Mock, patch, PropertyMock
+
+from app import calculator_script as script
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+
+@pytest.fixture
+def paths(tmp_path):
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+        patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+        patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+        patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_history_file.return_value = tmp_path / "history/calculator_history.csv"
+        yield
+
+@pytest.fixture
+def calculator(tmp_path, paths):
+    return Calculator(config=CalculatorConfig(base_dir=tmp_path))
+
+def test_parse_commands():
+    def lines():
+        yield from ["# comment\n", "ADD 3 4\n", "\n", "  eval (1 + 2) * 3  \n", "history"]
+        raise AssertionError("read past the last command requested")
+
+    commands = script.parse_commands(lines())
+    assert [next(commands) for _ in range(3)] == [
+        (2, 'add', '3 4'),
+        (4, 'eval', '(1 + 2) * 3'),
+        (5, 'history', ''),
+    ]
+
+def test_run_script(calculator):
+    out = io.StringIO()
+    failures = script.run_script(calculator, [
+        "add 3 4",
+        "divide 1 4",
+        "power 2 10",
+        "eval 2 * (3 + 4)",
+        "undo",
+        "redo",
+        "history",
+        "clear",
+        "multiply 2 2",
+        "save",
+        "load",
+        "exit",
+        "add 1 1",
+    ], out)
+    assert failures == 0
+    assert out.getvalue().splitlines() == [
+        "7",
+        "0.25",
+        "1024",
+        "14",
+        "Addition(3, 4) = 7",
+        "Division(1, 4) = 0.25",
+        "Power(2, 1E+1) = 1024",
+        "4",
+    ]
+    assert [str(calc) for calc in calculator.history] == ["Multiplication(2, 2) = 4"]
+
+def test_run_script_errors(calculator):
+    out = io.StringIO()
+    failures = script.run_script(calculator, [
+        "add 1",
+        "modulo 1 2",
+        "divide 1 0",
+        "add 1 2",
+        "eval 1 +",
+    ], out)
+    assert failures == 4
+    assert out.getvalue().splitlines() == [
+        "Error on line 1: 'add' takes 2 operands, got 1",
+        "Error on line 2: Unknown operation: modulo",
+        "Error on line 3: Divisor operand cannot be 0",
+        "3",
+        "Error on line 5: Invalid expression: unexpected end of input",
+    ]
+
+def test_run_script_float_backend(calculator):
+    calculator.config.numeric_backend = 'float'
+    out = io.StringIO()
+    script.run_script(calculator, ["divide 1 4"], out)
+    assert out.getvalue() == "0.25\n"
+
+def test_run_script_buffers_output(calculator):
+    out = Mock()
+    with patch.object(script, 'OUTPUT_BUFFER_LINES', 2):
+        script.run_script(calculator, [f"add {i} 1" for i in range(5)], out)
+    assert [call.args[0] for call in out.write.call_args_list] == ["1\n2\n", "3\n4\n", "5\n"]
+    out.flush.assert_called_once()
+
+def test_calculator_script_file(tmp_path, capsys, paths):
+    path = tmp_path / "script.txt"
+    path.write_text("add 2 3\nsubtract 2 3\n", encoding=CalculatorConfig().default_encoding)
+    with patch.object(Calculator, 'save_history') as mock_save:
+        assert script.calculator_script(str(path)) == 0
+    mock_save.assert_called_once()
+    assert capsys.readouterr().out == "5\n-1\n"
+
+def test_calculator_script_stdin(capsys, paths):
+    with patch('sys.stdin', io.StringIO("add 2 3\nnonsense 1 1\n")), \
+        patch.object(Calculator, 'save_history') as mock_save:
+        assert script.calculator_script('-', started=0.0) == 1
+    mock_save.assert_called_once()
+    assert capsys.readouterr().out == "5\nError on line 2: Unknown operation: nonsense\n"
+
+def test_calculator_script_missing_file(tmp_path, capsys, paths):
+    with patch.object(Calculator, 'save_history') as mock_save:
+        assert script.calculator_script(str(tmp_path / "missing.txt")) == 1
+    mock_save.assert_not_called()
+    assert capsys.readouterr().err.startswith("Error: [Errno 2] No such file or directory")
@@ -0,0 +1,91 @@
+"""This module provides the test suite for the columnar history file format"""
+import pytest
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.calculation import Calculation
+from app.columnar_history import ColumnarHistoryReader, pack_decimal, unpack_decimal, write_columnar
+from app.exceptions import SerializationError
+
+@pytest.fixture
+def temp_path():
+    with TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+@pytest.mark.parametrize(
+        "value",
+        ['0', '-0', '7', '1.50', '0E-7', '1e999', '-123456789012345678901234567890.123',
+         'Infinity', '-Infinity', 'NaN', 'sNaN12'],
+        ids=["zero", "negative_zero", "odd_digits", "trailing_zero", "zero_exponent",
+             "huge", "long_negative", "infinity", "negative_infinity", "nan", "snan_payload"]
+)
+def test_decimal_packing(value: str):
+    """Tests that packed decimals round-trip exactly, including exponent and sign"""
+    decimal = Decimal(value)
+    assert str(unpack_decimal(pack_decimal(decimal))) == str(decimal)
+
+def make_calcs():
+    return [
+        Calculation("Addition", Decimal("0.1000000000000000000001"), Decimal("2"),
+                    Decimal("2.1000000000000000000001"), timestamp=datetime(2025, 1, 2, 3, 4, 5, 6)),
+        Calculation("Power", Decimal("2"), Decimal("3"), Decimal("8"), precision=4),
+        Calculation("Addition", Decimal("-1"), Decimal("1"), Decimal("0")),
+    ]
+
+def test_round_trip(temp_path):
+    """Tests that records round-trip through the columnar file"""
+    calcs = make_calcs()
+    write_columnar(temp_path / "history.col", calcs)
+    with ColumnarHistoryReader(temp_path / "history.col") as reader:
+        loaded = reader.read()
+        assert len(reader) == 3
+        assert reader.operations == ["Addition", "Power"]
+    assert loaded == calcs
+    assert [c.timestamp for c in loaded] == [c.timestamp for c in calcs]
+    assert [c.precision for c in loaded] == [10, 4, 10]
+
+def test_float_backend_round_trip(temp_path):
+    """Tests that float backend records round-trip alongside Decimal records"""
+    calcs = make_calcs() + [Calculation("Addition", 0.1, 0.2, 0.1 + 0.2, backend='float')]
+    write_columnar(temp_path / "history.col", calcs)
+    with ColumnarHistoryReader(temp_path / "history.col") as reader:
+        assert reader.column("backend").tolist() == [0, 0, 0, 1]
+        loaded = reader.read()
+    assert loaded == calcs
+    assert [c.backend for c in loaded] == ['decimal'] * 3 + ['float']
+    assert isinstance(loaded[-1].result, float)
+
+def test_column_views(temp_path):
+    """Tests single-column access and lazy decimal views"""
+    write_columnar(temp_path / "history.col", make_calcs())
+    with ColumnarHistoryReader(temp_path / "history.col") as reader:
+        assert reader.column("operation").tolist() == [0, 1, 0]
+        assert reader.column("precision").tolist() == [10, 4, 10]
+        results = reader.column("result")
+        assert len(results) == 3
+        assert list(results) == [Decimal("2.1000000000000000000001"), Decimal("8"), Decimal("0")]
+        assert results[-1] == Decimal("0")
+        assert results[1:] == [Decimal("8"), Decimal("0")]
+        with pytest.raises(IndexError):
+            results[3]
+        assert reader.read(-1) == make_calcs()[-1:]
+
+def test_empty_file(temp_path):
+    """Tests an empty history"""
+    write_columnar(temp_path / "history.col", [])
+    with ColumnarHistoryReader(temp_path / "history.col") as reader:
+        assert reader.read() == []
+
+@pytest.mark.parametrize(
+        "contents",
+        [b'', b'CALCCOL1' + b'\0' * 32, b'NOTCOLUMNAR' + b'\0' * 32],
+        ids=["truncated", "bad_footer", "bad_signature"]
+)
+def test_invalid_file(temp_path, contents: bytes):
+    """Tests error handling for files that are not columnar histories"""
+    (temp_path / "bad.col").write_bytes(contents)
+    with pytest.raises(SerializationError, match="Invalid columnar history file"):
+        ColumnarHistoryReader(temp_path / "bad.col")
@@ -4,7 +4,9 @@ import os
 
 from decimal import Decimal
 from pathlib import Path
+from unittest.mock import patch
 
+from app import calculator_config
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ConfigurationError
 
@@ -40,6 +42,31 @@ def test_fallback_configurations():
     assert config.precision == 10
     assert config.max_input_value == Decimal('1e999')
     assert config.default_encoding == 'utf-8'
+    assert config.auto_save_mode == 'full'
+    assert config.journal_compact_interval == 1000
+    assert config.trusted_load is False
+    assert config.history_format == 'csv'
+    assert config.auto_save_async is False
+    assert config.auto_save_debounce == 0.5
+    assert config.auto_save_max_latency == 5.0
+    assert config.observer_dispatch == 'inline'
+    assert config.observer_queue_size == 1000
+    assert config.observer_queue_policy == 'block'
+    assert config.log_pipeline is False
+    assert config.log_batch_size == 100
+    assert config.log_flush_interval == 1.0
+    assert config.log_rotation == 'none'
+    assert config.log_max_bytes == 10485760
+    assert config.log_backup_count == 5
+    assert config.result_cache is False
+    assert config.result_cache_size == 1024
+    assert config.result_cache_policy == 'lru'
+    assert config.numeric_backend == 'decimal'
+    assert config.startup_report is False
+    assert config.watch_env is False
+    assert config.bulk_chunk_size == 10000
+    assert config.parallel_workers == 0
+    assert config.parallel_chunk_size == 1000
 
 def test_alternate_paths():
     os.environ['CALCULATOR_BASE_DIR'] = './test_base'
@@ -50,6 +77,7 @@ def test_alternate_paths():
     config = CalculatorConfig()
     assert config.log_file == Path('./test_base/alt_log/alt_log.log').resolve()
     assert config.history_file == Path('./test_base/alt_history/alt_history.csv').resolve()
+    assert config.journal_file == Path('./test_base/alt_history/calculator_history.journal').resolve()
 
 @pytest.mark.parametrize(
         "val, expected",
@@ -77,12 +105,50 @@ def test_auto_save_vals(val: str, expected: bool):
         [
             ('CALCULATOR_MAX_HISTORY_SIZE', "max_history_size setting must be positive"),
             ('CALCULATOR_PRECISION', "precision setting must be positive"),
-            ('CALCULATOR_MAX_INPUT_VALUE', "max_input_value setting must be positive")
+            ('CALCULATOR_MAX_INPUT_VALUE', "max_input_value setting must be positive"),
+            ('CALCULATOR_AUTO_SAVE_MODE', "auto_save_mode setting must be 'full' or 'journal'"),
+            ('CALCULATOR_JOURNAL_COMPACT_INTERVAL', "journal_compact_interval setting must be positive"),
+            ('CALCULATOR_HISTORY_FORMAT', "history_format setting must be one of: csv, columnar, records, sqlite"),
+            ('CALCULATOR_AUTO_SAVE_DEBOUNCE', "auto_save_debounce setting must be positive"),
+            ('CALCULATOR_AUTO_SAVE_MAX_LATENCY', "auto_save_max_latency setting must not be less than auto_save_debounce"),
+            ('CALCULATOR_OBSERVER_DISPATCH', "observer_dispatch setting must be 'inline' or 'async'"),
+            ('CALCULATOR_OBSERVER_QUEUE_SIZE', "observer_queue_size setting must be positive"),
+            ('CALCULATOR_OBSERVER_QUEUE_POLICY', "observer_queue_policy setting must be one of: block, drop_oldest, coalesce"),
+            ('CALCULATOR_LOG_BATCH_SIZE', "log_batch_size setting must be positive"),
+            ('CALCULATOR_LOG_FLUSH_INTERVAL', "log_flush_interval setting must be positive"),
+            ('CALCULATOR_LOG_ROTATION', "log_rotation setting must be one of: none, size, time"),
+            ('CALCULATOR_LOG_MAX_BYTES', "log_max_bytes setting must be positive"),
+            ('CALCULATOR_LOG_BACKUP_COUNT', "log_backup_count setting must not be negative"),
+            ('CALCULATOR_RESULT_CACHE_SIZE', "result_cache_size setting must be positive"),
+            ('CALCULATOR_RESULT_CACHE_POLICY', "result_cache_policy setting must be 'lru' or 'lfu'"),
+            ('CALCULATOR_NUMERIC_BACKEND', "numeric_backend setting must be 'decimal' or 'float'"),
+            ('CALCULATOR_BULK_CHUNK_SIZE', "bulk_chunk_size setting must be positive"),
+            ('CALCULATOR_PARALLEL_WORKERS', "parallel_workers setting must not be negative"),
+            ('CALCULATOR_PARALLEL_CHUNK_SIZE', "parallel_chunk_size setting must be positive"),
         ],
         ids=[
             "negative_max_history_size",
             "negative_precision",
             "negative_max_input_size",
+            "invalid_auto_save_mode",
+            "negative_journal_compact_interval",
+            "invalid_history_format",
+            "negative_auto_save_debounce",
+            "negative_auto_save_max_latency",
+            "invalid_observer_dispatch",
+            "negative_observer_queue_size",
+            "invalid_observer_queue_policy",
+            "negative_log_batch_size",
+            "negative_log_flush_interval",
+            "invalid_log_rotation",
+            "negative_log_max_bytes",
+            "negative_log_backup_count",
+            "negative_result_cache_size",
+            "invalid_result_cache_policy",
+            "invalid_numeric_backend",
+            "negative_bulk_chunk_size",
+            "negative_parallel_workers",
+            "negative_parallel_chunk_size",
 ])
 def test_invalid_parameters(var: str, expected: str):
     """Tests error handling in cases of invalid configurations"""
@@ -91,3 +157,100 @@ def test_invalid_parameters(var: str, expected: str):
     with pytest.raises(ConfigurationError, match=expected):
         config = CalculatorConfig()
         config.validate()
+
+def test_history_file_suffix():
+    """Tests that the default history file name follows the history format"""
+    [os.environ.pop(key) for key in dict(os.environ).keys() if key.startswith("CALCULATOR")]
+    config = CalculatorConfig(history_format='columnar')
+    assert config.history_file.name == 'calculator_history.col'
+
+def test_paths_resolved_once(tmp_path):
+    """Tests that path properties read a snapshot instead of resolving on each access"""
+    config = CalculatorConfig(base_dir=tmp_path)
+    history_file = config.history_file
+    with patch.object(Path, 'resolve') as mock_resolve:
+        assert config.history_file is history_file
+        assert config.paths.log_file == config.log_file
+        mock_resolve.assert_not_called()
+    config.history_format = 'records'
+    assert config.history_file.suffix == '.rlog'
+    assert config.paths.history_format == 'records'
+
+def test_reload(tmp_path):
+    """Tests that reload reads the environment again but keeps constructor settings"""
+    with patch.dict(os.environ, {'CALCULATOR_PRECISION': '5', 'CALCULATOR_HISTORY_FILE': str(tmp_path / 'a.csv')}):
+        config = CalculatorConfig(base_dir=tmp_path, max_history_size=7)
+        assert config.history_file == tmp_path / 'a.csv'
+        os.environ['CALCULATOR_PRECISION'] = '6'
+        os.environ['CALCULATOR_MAX_HISTORY_SIZE'] = '9'
+        os.environ['CALCULATOR_HISTORY_FILE'] = str(tmp_path / 'b.csv')
+        config.reload()
+        assert config.precision == 6
+        assert config.max_history_size == 7
+        assert config.history_file == tmp_path / 'b.csv'
+
+        os.environ['CALCULATOR_PRECISION'] = '-1'
+        with pytest.raises(ConfigurationError, match="precision setting must be positive"):
+            config.reload()
+        assert config.precision == 6
+
+@pytest.mark.parametrize(
+        "variable, value",
+        [
+            ('CALCULATOR_AUTO_SAVE_MODE', 'journal'),
+            ('CALCULATOR_RESULT_CACHE', 'true'),
+            ('CALCULATOR_PARALLEL_WORKERS', '2'),
+            ('CALCULATOR_LOG_PIPELINE', 'true'),
+        ],
+        ids=['auto_save_mode', 'result_cache', 'parallel_workers', 'log_pipeline'],
+)
+def test_reload_keeps_startup_settings(tmp_path, variable, value):
+    """Tests that a reload cannot change the settings components are built from at startup"""
+    with patch.dict(os.environ):
+        os.environ.pop(variable, None)
+        config = CalculatorConfig(base_dir=tmp_path, precision=5)
+        setting = variable.removeprefix('CALCULATOR_').lower()
+        current = getattr(config, setting)
+        os.environ[variable] = value
+        with pytest.raises(ConfigurationError, match=f"{setting} setting must not change on reload"):
+            config.reload()
+        assert getattr(config, setting) == current
+
+def test_reload_if_changed(tmp_path):
+    """Tests that the .env file is read again only after it changes"""
+    env_file = tmp_path / '.env'
+    env_file.write_text("CALCULATOR_PRECISION=3\n")
+    with patch.object(calculator_config, 'ENV_FILE', str(env_file)), \
+        patch.dict(calculator_config._env_file_values, clear=True), \
+        patch.dict(os.environ):
+        os.environ.pop('CALCULATOR_PRECISION', None)
+        calculator_config.load_env_file()
+        config = CalculatorConfig(base_dir=tmp_path)
+        assert config.precision == 3
+        assert config.reload_if_changed() is False
+
+        env_file.write_text("CALCULATOR_PRECISION=4\n")
+        os.utime(env_file, ns=(0, 0))
+        assert config.reload_if_changed() is True
+        assert config.precision == 4
+        assert config.reload_if_changed() is False
+
+        env_file.unlink()
+        assert config.reload_if_changed() is True
+        assert 'CALCULATOR_PRECISION' not in os.environ
+
+def test_env_file_precedence(tmp_path):
+    """Tests that variables set outside the .env file are not overridden by it"""
+    env_file = tmp_path / '.env'
+    env_file.write_text("CALCULATOR_PRECISION=3\nCALCULATOR_LOG_ROTATION=size\n")
+    with patch.object(calculator_config, 'ENV_FILE', str(env_file)), \
+        patch.dict(calculator_config._env_file_values, clear=True), \
+        patch.dict(os.environ, {'CALCULATOR_PRECISION': '12'}):
+        os.environ.pop('CALCULATOR_LOG_ROTATION', None)
+        calculator_config.load_env_file()
+        assert os.environ['CALCULATOR_PRECISION'] == '12'
+        assert os.environ['CALCULATOR_LOG_ROTATION'] == 'size'
+        os.environ['CALCULATOR_LOG_ROTATION'] = 'time'
+        env_file.write_text("")
+        calculator_config.load_env_file()
+        assert os.environ['CALCULATOR_LOG_ROTATION'] == 'time'
@@ -0,0 +1,128 @@
+"""This module provides the test suite for the Decimal power and root engine"""
+import pytest
+
+from decimal import Decimal
+
+from app import decimal_math
+
+@pytest.mark.parametrize(
+        "x, y, expected",
+        [
+            ("3", "40", "12157665459056928801"),
+            ("1.1", "10", "2.5937424601"),
+            ("1.5", "-3", "0.2962962963"),
+            ("7", "-1", "0.1428571429"),
+            ("2", "0.25", "1.189207115"),
+            ("2", "2.5", "5.6568542495"),
+            ("10", "-0.5", "0.316227766"),
+            ("0.5", "1E+999", "0"),
+            ("2", "-1E+999", "0"),
+            ("1", "1E+999", "1"),
+            ("1.01", "100", "2.7048138294"),
+            ("1.001", "-1000", "0.3680633043"),
+        ],
+        ids=[
+            "exact_integer_power",
+            "fractional_base",
+            "negative_exponent",
+            "reciprocal",
+            "reciprocal_integer_exponent",
+            "fractional_exponent",
+            "negative_fractional_exponent",
+            "underflow",
+            "negative_underflow",
+            "unit_base",
+            "large_exponent",
+            "large_negative_exponent",
+        ]
+)
+def test_power(x, y, expected):
+    result = decimal_math.power(Decimal(x), Decimal(y))
+    assert decimal_math.round_to(result, Decimal('1E-10')) == Decimal(expected)
+
+@pytest.mark.parametrize(
+        "x, y, expected",
+        [
+            ("2", "2", "1.4142135624"),
+            ("10", "3", "2.1544346900"),
+            ("1E+100", "5", "1E+20"),
+            ("1.728", "3", "1.2"),
+            ("2", "-3", "0.7937005260"),
+            ("2", "0.3", "10.0793683992"),
+            ("2", "1001", "1.0006926945"),
+            ("5", "1", "5"),
+            ("-27", "3", "-3"),
+            ("2", "100", "1.0069555501"),
+            ("1.5", "-100", "0.9959535579"),
+            (str(2 ** 100), "100", "2"),
+            ("2E+310", "3", "27144176165949065715180894696794892048051077694890969572843654428033085563287658494871973768515010449601.702702662"),
+        ],
+        ids=[
+            "irrational_square_root",
+            "irrational_cube_root",
+            "perfect_power_beyond_float_estimate",
+            "fractional_perfect_power",
+            "negative_degree",
+            "fractional_degree",
+            "large_degree",
+            "unit_degree",
+            "negative_radicand",
+            "newton_degree",
+            "negative_newton_degree",
+            "perfect_power_newton_degree",
+            "radicand_beyond_float_range",
+        ]
+)
+def test_root(x, y, expected):
+    result = decimal_math.root(Decimal(x), Decimal(y))
+    assert decimal_math.round_to(result, Decimal('1E-10')) == Decimal(expected)
+
+def test_exact_results_have_plain_digits():
+    assert str(decimal_math.root(Decimal('1.44'), Decimal(2))) == '1.2'
+    assert str(decimal_math.root(Decimal('1E+100'), Decimal(5))) == '100000000000000000000'
+    assert str(decimal_math.power(Decimal(4), Decimal('0.5'))) == '2'
+    assert str(decimal_math.power(Decimal(2), Decimal(-2))) == '0.25'
+    assert str(decimal_math.power(Decimal('0.1'), Decimal(-3))) == '1000'
+    assert str(decimal_math.power(Decimal(2), Decimal(-100))) == '7.888609052E-31'
+    assert str(decimal_math.root(Decimal('1E+3000'), Decimal(2))) == '1' + '0' * 1500
+    assert decimal_math.root(Decimal('1E+3000'), Decimal(1)) == Decimal('1E+3000')
+
+def test_integer_paths_round_half_even():
+    with decimal_math.working_precision(1):
+        assert decimal_math.power(Decimal('1.5'), Decimal(3)) == Decimal('3.38')
+        assert decimal_math.power(Decimal('2.5'), Decimal(3)) == Decimal('15.62')
+        assert decimal_math.power(Decimal('1.05'), Decimal(3)) == Decimal('1.16')
+        assert decimal_math.root(Decimal('1.2321'), Decimal(2)) == Decimal('1.11')
+        assert decimal_math.root(Decimal('1.1025'), Decimal(2)) == Decimal('1.05')
+
+def test_power_beyond_float_range():
+    result = decimal_math.power(Decimal(999), Decimal(999))
+    assert result == Decimal(999 ** 999)
+
+def test_working_precision():
+    with decimal_math.working_precision(30):
+        assert str(decimal_math.root(Decimal(2), Decimal(2))).startswith('1.414213562373095048801688724')
+    with decimal_math.working_precision(2):
+        assert decimal_math.round_to(decimal_math.root(Decimal(2), Decimal(2)), Decimal('0.01')) == Decimal('1.41')
+    assert decimal_math.root(Decimal(2), Decimal(2)) == Decimal('1.41421356237')
+
+@pytest.mark.parametrize(
+        "x, y",
+        [
+            ("10", "1E+6"),
+            ("2", "0.000001"),
+        ],
+        ids=["power", "root"]
+)
+def test_result_too_large(x, y):
+    operation = decimal_math.power if y == "1E+6" else decimal_math.root
+    with pytest.raises(OverflowError, match="Result exceeds 100000 digits"):
+        operation(Decimal(x), Decimal(y))
+
+def test_fractional_power_of_negative():
+    with pytest.raises(ValueError, match="Fractional powers of negative numbers are not supported"):
+        decimal_math.power(Decimal(-2), Decimal('0.5'))
+
+def test_round_to_large_value():
+    value = Decimal(10) ** 50 + Decimal('0.123456')
+    assert decimal_math.round_to(value, Decimal('0.01')) == Decimal(10) ** 50 + Decimal('0.12')
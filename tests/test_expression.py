@@ -0,0 +1,101 @@
+"""This module provides the test suite for the expression compiler in app.expression"""
+import pytest
+
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from app.exceptions import ValidationError
+from app.expression import compile_expression
+from app.operations import Addition, OperationFactory
+
+@pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("1 + 2 * 3", Decimal(7)),
+            ("(1 + 2) * 3", Decimal(9)),
+            ("10 - 4 - 3", Decimal(3)),
+            ("2 ^ 3 ^ 2", Decimal(512)),
+            ("-2 ^ 2", Decimal(-4)),
+            ("2 ^ -1", Decimal("0.5")),
+            ("+3 / 4", Decimal("0.75")),
+            ("root(8, 3) + multiply(2, 2)", Decimal(6)),
+            ("1.5e1 + .5", Decimal("15.5")),
+        ],
+        ids=[
+            "precedence",
+            "parentheses",
+            "left_associative",
+            "right_associative_power",
+            "unary_minus_binds_loosely",
+            "negative_exponent",
+            "unary_plus",
+            "function_calls",
+            "number_formats",
+])
+def test_evaluate_constant(source: str, expected: Decimal):
+    assert compile_expression(source).evaluate() == expected
+
+def test_evaluate_variables():
+    compiled = compile_expression("(x + 1) * y - -x")
+    assert compiled.variables == frozenset({'x', 'y'})
+    assert compiled.evaluate({'x': Decimal(2)}, y=Decimal(3)) == Decimal(11)
+    assert compiled.evaluate(x=Decimal(0), y=Decimal(5)) == Decimal(5)
+
+def test_unbound_variables():
+    with pytest.raises(ValidationError, match="Unbound variables: a, b"):
+        compile_expression("a + b").evaluate()
+
+def test_constant_folding():
+    mock_execute = MagicMock(wraps=Addition().execute)
+    with patch.dict(OperationFactory._dispatch, {'add': mock_execute}):
+        compiled = compile_expression("(1 + 2) + x + (3 + 4)")
+        assert mock_execute.call_count == 2
+        assert compiled.evaluate(x=Decimal(1)) == Decimal(11)
+        assert mock_execute.call_count == 4
+    compile_expression.cache_clear()
+
+def test_failed_fold_raises_on_evaluate():
+    compiled = compile_expression("1 / (2 - 2)")
+    with pytest.raises(ValidationError, match="Divisor operand cannot be 0"):
+        compiled.evaluate()
+
+def test_compile_cache():
+    compile_expression.cache_clear()
+    first = compile_expression("x * 2")
+    assert compile_expression("x * 2") is first
+    assert compile_expression.cache_info().hits == 1
+    assert repr(first) == "CompiledExpression('x * 2')"
+
+def test_registered_operations():
+    class Modulo(Addition):
+        def execute(self, x, y):
+            return x % y
+    OperationFactory.register_operation('modulo', Modulo)
+    try:
+        assert compile_expression("modulo(x, 4)").evaluate(x=Decimal(10)) == Decimal(2)
+    finally:
+        OperationFactory.unregister_operation('modulo')
+
+@pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("", "empty expression"),
+            ("1 +", "unexpected end of input"),
+            ("(1 + 2", "unexpected end of input"),
+            ("1 2", "unexpected '2'"),
+            ("* 2", "unexpected '\\*'"),
+            ("add(1; 2)", "expected ',' but found ';'"),
+            ("nonsense(1, 2)", "unknown operation 'nonsense'"),
+        ],
+        ids=[
+            "empty",
+            "dangling_operator",
+            "unclosed_parenthesis",
+            "missing_operator",
+            "leading_operator",
+            "bad_separator",
+            "unknown_function",
+])
+def test_invalid_expressions(source: str, expected: str):
+    with pytest.raises(ValidationError, match=f"Invalid expression: {expected}"):
+        compile_expression(source)
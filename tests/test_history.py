@@ -1,10 +1,13 @@
 """This module provides the test suites for the HistoryObserver family of classes"""
 import pytest
+import time
 
 from unittest.mock import Mock, patch
 
 from app.calculation import Calculation
-from app.history import LoggingObserver, AutoSaveObserver
+from app.calculator_memento import CalculatorMemento
+from app.exceptions import OperationError
+from app.history import AsyncAutoSaveObserver, HistoryObserver, LoggingObserver, AutoSaveObserver
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
 
@@ -17,15 +20,16 @@ calculation_mock.result = 14
 calculator_mock = Mock(spec=Calculator)
 calculator_mock.config = Mock(spec=CalculatorConfig)
 calculator_mock.config.auto_save = True
+calculator_mock.config.auto_save_mode = 'full'
 
 @patch('logging.info')
 def test_logging_observer_log(logging_info_mock):
     """Tests that the LoggingObserver logs a valid Calculation"""
     observer = LoggingObserver()
     observer.update(calculation_mock)
-    logging_info_mock.assert_called_once_with(
-        "Calculation executed: addition (8, 6) = 14"
-    )
+    logging_info_mock.assert_called_once()
+    message, *args = logging_info_mock.call_args.args
+    assert message % tuple(args) == "Calculation executed: addition (8, 6) = 14"
 
 def test_logging_observer_empty_log():
     """Tests LoggingObserver error handling"""
@@ -68,3 +72,184 @@ def test_autosave_observer_no_config():
         AutoSaveObserver(None)
 
 
+
+def test_observer_default_batch():
+    """Tests that the base update_batch forwards each record to update"""
+    observer = LoggingObserver()
+    with patch.object(LoggingObserver, 'update') as mock_update:
+        HistoryObserver.update_batch(observer, [calculation_mock, calculation_mock])
+    assert mock_update.call_count == 2
+
+@patch('logging.info')
+def test_logging_observer_batch(logging_info_mock):
+    """Tests that the LoggingObserver logs a batch in a single record"""
+    observer = LoggingObserver()
+    observer.update_batch([calculation_mock, calculation_mock])
+    logging_info_mock.assert_called_once()
+    message, *args = logging_info_mock.call_args.args
+    assert message % tuple(args) == "Batch executed: 2 x addition, last (8, 6) = 14"
+
+def test_logging_observer_empty_batch():
+    """Tests LoggingObserver error handling of an empty batch"""
+    with pytest.raises(AttributeError):
+        LoggingObserver().update_batch([])
+
+def test_autosave_observer_batch():
+    """Tests that the AutoSaveObserver saves once per batch"""
+    calculator_mock.reset_mock()
+    calculator_mock.config.auto_save = True
+    observer = AutoSaveObserver(calculator_mock)
+    observer.update_batch([calculation_mock, calculation_mock])
+    calculator_mock.save_history.assert_called_once()
+    calculator_mock.reset_mock()
+    calculator_mock.config.auto_save = False
+    observer.update_batch([calculation_mock])
+    calculator_mock.save_history.assert_not_called()
+
+def test_autosave_observer_empty_batch():
+    """Tests AutoSaveObserver error handling of an empty batch"""
+    with pytest.raises(AttributeError):
+        AutoSaveObserver(calculator_mock).update_batch([])
+
+def test_observer_default_event():
+    """Tests that observers ignore history events by default"""
+    assert LoggingObserver().update_event('undo', None) is None
+
+def test_autosave_observer_event_full_mode():
+    """Tests that full auto-save mode leaves history events to the next save"""
+    calculator_mock.reset_mock()
+    calculator_mock.config.auto_save = True
+    AutoSaveObserver(calculator_mock).update_event('clear', None)
+    calculator_mock.save_history.assert_not_called()
+
+def make_async_calculator(debounce: float = 0.05, max_latency: float = 5.0, mode: str = 'full'):
+    calculator = Mock(spec=Calculator)
+    calculator.config = Mock(spec=CalculatorConfig)
+    calculator.config.auto_save = True
+    calculator.config.auto_save_mode = mode
+    calculator.config.journal_compact_interval = 1000
+    calculator.journal = Mock()
+    calculator.journal.record_count = 0
+    calculator.config.auto_save_debounce = debounce
+    calculator.config.auto_save_max_latency = max_latency
+    return calculator
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+def test_async_autosave_coalesces():
+    """Tests that a burst of updates produces a single flushed save"""
+    calculator = make_async_calculator(debounce=10)
+    observer = AsyncAutoSaveObserver(calculator)
+    [observer.update(calculation_mock) for _ in range(10)]
+    observer.update_batch([calculation_mock])
+    observer.update_event('undo', None)
+    calculator.save_history.assert_not_called()
+    observer.flush()
+    assert observer.save_count == 1
+    observer.close()
+    calculator.save_history.assert_called_once()
+
+def test_async_autosave_debounce():
+    """Tests that a save starts once the debounce window passes"""
+    calculator = make_async_calculator(debounce=0.02)
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    assert wait_for(lambda: observer.save_count == 1)
+    observer.close()
+
+def test_async_autosave_max_latency():
+    """Tests that continuous updates are still saved within the latency bound"""
+    calculator = make_async_calculator(debounce=0.05, max_latency=0.1)
+    observer = AsyncAutoSaveObserver(calculator)
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline and observer.save_count == 0:
+        observer.update(calculation_mock)
+        time.sleep(0.01)
+    assert observer.save_count >= 1
+    observer.close()
+
+def test_async_autosave_off():
+    """Tests that updates are ignored while auto-save is disabled"""
+    calculator = make_async_calculator()
+    calculator.config.auto_save = False
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    observer.close()
+    calculator.save_history.assert_not_called()
+
+def test_async_autosave_reports_failure():
+    """Tests that a failed background save is reported to the caller once"""
+    calculator = make_async_calculator(debounce=10)
+    calculator.save_history.side_effect = OSError("disk full")
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    with pytest.raises(OperationError, match="Auto-save failed: disk full"):
+        observer.flush()
+    observer.flush()
+    calculator.save_history.side_effect = OSError("disk full")
+    observer.update(calculation_mock)
+    with pytest.raises(OperationError, match="Auto-save failed"):
+        observer.close()
+    assert not observer._worker.is_alive()
+
+def test_async_autosave_schedules_before_reporting():
+    """Tests that a change arriving after a failed save is still saved"""
+    calculator = make_async_calculator(debounce=0.01)
+    calculator.save_history.side_effect = [OSError("disk full"), None]
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    assert wait_for(lambda: observer.error is not None)
+    with pytest.raises(OperationError, match="Auto-save failed: disk full"):
+        observer.update(calculation_mock)
+    observer.flush()
+    assert observer.save_count == 1
+    observer.close()
+    assert calculator.save_history.call_count == 2
+
+def test_async_autosave_journal_mode():
+    """Tests that journal mode journals pending changes in order, merging consecutive Calculations"""
+    calculator = make_async_calculator(debounce=10, mode='journal')
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    observer.update_batch([calculation_mock, calculation_mock])
+    memento = CalculatorMemento(appended=[calculation_mock])
+    observer.update_event('undo', memento)
+    observer.update(calculation_mock)
+    observer.flush()
+    assert [c.args for c in calculator.journal.method_calls] == [
+        ([calculation_mock] * 3,), ('undo', memento), ([calculation_mock],)]
+    calculator.save_history.assert_not_called()
+    observer.close()
+
+def test_async_autosave_journal_resync():
+    """Tests that a failed journal write is repaired by a full save"""
+    calculator = make_async_calculator(debounce=10, mode='journal')
+    calculator.journal.append.side_effect = OSError("disk full")
+    observer = AsyncAutoSaveObserver(calculator)
+    observer.update(calculation_mock)
+    with patch('app.history.log.error') as mock_error, \
+        pytest.raises(OperationError, match="Auto-save failed: disk full"):
+        observer.flush()
+    mock_error.assert_called_once_with("Background Auto-save Failed: disk full")
+    observer.update(calculation_mock)
+    observer.flush()
+    calculator.save_history.assert_called_once()
+    assert calculator.journal.append.call_count == 1
+    observer.close()
+
+def test_async_autosave_empty_calls():
+    """Tests AsyncAutoSaveObserver error handling of empty updates"""
+    observer = AsyncAutoSaveObserver(make_async_calculator())
+    with pytest.raises(AttributeError):
+        observer.update(None)
+    with pytest.raises(AttributeError):
+        observer.update_batch([])
+    observer.close()
+
+def test_observer_default_close():
+    """Tests that observers need no shutdown by default"""
+    assert LoggingObserver().close() is None
@@ -0,0 +1,65 @@
+"""This module provides the test suite for the HistoryJournal class"""
+import pytest
+
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.calculation import Calculation
+from app.calculation_history import CalculationHistory
+from app.calculator_memento import CalculatorMemento
+from app.history_journal import HistoryJournal
+
+def make_calc(x: int) -> Calculation:
+    return Calculation(operation="add", operandx=Decimal(x), operandy=Decimal(0), result=Decimal(x))
+
+@pytest.fixture
+def journal():
+    with TemporaryDirectory() as temp_dir:
+        yield HistoryJournal(Path(temp_dir) / "history/test.journal")
+
+def test_replay_appends(journal):
+    """Tests that appends replay in order and respect the size bound"""
+    journal.append([make_calc(1), make_calc(2)])
+    journal.append([make_calc(3)])
+    history = CalculationHistory([make_calc(0)])
+    journal.replay(history, max_size=3)
+    assert history == [make_calc(1), make_calc(2), make_calc(3)]
+    assert journal.record_count == 2
+
+def test_replay_markers(journal):
+    """Tests that undo, redo and clear markers replay their deltas"""
+    memento = CalculatorMemento(appended=[make_calc(2)], evicted=[make_calc(0)])
+    journal.append([make_calc(2)])
+    journal.record('undo', memento)
+    journal.record('redo', memento)
+    history = CalculationHistory([make_calc(0), make_calc(1)])
+    journal.replay(history, max_size=2)
+    assert history == [make_calc(1), make_calc(2)]
+    journal.record('clear')
+    journal.replay(history, max_size=2)
+    assert history == []
+
+def test_replay_skips_bad_records(journal, caplog):
+    """Tests that a truncated or unknown record is skipped with a warning"""
+    journal.append([make_calc(1)])
+    with open(journal.path, 'a') as f:
+        f.write('{"event": "mystery"}\n{"event": "app')
+    history = CalculationHistory()
+    journal.replay(history, max_size=10)
+    assert history == [make_calc(1)]
+    assert "Skipped unreadable journal record 2" in caplog.text
+    assert "Skipped unreadable journal record 3" in caplog.text
+
+def test_replay_missing_file(journal):
+    """Tests replay without a journal file"""
+    history = CalculationHistory([make_calc(1)])
+    journal.replay(history, max_size=10)
+    assert history == [make_calc(1)]
+
+def test_reset(journal):
+    """Tests that reset discards the journal"""
+    journal.append([make_calc(1)])
+    journal.reset()
+    assert not journal.path.exists()
+    assert journal.record_count == 0
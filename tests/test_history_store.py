@@ -0,0 +1,221 @@
+"""This module provides the test suite for the history storage backends"""
+import sqlite3
+import pytest
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from app.calculation import Calculation
+from app.exceptions import SerializationError
+from app.history_store import (
+    HISTORY_STORES, ColumnarHistoryStore, CsvHistoryStore, RecordLogHistoryStore,
+    SQLiteHistoryStore, create_history_store)
+from app.record_log import RecordLog
+
+def make_calc(x: int, operation: str = "Addition") -> Calculation:
+    return Calculation(operation, Decimal(x), Decimal("0.5"), Decimal(x) + Decimal("0.5"),
+                       timestamp=datetime(2025, 1, 1, 0, 0, x % 60, x))
+
+@pytest.fixture
+def temp_path():
+    with TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+@pytest.fixture
+def sqlite_store(temp_path):
+    store = SQLiteHistoryStore(temp_path / "history.db")
+    yield store
+    store.close()
+
+def row_ids(store):
+    with sqlite3.connect(store.path) as db:
+        return [row[0] for row in db.execute("SELECT id FROM calculations ORDER BY id")]
+
+@pytest.mark.parametrize(
+        "history_format",
+        ['csv', 'columnar', 'records', 'sqlite'],
+        ids=['csv', 'columnar', 'records', 'sqlite'],
+)
+def test_store_round_trip(temp_path, history_format):
+    """Tests that every store saves and loads the newest records exactly"""
+    store = create_history_store(history_format, temp_path / "history")
+    assert not store.exists()
+    calcs = [make_calc(i) for i in range(5)]
+    calcs.append(Calculation("Addition", Decimal("0.1000000000000000000001"), Decimal("1E+3"),
+                             Decimal("1000.1000000000000000000001")))
+    calcs.append(Calculation("Addition", 0.1, 0.2, 0.1 + 0.2, backend='float'))
+    store.write(calcs)
+    assert store.exists()
+    loaded = store.load(3)
+    assert loaded == calcs[-3:]
+    assert loaded[0].operandy.as_tuple() == calcs[-3].operandy.as_tuple()
+    assert isinstance(loaded[-1].result, float)
+    assert store.load(0) == []
+    store.write([])
+    assert store.load(3) == []
+    store.close()
+
+@pytest.mark.parametrize(
+        "store_class",
+        [ColumnarHistoryStore, RecordLogHistoryStore, SQLiteHistoryStore],
+        ids=['columnar', 'records', 'sqlite'],
+)
+def test_random_access_store(temp_path, store_class):
+    """Tests range reads and record counts"""
+    store = store_class(temp_path / "history")
+    if store_class is not SQLiteHistoryStore:
+        assert len(store) == 0
+    store.write([make_calc(i) for i in range(6)])
+    assert len(store) == 6
+    assert store.read(2, 4) == [make_calc(2), make_calc(3)]
+    assert store.read(-2) == [make_calc(4), make_calc(5)]
+    assert store.read(4, 2) == []
+    with patch('app.calculation.Calculation.validate_many') as mock_validate:
+        store.load(2, verify=False)
+        mock_validate.assert_not_called()
+        store.load(2)
+        mock_validate.assert_called_once()
+    store.close()
+
+def test_create_unknown_store(temp_path):
+    """Tests error handling for unregistered history formats"""
+    assert set(HISTORY_STORES) == {'csv', 'columnar', 'records', 'sqlite'}
+    with pytest.raises(SerializationError, match="Unknown history format: xml"):
+        create_history_store('xml', temp_path / "history")
+
+def test_csv_store_trusted_load(temp_path):
+    """Tests that only the CSV store offers trusted loading, and so keeps a digest"""
+    for store_class in HISTORY_STORES.values():
+        assert store_class.digest is store_class.trusted_load is (store_class is CsvHistoryStore)
+
+def test_record_log_incremental_write(temp_path):
+    """Tests that writes append new records and keep the evicted ones as an archive"""
+    store = RecordLogHistoryStore(temp_path / "history.rlog")
+    calcs = [make_calc(i) for i in range(5)]
+    store.write(calcs[:3])
+
+    # Append with eviction, then its undo
+    with patch.object(store.log, 'write') as mock_write:
+        store.write(calcs[1:4])
+        assert store.read() == calcs[:4]
+        store.write(calcs[:3])
+        assert store.read() == calcs[:3]
+        mock_write.assert_not_called()
+
+    # A load remembers the records read, so the next write appends to them
+    store = RecordLogHistoryStore(temp_path / "history.rlog")
+    loaded = store.load(2)
+    store.write(loaded[1:] + [calcs[4]])
+    assert store.read() == calcs[:3] + [calcs[4]]
+
+    # Restoring records other than the ones before the kept run replaces the log
+    store.write([calcs[0]] + loaded[1:])
+    assert store.read() == [calcs[0], calcs[2]]
+
+    # A history with nothing in common, such as after a clear, replaces the log
+    store.write([])
+    assert len(store) == 0
+
+def test_record_log_external_write(temp_path):
+    """Tests that a log changed by another writer is replaced on the next write"""
+    store = RecordLogHistoryStore(temp_path / "history.rlog")
+    calcs = [make_calc(i) for i in range(3)]
+    store.write(calcs[:2])
+    RecordLog(store.path).append([make_calc(9)])
+    store.write(calcs)
+    assert store.read() == calcs
+
+def test_sqlite_schema(sqlite_store):
+    """Tests that the database runs in WAL mode with operation and timestamp indexes"""
+    sqlite_store.write([make_calc(1)])
+    with sqlite3.connect(sqlite_store.path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        indexes = {row[1] for row in db.execute("PRAGMA index_list(calculations)")}
+        plan = db.execute("EXPLAIN QUERY PLAN SELECT * FROM calculations WHERE operation = 'Addition'")
+        assert 'calculations_operation' in ' '.join(str(row) for row in plan)
+    assert indexes == {'calculations_operation', 'calculations_timestamp'}
+
+def test_sqlite_incremental_write(sqlite_store):
+    """Tests that writes keep the rows of unchanged records"""
+    calcs = [make_calc(i) for i in range(4)]
+    sqlite_store.write(calcs[:3])
+    assert row_ids(sqlite_store) == [1, 2, 3]
+
+    # Append with eviction, then its undo
+    with patch.object(sqlite_store, '_row', wraps=sqlite_store._row) as mock_row:
+        sqlite_store.write(calcs[1:])
+        assert mock_row.call_count == 1
+    assert row_ids(sqlite_store) == [2, 3, 4]
+    sqlite_store.write(calcs[:3])
+    assert row_ids(sqlite_store) == [1, 2, 3]
+    assert sqlite_store.read() == calcs[:3]
+
+    # A history with nothing in common, such as after a clear, replaces every row
+    sqlite_store.write(calcs[3:])
+    assert row_ids(sqlite_store) == [1]
+    sqlite_store.write([])
+    assert len(sqlite_store) == 0
+
+def test_sqlite_load_keeps_rows(sqlite_store, temp_path):
+    """Tests that a write after a load changes only the new records"""
+    sqlite_store.write([make_calc(i) for i in range(5)])
+    sqlite_store.close()
+    store = SQLiteHistoryStore(temp_path / "history.db")
+    loaded = store.load(3)
+    store.write(loaded + [make_calc(5)])
+    assert row_ids(store) == [3, 4, 5, 6]
+    store.close()
+
+def test_sqlite_external_commit(sqlite_store):
+    """Tests that a commit by another connection makes the next write replace every row"""
+    calcs = [make_calc(i) for i in range(3)]
+    sqlite_store.write(calcs)
+    with sqlite3.connect(sqlite_store.path) as db:
+        db.execute("DELETE FROM calculations WHERE id = 2")
+    sqlite_store.write(calcs + [make_calc(3)])
+    assert sqlite_store.read() == calcs + [make_calc(3)]
+    assert row_ids(sqlite_store) == [1, 2, 3, 4]
+
+def test_sqlite_failed_write(sqlite_store):
+    """Tests that a failed write is rolled back and followed by a full rewrite"""
+    calcs = [make_calc(i) for i in range(3)]
+    sqlite_store.write(calcs)
+    with patch.object(SQLiteHistoryStore, '_row', side_effect=ValueError("bad row")):
+        with pytest.raises(ValueError, match="bad row"):
+            sqlite_store.write(calcs + [make_calc(3)])
+    assert sqlite_store.read() == calcs
+    sqlite_store.write(calcs)
+    assert sqlite_store.read() == calcs
+
+def test_sqlite_concurrent_reader(sqlite_store):
+    """Tests that a reader's open transaction neither blocks nor sees a later write"""
+    sqlite_store.write([make_calc(0)])
+    reader = sqlite3.connect(sqlite_store.path, isolation_level=None)
+    reader.execute("BEGIN")
+    assert reader.execute("SELECT count(*) FROM calculations").fetchone()[0] == 1
+    sqlite_store.write([make_calc(0), make_calc(1)])
+    assert reader.execute("SELECT count(*) FROM calculations").fetchone()[0] == 1
+    reader.execute("COMMIT")
+    assert reader.execute("SELECT count(*) FROM calculations").fetchone()[0] == 2
+    reader.close()
+
+def test_sqlite_find(sqlite_store):
+    """Tests queries by operation, time range and limit"""
+    calcs = [make_calc(i, "Addition" if i % 2 else "Subtraction") for i in range(10)]
+    sqlite_store.write(calcs)
+    assert sqlite_store.find() == calcs
+    assert sqlite_store.find(operation="Addition") == calcs[1::2]
+    assert sqlite_store.find(since=calcs[3].timestamp, until=calcs[6].timestamp) == calcs[3:6]
+    assert sqlite_store.find(operation="Subtraction", limit=2) == [calcs[6], calcs[8]]
+    assert sqlite_store.find(operation="Power") == []
+
+def test_sqlite_invalid_row(sqlite_store):
+    """Tests error handling for rows with invalid values"""
+    sqlite_store.write([make_calc(1)])
+    with sqlite3.connect(sqlite_store.path) as db:
+        db.execute("UPDATE calculations SET result = 'abc'")
+    with pytest.raises(SerializationError):
+        sqlite_store.load(1)
@@ -0,0 +1,63 @@
+"""This module provides the test suite for deferred imports in app.lazy_import"""
+import sys
+import threading
+import pytest
+
+from unittest.mock import patch
+
+from app.lazy_import import lazy_import
+
+def test_module_loads_on_first_use():
+    with patch.dict(sys.modules):
+        sys.modules.pop('colorsys', None)
+        module = lazy_import('colorsys')
+        assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert lazy_import('colorsys') is sys.modules['colorsys']
+        assert 'rgb_to_hsv' in dir(module)
+
+def test_module_is_not_executed_until_used():
+    with patch.dict(sys.modules):
+        sys.modules.pop('colorsys', None)
+        module = lazy_import('colorsys')
+        assert 'colorsys' not in sys.modules
+        assert callable(module.rgb_to_hsv)
+        assert 'colorsys' in sys.modules
+
+def test_attribute_writes_reach_module():
+    with patch.dict(sys.modules):
+        sys.modules.pop('colorsys', None)
+        module = lazy_import('colorsys')
+        with patch.object(module, 'ONE_THIRD', 0.5):
+            assert sys.modules['colorsys'].ONE_THIRD == 0.5
+        assert sys.modules['colorsys'].ONE_THIRD == 1.0 / 3.0
+        module.EXTRA = 1
+        del module.EXTRA
+        assert not hasattr(sys.modules['colorsys'], 'EXTRA')
+
+def test_concurrent_first_use(tmp_path, monkeypatch):
+    """Tests that threads using a module at once all wait for it to finish importing"""
+    (tmp_path / "slow_lazy_module.py").write_text("import time\ntime.sleep(0.05)\nVALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    with patch.dict(sys.modules):
+        module = lazy_import('slow_lazy_module')
+        barrier = threading.Barrier(8)
+        results = []
+
+        def use():
+            barrier.wait()
+            try:
+                results.append(module.VALUE)
+            except AttributeError as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+    assert results == [1] * 8
+
+def test_imported_module_is_shared():
+    assert lazy_import('decimal') is sys.modules['decimal']
+
+def test_missing_module():
+    with pytest.raises(ModuleNotFoundError, match="No module named 'missing_lazy_module'"):
+        lazy_import('missing_lazy_module')
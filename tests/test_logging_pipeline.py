@@ -0,0 +1,161 @@
+"""This module provides the test suite for the logging pipeline in app.logging_pipeline"""
+import io
+import logging as log
+import pytest
+import time
+
+from logging.handlers import QueueHandler, RotatingFileHandler, TimedRotatingFileHandler
+from unittest.mock import Mock, patch
+
+from app.logging_pipeline import LoggingPipeline, build_file_handler
+
+@pytest.fixture
+def restore_root_logger():
+    """Detaches the root handlers for the test, so that pipelines cannot close them, and restores them after"""
+    root = log.getLogger()
+    handlers, level = root.handlers[:], root.level
+    [root.removeHandler(handler) for handler in handlers]
+    yield root
+    if LoggingPipeline._active is not None:
+        LoggingPipeline._active.stop()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    [root.addHandler(handler) for handler in handlers]
+    root.setLevel(level)
+
+@pytest.mark.parametrize(
+        "rotation, handler_type",
+        [
+            ('none', log.FileHandler),
+            ('size', RotatingFileHandler),
+            ('time', TimedRotatingFileHandler),
+        ],
+        ids=[
+            "no_rotation",
+            "size_rotation",
+            "time_rotation",
+])
+def test_build_file_handler(tmp_path, rotation, handler_type):
+    handler = build_file_handler(tmp_path / "calculator.log", rotation=rotation, max_bytes=64, backup_count=2)
+    assert type(handler) is handler_type
+    handler.close()
+
+def test_size_rotation_rolls_over(tmp_path):
+    handler = build_file_handler(tmp_path / "calculator.log", rotation='size', max_bytes=64, backup_count=2)
+    logger = log.getLogger("test_size_rotation")
+    logger.propagate = False
+    logger.addHandler(handler)
+    [logger.warning("rotating record %d", i) for i in range(10)]
+    logger.removeHandler(handler)
+    handler.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "calculator.log", "calculator.log.1", "calculator.log.2"]
+
+def test_pipeline_batches_writes(restore_root_logger):
+    target = Mock(spec=log.Handler)
+    target.level = log.NOTSET
+    pipeline = LoggingPipeline(target, batch_size=3, flush_interval=60)
+    pipeline.start()
+    assert isinstance(restore_root_logger.handlers[0], QueueHandler)
+    log.info("record %d", 1)
+    log.info("record %d", 2)
+    time.sleep(0.05)
+    target.handle.assert_not_called()
+    log.info("record %d", 3)
+    pipeline.stop()
+    assert [call.args[0].getMessage() for call in target.handle.call_args_list] == [
+        "record 1", "record 2", "record 3"]
+    assert restore_root_logger.handlers == [target]
+
+def test_pipeline_flushes_when_idle(restore_root_logger):
+    target = Mock(spec=log.Handler)
+    target.level = log.NOTSET
+    pipeline = LoggingPipeline(target, batch_size=100, flush_interval=0.01)
+    pipeline.start()
+    log.info("idle record")
+    deadline = time.monotonic() + 2
+    while not target.handle.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    target.handle.assert_called_once()
+    pipeline.stop()
+
+def test_pipeline_flushes_warnings(restore_root_logger):
+    target = Mock(spec=log.Handler)
+    target.level = log.NOTSET
+    pipeline = LoggingPipeline(target, batch_size=100, flush_interval=60)
+    pipeline.start()
+    log.info("buffered")
+    log.warning("urgent")
+    deadline = time.monotonic() + 2
+    while target.handle.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert target.handle.call_count == 2
+    pipeline.stop()
+
+def test_pipeline_replaces_active(restore_root_logger):
+    first = LoggingPipeline(Mock(spec=log.Handler), flush_interval=60)
+    second = LoggingPipeline(Mock(spec=log.Handler), flush_interval=60)
+    first.start()
+    second.start()
+    assert not first.running
+    assert LoggingPipeline._active is second
+    second.stop()
+    second.stop()
+    assert LoggingPipeline._active is None
+
+def test_pipeline_writes_batch_once(restore_root_logger):
+    stream = Mock(wraps=io.StringIO())
+    target = log.StreamHandler(stream)
+    target.setFormatter(log.Formatter('%(message)s'))
+    target.addFilter(lambda record: record.getMessage() != "filtered")
+    pipeline = LoggingPipeline(target, batch_size=4, flush_interval=60)
+    pipeline.start()
+    [log.info("record %d", i) for i in range(3)]
+    log.info("filtered")
+    pipeline.stop()
+    stream.write.assert_called_once_with("record 0\nrecord 1\nrecord 2\n")
+    stream.flush.assert_called_once()
+
+def test_pipeline_rotates_batches(tmp_path, restore_root_logger):
+    target = build_file_handler(tmp_path / "calculator.log", rotation='size', max_bytes=64, backup_count=2)
+    target.close()
+    pipeline = LoggingPipeline(target, batch_size=10, flush_interval=60)
+    pipeline.start()
+    [log.info("rotating record %d", i) for i in range(10)]
+    pipeline.stop()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "calculator.log", "calculator.log.1", "calculator.log.2"]
+    assert "rotating record 9" in (tmp_path / "calculator.log").read_text()
+
+def test_pipeline_timed_rotation(tmp_path, restore_root_logger):
+    target = build_file_handler(tmp_path / "calculator.log", rotation='time')
+    pipeline = LoggingPipeline(target, flush_interval=60)
+    pipeline.start()
+    log.info("first")
+    log.info("second")
+    with patch.object(target, 'shouldRollover', side_effect=[True, False]), \
+        patch.object(target, 'doRollover') as mock_rollover:
+        pipeline.stop()
+    mock_rollover.assert_called_once()
+    assert "second" in (tmp_path / "calculator.log").read_text()
+
+def test_pipeline_reopens_closed_stream(tmp_path, restore_root_logger):
+    target = build_file_handler(tmp_path / "calculator.log")
+    target.close()
+    pipeline = LoggingPipeline(target, flush_interval=60)
+    pipeline.start()
+    log.info("reopened")
+    pipeline.stop()
+    assert "reopened" in (tmp_path / "calculator.log").read_text()
+
+def test_pipeline_write_failure(restore_root_logger):
+    stream = Mock(spec=io.StringIO)
+    stream.write.side_effect = OSError("disk full")
+    target = log.StreamHandler(stream)
+    pipeline = LoggingPipeline(target, flush_interval=60)
+    pipeline.start()
+    log.info("lost")
+    with patch.object(target, 'handleError') as mock_handle_error:
+        pipeline.stop()
+    mock_handle_error.assert_called_once()
@@ -0,0 +1,190 @@
+"""This module provides the test suite for the QueuedObserver class"""
+import pytest
+import threading
+import time
+
+from unittest.mock import Mock, patch
+
+from app.calculation import Calculation
+from app.exceptions import OperationError
+from app.history import HistoryObserver
+from app.observer_bus import QueuedObserver
+
+class GatedObserver(HistoryObserver):
+    """Records notifications, holding each delivery until the gate opens"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.calls = []
+
+    def update(self, calc):
+        self.gate.wait()
+        self.calls.append(('update', calc))
+
+    def update_batch(self, calcs):
+        self.gate.wait()
+        self.calls.append(('update_batch', list(calcs)))
+
+    def update_event(self, event, memento):
+        self.gate.wait()
+        self.calls.append(('update_event', event))
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+@pytest.fixture
+def calcs():
+    return [Calculation('Addition', i, i, 2 * i) for i in range(5)]
+
+def test_queued_observer_delivers_in_order(calcs):
+    observer = GatedObserver()
+    observer.gate.set()
+    queued = QueuedObserver(observer)
+    queued.update(calcs[0])
+    queued.update_batch(calcs[1:3])
+    queued.update_event('undo', None)
+    queued.close()
+    assert observer.calls == [
+        ('update', calcs[0]),
+        ('update_batch', calcs[1:3]),
+        ('update_event', 'undo'),
+    ]
+    assert queued.delivered == 3
+    assert queued.lag == 0
+
+def test_queued_observer_returns_before_delivery(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer)
+    queued.update(calcs[0])
+    queued.update(calcs[1])
+    assert observer.calls == []
+    assert queued.lag == 2
+    observer.gate.set()
+    queued.close()
+    assert queued.lag == 0
+
+def test_queued_observer_block_policy(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer, max_size=1, policy='block')
+    queued.update(calcs[0])
+    assert wait_until(lambda: queued._busy)
+    queued.update(calcs[1])
+    producer = threading.Thread(target=queued.update, args=(calcs[2],))
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive()
+    observer.gate.set()
+    producer.join()
+    queued.close()
+    assert [calc for _, calc in observer.calls] == calcs[:3]
+    assert queued.dropped == 0
+
+def test_queued_observer_drop_oldest_policy(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer, max_size=1, policy='drop_oldest')
+    queued.update(calcs[0])
+    assert wait_until(lambda: queued._busy)
+    queued.update(calcs[1])
+    queued.update(calcs[2])
+    assert queued.dropped == 1
+    observer.gate.set()
+    queued.close()
+    assert [calc for _, calc in observer.calls] == [calcs[0], calcs[2]]
+
+def test_queued_observer_coalesce_policy(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer, max_size=1, policy='coalesce')
+    queued.update(calcs[0])
+    assert wait_until(lambda: queued._busy)
+    queued.update(calcs[1])
+    queued.update_batch(calcs[2:4])
+    assert queued.lag == 2
+    observer.gate.set()
+    queued.close()
+    assert observer.calls == [('update', calcs[0]), ('update_batch', calcs[1:4])]
+    assert queued.dropped == 0
+
+def test_queued_observer_never_coalesces_events(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer, max_size=1, policy='coalesce')
+    queued.update(calcs[0])
+    assert wait_until(lambda: queued._busy)
+    queued.update_event('clear', None)
+    producer = threading.Thread(target=queued.update, args=(calcs[1],))
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive()
+    observer.gate.set()
+    producer.join()
+    queued.close()
+    assert observer.calls == [
+        ('update', calcs[0]), ('update_event', 'clear'), ('update', calcs[1])]
+
+def test_queued_observer_reports_failure(calcs):
+    observer = Mock(spec=HistoryObserver)
+    observer.update.side_effect = [OperationError("disk full"), None, OperationError("disk full")]
+    queued = QueuedObserver(observer)
+    queued.update(calcs[0])
+    queued.drain()
+    with pytest.raises(OperationError, match="failed: disk full"):
+        queued.update(calcs[1])
+    queued.drain()
+    assert observer.update.call_args.args == (calcs[1],)
+    queued.update(calcs[2])
+    with pytest.raises(OperationError, match="failed: disk full"):
+        queued.close()
+    observer.close.assert_not_called()
+
+def test_queued_observer_logs_failure_once(calcs):
+    observer = Mock(spec=HistoryObserver)
+    observer.update.side_effect = OperationError("disk full")
+    queued = QueuedObserver(observer)
+    with patch('app.observer_bus.log.error') as mock_error:
+        queued.update(calcs[0])
+        queued.drain()
+    mock_error.assert_called_once_with("Queued observer HistoryObserver failed: disk full")
+    with pytest.raises(OperationError, match="failed: disk full"):
+        queued.stop()
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_queued_observer_worker_exit_releases_waiters(calcs):
+    observer = Mock(spec=HistoryObserver)
+    observer.update.side_effect = SystemExit
+    queued = QueuedObserver(observer, max_size=1)
+    queued.update(calcs[0])
+    queued.drain()
+    with pytest.raises(OperationError, match="is not running"):
+        queued.update(calcs[1])
+    queued.close()
+    observer.close.assert_called_once()
+
+def test_queued_observer_drop_oldest_keeps_events(calcs):
+    observer = GatedObserver()
+    queued = QueuedObserver(observer, max_size=2, policy='drop_oldest')
+    queued.update(calcs[0])
+    assert wait_until(lambda: queued._busy)
+    queued.update_event('clear', None)
+    queued.update(calcs[1])
+    queued.update(calcs[2])
+    assert queued.dropped == 1
+    observer.gate.set()
+    queued.close()
+    assert observer.calls == [
+        ('update', calcs[0]), ('update_event', 'clear'), ('update', calcs[2])]
+
+@pytest.mark.parametrize(
+        "max_size, policy, expected",
+        [
+            (0, 'block', "Queue size must be positive"),
+            (1, 'drop_newest', "Unknown queue policy: drop_newest"),
+        ],
+        ids=[
+            "zero_size",
+            "unknown_policy",
+])
+def test_queued_observer_invalid(max_size, policy, expected):
+    with pytest.raises(ValueError, match=expected):
+        QueuedObserver(Mock(spec=HistoryObserver), max_size, policy)
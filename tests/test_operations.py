@@ -1,7 +1,9 @@
 """This module defines the test suites for classes in the Operations module at app/Operations"""
 import pytest
 from decimal import Decimal
+from importlib import metadata
 from typing import Any, Dict, Type
+from unittest.mock import patch
 
 import app.exceptions as exc
 import app.operations as ops
@@ -17,6 +19,15 @@ class TestBaseOperation:
 
         assert str(TestOperation()) == "TestOperation"
 
+    def test_default_execute_float(self):
+        """Test that execute_float defaults to running execute on Decimal operands"""
+        class TestOperation(ops.Operation):
+            def execute(self, x: Decimal, y: Decimal) -> Decimal:
+                assert isinstance(x, Decimal)
+                return x.max(y)
+
+        assert TestOperation().execute_float(0.1, -2.0) == 0.1
+
 class BaseOperationTest:
     """Base class for tests on the Operation class family"""
     operation_class: Type[ops.Operation]
@@ -45,6 +56,23 @@ class BaseOperationTest:
             with pytest.raises(error, match=error_message):
                 operation.execute(x, y)
 
+    def test_valid_float_operations(self):
+        """Runs the valid test cases through the float backend's execute_float"""
+        operation = self.operation_class()
+        for name, case in self.valid_test_cases.items():
+            if not case.get("float", True):
+                continue
+            result = operation.execute_float(float(case["x"]), float(case["y"]))
+            assert isinstance(result, float), f"Failed case: {name}"
+            assert result == pytest.approx(float(case["expected"])), f"Failed case: {name}"
+
+    def test_invalid_float_operations(self):
+        """Runs the invalid test cases through the float backend's execute_float"""
+        operation = self.operation_class()
+        for name, case in self.invalid_test_cases.items():
+            with pytest.raises(case.get("error", exc.ValidationError), match=case.get("message", "")):
+                operation.execute_float(float(case["x"]), float(case["y"]))
+
 class TestAddition(BaseOperationTest):
     """Defines the test suite for the Addition Operation"""
     operation_class = ops.Addition
@@ -127,8 +155,17 @@ class TestPower(BaseOperationTest):
             "fractional_base": {"x": "0.5", "y": "2", "expected": "0.25"},
             "fractional_exponent": {"x": "4", "y": "0.5", "expected": "2"},
             "zero_base": {"x": "0", "y": "3", "expected": "0"},
+            "irrational_result": {"x": "2", "y": "0.5", "expected": "1.41421356237"},
+            "beyond_float_range": {"x": "10", "y": "400", "expected": "1E+400", "float": False},
+    }
+    invalid_test_cases = {
+            "negative_base_fractional_exponent": {
+                "x": "-8",
+                "y": "0.5",
+                "error": exc.ValidationError,
+                "message": "Fractional powers of negative numbers are not supported",
+            },
     }
-    invalid_test_cases = {}
 
 class TestRoot(BaseOperationTest):
     """Defines the test suite for the Root Operation"""
@@ -189,6 +226,52 @@ class TestOperationFactory:
         operation = ops.OperationFactory.create_operation("test_op")
         assert isinstance(operation, TestOperation)
 
+    def test_shared_instances(self):
+        """Tests that stateless Operations are shared across names, aliases and case"""
+        operation = ops.OperationFactory.create_operation('add')
+        assert ops.OperationFactory.create_operation('Addition') is operation
+        assert ops.OperationFactory.create_operation('ADD') is operation
+        assert ops.OperationFactory.canonical_name('Addition') == 'add'
+        assert ops.OperationFactory.get_executor('addition')(Decimal(2), Decimal(3)) == Decimal(5)
+
+    def test_register_with_aliases(self):
+        """Tests alias registration, stateful Operations, replacement and removal"""
+        class Counter(ops.Operation):
+            stateless = False
+
+            def __init__(self):
+                self.calls = 0
+
+            def execute(self, x: Decimal, y: Decimal) -> Decimal:
+                self.calls += 1
+                return Decimal(self.calls)
+
+        ops.OperationFactory.register_operation("Count", Counter, aliases=["tally"])
+        try:
+            first = ops.OperationFactory.create_operation("tally")
+            assert isinstance(first, Counter)
+            assert ops.OperationFactory.create_operation("count") is not first
+            executor = ops.OperationFactory.get_executor("COUNT")
+            assert executor(Decimal(0), Decimal(0)) == executor(Decimal(0), Decimal(0)) == Decimal(1)
+            ops.OperationFactory.register_operation("count", ops.Addition)
+            assert isinstance(ops.OperationFactory.create_operation("tally"), ops.Addition)
+        finally:
+            ops.OperationFactory.unregister_operation("tally")
+        for name in ("count", "tally"):
+            with pytest.raises(ValueError, match=f"Unknown operation: {name}"):
+                ops.OperationFactory.create_operation(name)
+
+    def test_name_of(self):
+        """Tests resolving an Operation instance to its registered name"""
+        assert ops.OperationFactory.name_of(ops.Addition()) == 'add'
+        assert ops.OperationFactory.name_of(ops.OperationFactory.create_operation('Root')) == 'root'
+
+        class Unregistered(ops.Addition):
+            pass
+
+        with pytest.raises(ValueError, match="Unregistered operation: Unregistered"):
+            ops.OperationFactory.name_of(Unregistered())
+
     def test_invalid_register(self):
         """Test invalid registration parameters"""
         class InvalidOperation:
@@ -197,4 +280,61 @@ class TestOperationFactory:
         with pytest.raises(TypeError, match="Registered class must inherit from Operation"):
             ops.OperationFactory.register_operation("invalid", InvalidOperation)
 
+class TestPluginDiscovery:
+    """Defines the test suite for entry point discovery in the OperationFactory"""
+
+    @pytest.fixture
+    def entry_points(self):
+        """Declares plugin entry points for the test, and restores the real scan afterwards"""
+        declared = [
+            metadata.EntryPoint('Plus', 'app.operations:Addition', ops.ENTRY_POINT_GROUP),
+            metadata.EntryPoint('broken', 'missing_plugin_package:Broken', ops.ENTRY_POINT_GROUP),
+            metadata.EntryPoint('not_an_op', 'decimal:Decimal', ops.ENTRY_POINT_GROUP),
+            metadata.EntryPoint('add', 'app.operations:Subtraction', ops.ENTRY_POINT_GROUP),
+        ]
+        with patch.object(metadata, 'entry_points', return_value=declared) as scan:
+            ops.OperationFactory.discover_operations(refresh=True)
+            yield scan
+        if 'plus' in ops.OperationFactory._classes:
+            ops.OperationFactory.unregister_operation('plus')
+        ops.OperationFactory._plugins = None
+
+    def test_discovery_does_not_import(self, entry_points):
+        """Tests that discovery lists plugins once, without loading them"""
+        with patch.object(metadata.EntryPoint, 'load') as load:
+            assert ops.OperationFactory.discover_operations() == ['add', 'broken', 'not_an_op', 'plus']
+            load.assert_not_called()
+        entry_points.assert_called_once_with(group=ops.ENTRY_POINT_GROUP)
+
+    def test_load_on_first_use(self, entry_points):
+        """Tests that a plugin is imported on first request and then resolved from the Factory"""
+        with patch.object(metadata.EntryPoint, 'load', autospec=True, side_effect=metadata.EntryPoint.load) as load:
+            operation = ops.OperationFactory.create_operation('PLUS')
+            assert isinstance(operation, ops.Addition)
+            assert ops.OperationFactory.create_operation('plus') is operation
+            assert ops.OperationFactory.get_executor('plus')(Decimal(1), Decimal(2)) == Decimal(3)
+            load.assert_called_once()
+        assert 'plus' not in ops.OperationFactory.discover_operations()
+
+    def test_registered_names_take_precedence(self, entry_points):
+        """Tests that a plugin cannot shadow an explicitly registered operation"""
+        assert isinstance(ops.OperationFactory.create_operation('add'), ops.Addition)
+        assert 'add' in ops.OperationFactory.discover_operations()
 
+    @pytest.mark.parametrize(
+            "name, error, message",
+            [
+                ("broken", ValueError, "Failed to load operation 'broken' from missing_plugin_package:Broken"),
+                ("not_an_op", TypeError, "Registered class must inherit from Operation"),
+                ("unknown", ValueError, "Unknown operation: unknown"),
+            ],
+            ids=[
+                "import_error",
+                "not_an_operation",
+                "undeclared",
+    ])
+    def test_invalid_plugins(self, entry_points, name: str, error: Type[Exception], message: str):
+        """Tests that failing plugins report errors on every request"""
+        for _ in range(2):
+            with pytest.raises(error, match=message):
+                ops.OperationFactory.create_operation(name)
@@ -0,0 +1,61 @@
+"""This module provides the test suite for the process pool executor in app.parallel_executor"""
+import pytest
+
+from decimal import Decimal
+
+from app.exceptions import ValidationError
+from app.parallel_executor import ParallelExecutor, execute_chunk
+
+@pytest.fixture(scope='module')
+def executor():
+    executor = ParallelExecutor(workers=2, chunk_size=3)
+    yield executor
+    executor.close()
+
+@pytest.mark.parametrize(
+        "operation, xs, ys, backend, expected",
+        [
+            ('add', [Decimal(3), Decimal(4)], [Decimal(1), Decimal(2)], 'decimal', [Decimal(4), Decimal(6)]),
+            ('root', [Decimal(3), Decimal(4)], [Decimal(2), Decimal(3)], 'decimal', [Decimal('1.732'), Decimal('1.587')]),
+            ('divide', [3.0, 4.0], [4.0, 8.0], 'float', [0.75, 0.5]),
+        ],
+        ids=[
+            "decimal",
+            "precision",
+            "float",
+])
+def test_execute_chunk(operation: str, xs: list, ys: list, backend: str, expected: list):
+    results = execute_chunk(operation, xs, ys, 3, backend)
+    assert [round(result, 3) if operation == 'root' else result for result in results] == expected
+
+def test_map_keeps_input_order(executor):
+    xs = [Decimal(i) for i in range(10)]
+    ys = [Decimal(2)] * 10
+    assert executor.map('power', xs, ys, 10) == [Decimal(i * i) for i in range(10)]
+    assert executor.map('multiply', [0.5, 1.5], [2.0, 2.0], 10, 'float') == [1.0, 3.0]
+
+def test_map_failure(executor):
+    xs = [Decimal(1)] * 8
+    ys = [Decimal(1)] * 7 + [Decimal(0)]
+    with pytest.raises(ValidationError, match="Divisor operand cannot be 0"):
+        executor.map('divide', xs, ys, 10)
+    assert executor.map('divide', [Decimal(1)], [Decimal(4)], 10) == [Decimal('0.25')]
+
+def test_close():
+    executor = ParallelExecutor(workers=1, chunk_size=1)
+    executor.close()
+    assert executor.map('add', [Decimal(1)], [Decimal(2)], 10) == [Decimal(3)]
+    executor.close()
+    executor.close()
+
+@pytest.mark.parametrize(
+        "workers, chunk_size, expected",
+        [
+            (0, 1, "Parallel worker count must be positive"),
+            (1, 0, "Parallel chunk size must be positive"),
+        ],
+        ids=["workers", "chunk_size"]
+)
+def test_invalid_executor(workers: int, chunk_size: int, expected: str):
+    with pytest.raises(ValueError, match=expected):
+        ParallelExecutor(workers, chunk_size)
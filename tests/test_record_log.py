@@ -0,0 +1,86 @@
+"""This module provides the test suite for the indexed RecordLog history format"""
+import pytest
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.calculation import Calculation
+from app.exceptions import SerializationError
+from app.record_log import RecordLog, decode_record, encode_record
+
+def make_calc(x: int) -> Calculation:
+    return Calculation("Addition", Decimal(x), Decimal("0.5"), Decimal(x) + Decimal("0.5"),
+                       timestamp=datetime(2025, 1, 1, 0, 0, x % 60, x))
+
+@pytest.fixture
+def record_log():
+    with TemporaryDirectory() as temp_dir:
+        yield RecordLog(Path(temp_dir) / "history.rlog")
+
+def test_record_round_trip():
+    """Tests that a record round-trips exactly"""
+    calc = Calculation("Root", Decimal("-8.000000000000000000001"), Decimal("3"),
+                       Decimal("-2"), precision=7)
+    decoded = decode_record(encode_record(calc))
+    assert decoded == calc
+    assert decoded.operandx.as_tuple() == calc.operandx.as_tuple()
+    assert (decoded.precision, decoded.timestamp) == (7, calc.timestamp)
+
+def test_float_record_round_trip():
+    """Tests that float backend records keep their backend and float values"""
+    calc = Calculation("Addition", 0.1, 0.2, 0.1 + 0.2, backend='float')
+    encoded = encode_record(calc)
+    decoded = decode_record(encoded)
+    assert decoded == calc
+    assert decoded.backend == 'float'
+    assert isinstance(decoded.result, float)
+    assert len(encode_record(make_calc(1))) < len(encode_record(
+        Calculation("Addition", 1.0, 0.5, 1.5, timestamp=make_calc(1).timestamp, backend='float')))
+    with pytest.raises(SerializationError, match="Invalid history log record"):
+        decode_record(encoded[:-1] + bytes([9]))
+
+def test_decode_truncated():
+    """Tests error handling for truncated records"""
+    with pytest.raises(SerializationError, match="Invalid history log record"):
+        decode_record(encode_record(make_calc(1))[:-3])
+
+def test_random_access(record_log):
+    """Tests entry, range, slice and tail reads"""
+    record_log.write(make_calc(i) for i in range(10))
+    assert len(record_log) == 10
+    assert record_log[0] == make_calc(0)
+    assert record_log[-1] == make_calc(9)
+    assert record_log[3:6] == [make_calc(i) for i in range(3, 6)]
+    assert record_log[::4] == [make_calc(0), make_calc(4), make_calc(8)]
+    assert record_log.read(8) == [make_calc(8), make_calc(9)]
+    assert record_log.read(5, 5) == []
+    assert record_log.tail(3) == [make_calc(i) for i in range(7, 10)]
+    assert record_log.tail(0) == []
+    with pytest.raises(IndexError):
+        record_log[10]
+    with pytest.raises(IndexError):
+        record_log[-11]
+
+def test_append(record_log):
+    """Tests that appends extend the log and its index"""
+    assert len(record_log) == 0
+    record_log.append([make_calc(0)])
+    record_log.append([make_calc(1), make_calc(2)])
+    assert record_log.read() == [make_calc(0), make_calc(1), make_calc(2)]
+    record_log.write([make_calc(5)])
+    assert record_log.read() == [make_calc(5)]
+
+def test_truncate(record_log):
+    """Tests that truncating keeps the first records and their index entries"""
+    record_log.write([make_calc(i) for i in range(4)])
+    record_log.truncate(5)
+    assert len(record_log) == 4
+    record_log.truncate(2)
+    assert record_log.read() == [make_calc(0), make_calc(1)]
+    record_log.append([make_calc(7)])
+    assert record_log.read() == [make_calc(0), make_calc(1), make_calc(7)]
+    record_log.truncate(0)
+    assert len(record_log) == 0
+    assert record_log.path.stat().st_size == 0
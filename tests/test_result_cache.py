@@ -0,0 +1,93 @@
+"""This module provides the test suite for the ResultCache class"""
+import pytest
+
+from decimal import Decimal
+
+from app.result_cache import ResultCache
+
+def key(x: int, y: int = 1):
+    return ResultCache.make_key('Addition', Decimal(x), Decimal(y), 10)
+
+def test_cache_hit_and_miss():
+    cache = ResultCache(4)
+    assert cache.get(key(1)) is None
+    cache.put(key(1), Decimal(2))
+    assert cache.get(key(1)) == Decimal(2)
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+
+def test_cache_keys_compare_by_value():
+    cache = ResultCache(4)
+    cache.put(ResultCache.make_key('Addition', Decimal('2.0'), Decimal('1'), 10), Decimal(3))
+    assert cache.get(ResultCache.make_key('Addition', Decimal('2'), Decimal('1.00'), 10)) == Decimal(3)
+    assert cache.get(ResultCache.make_key('Addition', Decimal('2'), Decimal('1'), 12)) is None
+    assert cache.get(ResultCache.make_key('Subtraction', Decimal('2'), Decimal('1'), 10)) is None
+
+def test_lru_eviction():
+    cache = ResultCache(2, 'lru')
+    cache.put(key(1), Decimal(1))
+    cache.put(key(2), Decimal(2))
+    cache.get(key(1))
+    cache.put(key(3), Decimal(3))
+    assert cache.get(key(2)) is None
+    assert cache.get(key(1)) == Decimal(1)
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+@pytest.mark.parametrize(
+        "policy",
+        ['lru', 'lfu'],
+        ids=['lru', 'lfu'],
+)
+def test_cache_overwrite(policy: str):
+    cache = ResultCache(2, policy)
+    cache.put(key(1), Decimal(1))
+    cache.put(key(1), Decimal(5))
+    assert cache.get(key(1)) == Decimal(5)
+    assert len(cache) == 1
+
+def test_lfu_eviction():
+    cache = ResultCache(2, 'lfu')
+    cache.put(key(1), Decimal(1))
+    cache.put(key(2), Decimal(2))
+    cache.get(key(1))
+    cache.get(key(1))
+    cache.get(key(2))
+    cache.put(key(3), Decimal(3))
+    assert cache.get(key(2)) is None
+    assert cache.get(key(1)) == Decimal(1)
+    cache.put(key(4), Decimal(4))
+    assert cache.get(key(3)) is None
+    assert cache.get(key(4)) == Decimal(4)
+
+def test_lfu_breaks_ties_by_recency():
+    cache = ResultCache(2, 'lfu')
+    cache.put(key(1), Decimal(1))
+    cache.put(key(2), Decimal(2))
+    cache.get(key(2))
+    cache.get(key(1))
+    cache.put(key(3), Decimal(3))
+    assert cache.get(key(2)) is None
+    assert cache.get(key(1)) == Decimal(1)
+
+def test_cache_clear():
+    cache = ResultCache(2, 'lfu')
+    cache.put(key(1), Decimal(1))
+    cache.get(key(1))
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0}
+    cache.put(key(2), Decimal(2))
+    assert cache.get(key(2)) == Decimal(2)
+
+@pytest.mark.parametrize(
+        "max_size, policy, expected",
+        [
+            (0, 'lru', "Cache size must be positive"),
+            (1, 'fifo', "Unknown cache policy: fifo"),
+        ],
+        ids=[
+            "zero_size",
+            "unknown_policy",
+])
+def test_cache_invalid(max_size: int, policy: str, expected: str):
+    with pytest.raises(ValueError, match=expected):
+        ResultCache(max_size, policy)
@@ -1,9 +1,10 @@
+import pickle
 import pytest
 from decimal import Decimal
 from typing import Any
 
 from app.calculator_config import CalculatorConfig
-from app.exceptions import ValidationError
+from app.exceptions import BatchValidationError, ValidationError
 from app.input_validators import InputValidator
 
 config = CalculatorConfig(max_input_value=Decimal('1000'))
@@ -68,3 +69,123 @@ def test_bad_inputs(value: Any, expected: str):
     with pytest.raises(ValidationError, match=expected):
         InputValidator.validate_number(value, config)
 
+@pytest.mark.parametrize(
+        "value, expected",
+        [
+            (100, 100.0),
+            (-100.001, -100.001),
+            ("  100.5  ", 100.5),
+            ("1e2", 100.0),
+        ],
+        ids=[
+            "int",
+            "float",
+            "whitespaced_string",
+            "exponent_string",
+])
+def test_valid_float_inputs(value: Any, expected: float):
+    """Tests valid input for the float backend"""
+    result = InputValidator.validate_float(value, config)
+    assert isinstance(result, float)
+    assert result == expected
+
+@pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("nonsense", "Invalid number format: nonsense"),
+            (None, "Invalid number format: None"),
+            ("nan", "Invalid number format: nan"),
+            ("-inf", "Invalid number format: -inf"),
+            ("1001", "Value exceeds allowed maximum: 1000"),
+            (True, "Invalid number format: True"),
+        ],
+        ids=[
+            "bad_string",
+            "NoneType_val",
+            "nan",
+            "infinity",
+            "overflow",
+            "bool",
+])
+def test_bad_float_inputs(value: Any, expected: str):
+    """Tests error handling for invalid inputs in validate_float"""
+    with pytest.raises(ValidationError, match=expected):
+        InputValidator.validate_float(value, config)
+
+@pytest.mark.parametrize(
+        "value, expected",
+        [
+            (Decimal('12.50'), Decimal('12.5')),
+            (-125, Decimal('-125')),
+            (1000, Decimal('1000')),
+            ("1.5E+2", Decimal('150')),
+        ],
+        ids=[
+            "decimal",
+            "int",
+            "int_at_limit",
+            "exponent_string",
+])
+def test_fast_path_inputs(value: Any, expected: Decimal):
+    """Tests Decimal, int and str inputs, which convert without a str() round trip"""
+    decimal = InputValidator.validate_number(value, config)
+    assert decimal == expected
+
+@pytest.mark.parametrize(
+        "value, expected",
+        [
+            (Decimal('NaN'), "Invalid number format: NaN"),
+            (Decimal('-Infinity'), "Value exceeds allowed maximum: 1000"),
+            (Decimal('1000.01'), "Value exceeds allowed maximum: 1000"),
+            (True, "Invalid number format: True"),
+        ],
+        ids=[
+            "decimal_nan",
+            "decimal_infinity",
+            "decimal_overflow",
+            "bool",
+])
+def test_bad_fast_path_inputs(value: Any, expected: str):
+    """Tests error handling for inputs on the fast paths of validate_number"""
+    with pytest.raises(ValidationError, match=expected):
+        InputValidator.validate_number(value, config)
+
+@pytest.mark.parametrize(
+        "backend, expected",
+        [
+            ('decimal', [Decimal('1'), Decimal('-2.5'), Decimal('3')]),
+            ('float', [1.0, -2.5, 3.0]),
+        ],
+        ids=["decimal", "float"]
+)
+def test_validate_many(backend: str, expected: list):
+    """Tests bulk validation of any iterable of inputs"""
+    values = InputValidator.validate_many(iter([1, " -2.5 ", Decimal(3)]), config, backend)
+    assert values == expected
+    assert [type(value) for value in values] == [type(value) for value in expected]
+
+def test_validate_many_reports_every_error():
+    """Tests that bulk validation reports every invalid input by index"""
+    values = ["1", "a", "2", "1001", None, "b", "c", "d", "e"]
+    with pytest.raises(BatchValidationError) as info:
+        InputValidator.validate_many(values, config)
+    assert info.value.errors == {
+        1: "Invalid number format: a",
+        3: "Value exceeds allowed maximum: 1000",
+        4: "Invalid number format: None",
+        5: "Invalid number format: b",
+        6: "Invalid number format: c",
+        7: "Invalid number format: d",
+        8: "Invalid number format: e",
+    }
+    assert str(info.value) == (
+        "7 invalid values: [1] Invalid number format: a; [3] Value exceeds allowed maximum: 1000; "
+        "[4] Invalid number format: None; [5] Invalid number format: b; [6] Invalid number format: c; "
+        "and 2 more")
+    assert isinstance(info.value, ValidationError)
+
+def test_batch_validation_error_pickles():
+    """Tests that batch errors survive pickling, such as between processes"""
+    error = pickle.loads(pickle.dumps(BatchValidationError({2: "Invalid number format: x"})))
+    assert error.errors == {2: "Invalid number format: x"}
+    assert str(error) == "1 invalid values: [2] Invalid number format: x"